@@ -1,5 +1,39 @@
 # Pattern Matching Algorithms
+import importlib
+
 from . import kmp_iterative
 from . import kmp_recursive
 from . import bm_iterative
+from . import trampoline
 from . import bm_recursive
+from . import bm_bytes
+from . import bitparallel
+from . import two_way
+from . import rabin_karp
+from . import aho_corasick
+from . import suffix_array
+from . import compact_tables
+from . import compiled
+from . import planner
+from .compiled import compile, cache_info, purge
+
+# Modul berat (multiprocessing, concurrent.futures, dataclasses) baru di-import
+# saat pertama kali diakses, agar `python main.py search` tetap cepat
+_LAZY_MODULES = ('instrumented', 'streaming', 'parallel', 'batch', 'approximate')
+_LAZY_ATTRIBUTES = {
+    'search_many': 'batch',
+    'search_matrix': 'batch',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_MODULES) + list(_LAZY_ATTRIBUTES))
@@ -0,0 +1,109 @@
+"""
+Aho-Corasick Algorithm - Multi-Pattern Search
+Generalisasi failure function KMP menjadi trie dengan failure link
+"""
+from collections import deque
+from typing import Dict, List, Tuple
+
+
+class AhoCorasick:
+    """Automaton Aho-Corasick untuk sekumpulan pattern"""
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(patterns)
+        self.goto: List[Dict[str, int]] = [{}]   # transisi trie per node
+        self.failure: List[int] = [0]            # failure link per node
+        self.output: List[List[int]] = [[]]      # id pattern yang berakhir di node
+
+        self._build_trie()
+        self._build_failure_links()
+
+    def _build_trie(self) -> None:
+        """Menyisipkan semua pattern ke dalam trie"""
+        for pattern_id, pattern in enumerate(self.patterns):
+            # Pattern kosong tidak pernah dilaporkan, konsisten dengan search()
+            if not pattern:
+                continue
+
+            node = 0
+            for c in pattern:
+                next_node = self.goto[node].get(c)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto[node][c] = next_node
+                    self.goto.append({})
+                    self.failure.append(0)
+                    self.output.append([])
+                node = next_node
+            self.output[node].append(pattern_id)
+
+    def _build_failure_links(self) -> None:
+        """
+        Menghitung failure link secara BFS.
+
+        Sama seperti compute_failure_function pada KMP: failure[v] adalah
+        node untuk suffix terpanjang dari string v yang juga prefix suatu pattern.
+        """
+        queue = deque(self.goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for c, child in self.goto[node].items():
+                queue.append(child)
+
+                # Mundur sampai menemukan transisi c atau sampai root
+                f = self.failure[node]
+                while f > 0 and c not in self.goto[f]:
+                    f = self.failure[f]
+
+                self.failure[child] = self.goto[f].get(c, 0)
+                # Gabungkan output dari failure link (dictionary suffix)
+                self.output[child] = self.output[child] + self.output[self.failure[child]]
+
+    def search(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Mencari semua pattern dalam satu kali scan text.
+
+        Args:
+            text: Teks utama untuk pencarian
+
+        Returns:
+            List (pattern_id, posisi awal), urut berdasarkan posisi akhir match
+        """
+        results = []
+        if not text:
+            return results
+
+        goto = self.goto
+        failure = self.failure
+        output = self.output
+        lengths = [len(p) for p in self.patterns]
+
+        node = 0
+        for i, c in enumerate(text):
+            # Mundur sampai menemukan transisi yang cocok atau kembali ke root
+            while node > 0 and c not in goto[node]:
+                node = failure[node]
+            node = goto[node].get(c, 0)
+
+            for pattern_id in output[node]:
+                results.append((pattern_id, i - lengths[pattern_id] + 1))
+
+        return results
+
+
+def search(text: str, patterns: List[str]) -> List[Tuple[int, int]]:
+    """
+    Mencari semua kemunculan sekumpulan pattern dalam text.
+
+    Args:
+        text: Teks utama untuk pencarian
+        patterns: List pola yang dicari
+
+    Returns:
+        List (pattern_id, posisi awal) untuk setiap kemunculan
+    """
+    if not text or not patterns:
+        return []
+
+    return AhoCorasick(patterns).search(text)
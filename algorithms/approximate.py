@@ -0,0 +1,266 @@
+"""
+Approximate Matching (k mismatches / k edits)
+Filter pigeonhole: jika pattern dibagi menjadi k + 1 potongan, setiap
+kemunculan dengan <= k kesalahan memuat minimal satu potongan secara persis.
+Potongan dicari dengan engine exact (compiled), lalu kandidat diverifikasi
+secara bit-parallel: XOR + popcount untuk Hamming, Myers bit-vector untuk
+Levenshtein.
+"""
+from typing import Dict, List, Tuple
+
+from .compiled import compile
+
+
+def split_pattern(pattern: str, pieces: int) -> List[Tuple[int, str]]:
+    """
+    Membagi pattern menjadi potongan yang panjangnya hampir sama.
+
+    Returns:
+        List (offset di pattern, potongan)
+    """
+    m = len(pattern)
+    bounds = [m * i // pieces for i in range(pieces + 1)]
+    return [(bounds[i], pattern[bounds[i]:bounds[i + 1]]) for i in range(pieces)]
+
+
+def _encode(text: str, wide: bool) -> Tuple[bytes, int]:
+    """
+    Encode dengan lebar tetap per karakter (1 byte ASCII, 4 byte selain itu);
+    surrogate tunggal di-encode apa adanya seperti pada engine exact.
+    """
+    if wide:
+        return text.encode('utf-32-le', 'surrogatepass'), 4
+    return text.encode('ascii'), 1
+
+
+def _hamming_verifier(text: str, pattern: str):
+    """
+    Membuat fungsi distance(s) = jumlah mismatch pattern vs text[s:s + m].
+
+    Window dan pattern di-XOR sebagai satu bilangan besar; setiap karakter
+    yang berbeda menghasilkan byte tak nol, yang bit-bitnya dilipat ke bit
+    terendah karakter itu lalu dihitung dengan popcount.
+    """
+    m = len(pattern)
+    wide = not (text.isascii() and pattern.isascii())
+    data, width = _encode(text, wide)
+    target = int.from_bytes(_encode(pattern, wide)[0], 'little')
+    ones = int.from_bytes((b'\x01' + bytes(width - 1)) * m, 'little')
+    folds = [shift for shift in (16, 8, 4, 2, 1) if shift < 8 * width]
+    span = m * width
+
+    def distance(s: int) -> int:
+        x = int.from_bytes(data[s * width:s * width + span], 'little') ^ target
+        for shift in folds:
+            x |= x >> shift
+        return bin(x & ones).count('1')
+
+    return distance
+
+
+def _peq(pattern: str) -> Dict[str, int]:
+    """Bitmask posisi setiap karakter di pattern (bit i = pattern[i])"""
+    peq = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+
+def myers_scan(text: str, pattern: str, k: int, start: int = 0,
+               end: int = None, peq: Dict[str, int] = None) -> List[Tuple[int, int]]:
+    """
+    Algoritma bit-vector Myers (1999) untuk edit distance semi-global.
+
+    Kolom DP seluruh pattern disimpan dalam dua bit-vector (Pv/Mv) sehingga
+    satu karakter text diproses dengan sejumlah operasi bit yang tetap.
+
+    Args:
+        text: Teks utama
+        pattern: Pola yang dicari (tidak kosong)
+        k: Edit distance maksimum
+        start, end: Rentang text yang dipindai (match harus di dalamnya)
+        peq: Hasil _peq(pattern) (opsional, agar dapat dipakai ulang)
+
+    Returns:
+        List (posisi akhir eksklusif, edit distance) dengan distance <= k
+    """
+    m = len(pattern)
+    if end is None:
+        end = len(text)
+    if peq is None:
+        peq = _peq(pattern)
+
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv = full
+    mv = 0
+    score = m
+    results = []
+
+    for j in range(start, end):
+        eq = peq.get(text[j], 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # Semi-global: baris 0 selalu bernilai 0, jadi tidak ada carry masuk
+        ph = (ph << 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+        if score <= k:
+            results.append((j + 1, score))
+
+    return results
+
+
+def search_hamming(text: str, pattern: str, k: int,
+                   algorithm: str = 'bm') -> List[Tuple[int, int]]:
+    """
+    Mencari semua posisi dengan paling banyak k mismatch (tanpa sisip/hapus).
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+        k: Jumlah mismatch maksimum
+        algorithm: Engine exact untuk potongan pigeonhole (compiled.ENGINES)
+
+    Returns:
+        List (indeks awal, jumlah mismatch), terurut berdasarkan indeks
+    """
+    if not pattern or not text or len(pattern) > len(text) or k < 0:
+        return []
+
+    n = len(text)
+    m = len(pattern)
+    distance = _hamming_verifier(text, pattern)
+
+    if k + 1 > m:
+        # Potongan kosong tidak menyaring apa pun: semua window adalah kandidat
+        candidates = range(n - m + 1)
+    else:
+        candidates = set()
+        for offset, piece in split_pattern(pattern, k + 1):
+            for pos in compile(piece, algorithm).search(text):
+                s = pos - offset
+                if 0 <= s <= n - m:
+                    candidates.add(s)
+        candidates = sorted(candidates)
+
+    results = []
+    for s in candidates:
+        d = distance(s)
+        if d <= k:
+            results.append((s, d))
+    return results
+
+
+def search_levenshtein(text: str, pattern: str, k: int,
+                       algorithm: str = 'bm') -> List[Tuple[int, int]]:
+    """
+    Mencari semua substring dengan edit distance paling banyak k.
+
+    Setiap potongan yang ditemukan di posisi p (offset o di pattern) membuka
+    window text [p - o - k, p - o + m + k); window yang bertumpuk digabung
+    lalu dipindai dengan Myers.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+        k: Edit distance maksimum
+        algorithm: Engine exact untuk potongan pigeonhole (compiled.ENGINES)
+
+    Returns:
+        List (posisi akhir eksklusif, edit distance minimum), terurut
+    """
+    if not pattern or not text or k < 0:
+        return []
+
+    n = len(text)
+    m = len(pattern)
+    peq = _peq(pattern)
+
+    if k + 1 > m:
+        return myers_scan(text, pattern, k, 0, n, peq)
+
+    windows = []
+    for offset, piece in split_pattern(pattern, k + 1):
+        for pos in compile(piece, algorithm).search(text):
+            s = pos - offset
+            windows.append((max(0, s - k), min(n, s + m + k)))
+    windows.sort()
+
+    results = []
+    current_start = current_end = None
+    for w_start, w_end in windows:
+        if current_end is not None and w_start <= current_end:
+            current_end = max(current_end, w_end)
+            continue
+        if current_end is not None:
+            results.extend(myers_scan(text, pattern, k, current_start, current_end, peq))
+        current_start, current_end = w_start, w_end
+    if current_end is not None:
+        results.extend(myers_scan(text, pattern, k, current_start, current_end, peq))
+
+    return results
+
+
+def search(text: str, pattern: str, k: int, mode: str = 'hamming',
+           algorithm: str = 'bm') -> List[Tuple[int, int]]:
+    """
+    Approximate matching dengan mode 'hamming' atau 'levenshtein'.
+
+    Returns:
+        Hamming: list (indeks awal, distance);
+        Levenshtein: list (posisi akhir eksklusif, distance)
+    """
+    if mode == 'hamming':
+        return search_hamming(text, pattern, k, algorithm)
+    if mode == 'levenshtein':
+        return search_levenshtein(text, pattern, k, algorithm)
+    raise ValueError(f"Mode tidak dikenal: {mode!r} (pilihan: hamming, levenshtein)")
+
+
+def naive_hamming(text: str, pattern: str, k: int) -> List[Tuple[int, int]]:
+    """Baseline brute force: hitung mismatch di setiap window"""
+    if not pattern or not text or len(pattern) > len(text) or k < 0:
+        return []
+
+    m = len(pattern)
+    results = []
+    for s in range(len(text) - m + 1):
+        d = 0
+        for i in range(m):
+            if text[s + i] != pattern[i]:
+                d += 1
+                if d > k:
+                    break
+        if d <= k:
+            results.append((s, d))
+    return results
+
+
+def naive_levenshtein(text: str, pattern: str, k: int) -> List[Tuple[int, int]]:
+    """Baseline brute force: DP Sellers O(nm), satu kolom per karakter text"""
+    if not pattern or not text or k < 0:
+        return []
+
+    m = len(pattern)
+    column = list(range(m + 1))
+    results = []
+
+    for j, c in enumerate(text):
+        prev_diag = column[0]  # baris 0 selalu 0 (match boleh mulai di mana saja)
+        for i in range(1, m + 1):
+            cost = 0 if pattern[i - 1] == c else 1
+            value = min(column[i] + 1, column[i - 1] + 1, prev_diag + cost)
+            prev_diag = column[i]
+            column[i] = value
+        if column[m] <= k:
+            results.append((j + 1, column[m]))
+
+    return results
@@ -0,0 +1,162 @@
+"""
+Batch Search
+Mencari satu atau beberapa pattern di banyak record pendek sekaligus.
+Setiap pattern dikompilasi sekali; record digabung per batch dengan separator
+yang tidak ada di pattern sehingga engine cukup dipanggil sekali per batch.
+Dengan prefilter, record tanpa pattern disaring dulu oleh operator `in`
+(berjalan di C) dan engine hanya menghitung offset pada record kandidat.
+"""
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Executor
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, List, Sequence, Tuple
+import os
+
+from .compiled import compile
+
+
+DEFAULT_BATCH_SIZE = 1024
+
+
+def _separator(patterns: Sequence[str]) -> str:
+    """
+    Karakter yang tidak muncul di pattern mana pun.
+
+    Match tidak mungkin melewati batas record karena pattern harus memuat
+    separator untuk itu.
+    """
+    used = set().union(*patterns)
+    code = 0
+    while chr(code) in used:
+        code += 1
+    return chr(code)
+
+
+def _batches(texts: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    """Memotong iterable record menjadi list berukuran batch_size"""
+    iterator = iter(texts)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _search_batch(batch: List[str], patterns: Sequence[str], algorithm: str,
+                  separator: str, base_id: int,
+                  prefilter: bool) -> List[Tuple[int, int, List[int]]]:
+    """
+    Mencari semua pattern pada satu batch (juga dipakai sebagai task worker).
+
+    Returns:
+        List (record_id, pattern_id, offsets) untuk record yang memiliki match
+    """
+    if prefilter:
+        results = []
+        for pattern_id, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            matcher = compile(pattern, algorithm)
+            results.extend((base_id + index, pattern_id, matcher.search(text))
+                           for index, text in enumerate(batch) if pattern in text)
+        results.sort(key=lambda item: (item[0], item[1]))
+        return results
+
+    joined = separator.join(batch)
+    # starts[i] = offset awal record i di dalam joined
+    starts = [0]
+    starts.extend(accumulate(len(text) + 1 for text in batch[:-1]))
+
+    results = []
+    for pattern_id, pattern in enumerate(patterns):
+        grouped = {}
+        for pos in compile(pattern, algorithm).search(joined):
+            index = bisect_right(starts, pos) - 1
+            grouped.setdefault(index, []).append(pos - starts[index])
+        results.extend((base_id + index, pattern_id, offsets)
+                       for index, offsets in grouped.items())
+
+    results.sort(key=lambda item: (item[0], item[1]))
+    return results
+
+
+def _run(texts: Iterable[str], patterns: Sequence[str], algorithm: str,
+         batch_size: int, executor: Executor,
+         prefilter: bool) -> Iterator[Tuple[int, int, List[int]]]:
+    """Menjalankan batch secara berurutan atau di executor, hasil tetap terurut"""
+    # Validasi nama algoritma sebelum pekerjaan dikirim ke worker
+    for pattern in patterns:
+        compile(pattern, algorithm)
+
+    separator = _separator(patterns)
+
+    if executor is None:
+        base_id = 0
+        for batch in _batches(texts, batch_size):
+            yield from _search_batch(batch, patterns, algorithm, separator, base_id,
+                                     prefilter)
+            base_id += len(batch)
+        return
+
+    # Jumlah batch yang sedang diproses dibatasi agar stream besar tidak
+    # seluruhnya tertahan di memori
+    max_pending = 2 * (os.cpu_count() or 1)
+    pending = deque()
+    base_id = 0
+    for batch in _batches(texts, batch_size):
+        pending.append(executor.submit(_search_batch, batch, patterns,
+                                       algorithm, separator, base_id, prefilter))
+        base_id += len(batch)
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def search_many(texts: Iterable[str], pattern: str, algorithm: str = 'kmp',
+                batch_size: int = DEFAULT_BATCH_SIZE, executor: Executor = None,
+                prefilter: bool = True) -> List[Tuple[int, List[int]]]:
+    """
+    Mencari satu pattern di banyak record.
+
+    Args:
+        texts: Iterable record (boleh generator/stream)
+        pattern: Pola yang dicari
+        algorithm: Nama engine pada compiled.ENGINES
+        batch_size: Jumlah record yang digabung per pemanggilan engine
+        executor: Executor opsional untuk memproses batch secara paralel
+        prefilter: Saring record dengan operator `in` sebelum memanggil engine
+
+    Returns:
+        List (record_id, offsets) hanya untuk record yang memiliki match,
+        terurut berdasarkan record_id
+    """
+    if not pattern:
+        return []
+    return [(record_id, offsets) for record_id, _, offsets
+            in _run(texts, [pattern], algorithm, batch_size, executor, prefilter)]
+
+
+def search_matrix(texts: Iterable[str], patterns: Sequence[str], algorithm: str = 'kmp',
+                  batch_size: int = DEFAULT_BATCH_SIZE, executor: Executor = None,
+                  prefilter: bool = True) -> List[Tuple[int, int, List[int]]]:
+    """
+    Mencari beberapa pattern di banyak record; record hanya dibaca sekali.
+
+    Args:
+        texts: Iterable record (boleh generator/stream)
+        patterns: Daftar pattern
+        algorithm: Nama engine pada compiled.ENGINES
+        batch_size: Jumlah record yang digabung per pemanggilan engine
+        executor: Executor opsional untuk memproses batch secara paralel
+        prefilter: Saring record dengan operator `in` sebelum memanggil engine
+
+    Returns:
+        List (record_id, pattern_id, offsets) untuk pasangan yang memiliki match,
+        terurut berdasarkan (record_id, pattern_id)
+    """
+    patterns = list(patterns)
+    if not any(patterns):
+        return []
+    return list(_run(texts, patterns, algorithm, batch_size, executor, prefilter))
@@ -0,0 +1,164 @@
+"""
+Bit-Parallel Algorithms - Shift-Or dan BNDM
+Automaton pattern disimpan dalam satu word (Python int sebagai bitmask),
+dengan fallback ke Boyer-Moore untuk pattern lebih panjang dari WORD_SIZE
+"""
+from typing import Dict, List
+
+from . import bm_iterative
+
+
+# Panjang pattern maksimum yang masih muat dalam satu machine word
+WORD_SIZE = 64
+
+
+def compute_shift_or_masks(pattern: str) -> Dict[str, int]:
+    """
+    Menghitung mask Shift-Or: bit i bernilai 0 jika pattern[i] == c.
+
+    Karakter yang tidak ada di pattern memakai mask dengan semua bit 1,
+    yang diwakili oleh nilai default saat lookup.
+
+    Args:
+        pattern: Pola yang dicari
+
+    Returns:
+        Dictionary mapping karakter ke bitmask
+    """
+    m = len(pattern)
+    full = (1 << m) - 1
+    masks = {}
+
+    for i in range(m):
+        c = pattern[i]
+        masks[c] = masks.get(c, full) & ~(1 << i)
+
+    return masks
+
+
+def compute_bndm_masks(pattern: str) -> Dict[str, int]:
+    """
+    Menghitung mask BNDM: bit (m - 1 - i) bernilai 1 jika pattern[i] == c.
+
+    Args:
+        pattern: Pola yang dicari
+
+    Returns:
+        Dictionary mapping karakter ke bitmask (pattern dibaca terbalik)
+    """
+    m = len(pattern)
+    masks = {}
+
+    for i in range(m):
+        c = pattern[i]
+        masks[c] = masks.get(c, 0) | (1 << (m - 1 - i))
+
+    return masks
+
+
+def search_shift_or(text: str, pattern: str) -> List[int]:
+    """
+    Mencari semua kemunculan pattern menggunakan Shift-Or.
+
+    Satu pass kiri-ke-kanan tanpa backtracking, cocok untuk streaming.
+    Pattern lebih panjang dari WORD_SIZE dialihkan ke Boyer-Moore Galil.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not text:
+        return []
+    if len(pattern) > len(text):
+        return []
+
+    m = len(pattern)
+    if m > WORD_SIZE:
+        return bm_iterative.search_galil(text, pattern)
+
+    masks = compute_shift_or_masks(pattern)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    results = []
+
+    state = full  # bit i = 0 berarti pattern[0..i] cocok dengan akhir text
+    for i, c in enumerate(text):
+        state = ((state << 1) | masks.get(c, full)) & full
+        if not state & high:
+            results.append(i - m + 1)
+
+    return results
+
+
+def search_bndm(text: str, pattern: str) -> List[int]:
+    """
+    Mencari semua kemunculan pattern menggunakan BNDM
+    (Backward Nondeterministic DAWG Matching).
+
+    Window dibaca dari kanan ke kiri seperti Boyer-Moore sehingga rata-rata
+    sublinear. Pattern lebih panjang dari WORD_SIZE dialihkan ke Boyer-Moore Galil.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not text:
+        return []
+    if len(pattern) > len(text):
+        return []
+
+    n = len(text)
+    m = len(pattern)
+    if m > WORD_SIZE:
+        return bm_iterative.search_galil(text, pattern)
+
+    masks = compute_bndm_masks(pattern)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    results = []
+
+    pos = 0  # posisi awal window
+    while pos <= n - m:
+        j = m
+        last = m  # pergeseran: awal prefix pattern terakhir yang dikenali
+        state = full
+
+        while state:
+            state &= masks.get(text[pos + j - 1], 0)
+            j -= 1
+            if state & high:
+                if j > 0:
+                    last = j
+                else:
+                    results.append(pos)
+            state = (state << 1) & full
+
+        pos += last
+
+    return results
+
+
+def search(text: str, pattern: str) -> List[int]:
+    """
+    Wrapper function untuk interface konsisten (menggunakan BNDM).
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    return search_bndm(text, pattern)
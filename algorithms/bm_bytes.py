@@ -0,0 +1,131 @@
+"""
+Boyer-Moore Algorithm - Bytes Version
+Bad Character Rule dengan tabel array 256 entry untuk data biner,
+bekerja langsung pada bytes, bytearray, memoryview, dan mmap tanpa decode/copy
+"""
+from typing import List
+import mmap
+
+
+ALPHABET_SIZE = 256
+
+
+def _as_byte_buffer(data):
+    """
+    Menyiapkan buffer agar indeksnya menghasilkan int 0-255 tanpa menyalin data.
+
+    Args:
+        data: bytes, bytearray, memoryview, atau mmap.mmap
+
+    Returns:
+        Objek yang sama, atau memoryview hasil cast ke format 'B'
+    """
+    if isinstance(data, memoryview) and (data.format != 'B' or data.ndim != 1):
+        return data.cast('B')
+    return data
+
+
+def compute_bad_character_table(pattern: bytes) -> List[int]:
+    """
+    Menghitung bad character table sebagai list flat 256 entry.
+
+    Args:
+        pattern: Pola (bytes) untuk dihitung bad character table-nya
+
+    Returns:
+        List dengan table[b] = posisi terakhir byte b di pattern, atau -1
+    """
+    bad_char = [-1] * ALPHABET_SIZE
+    m = len(pattern)
+
+    for i in range(m):
+        bad_char[pattern[i]] = i
+
+    return bad_char
+
+
+def search(data, pattern) -> List[int]:
+    """
+    Mencari semua kemunculan pattern dalam data biner menggunakan Boyer-Moore.
+
+    Args:
+        data: bytes, bytearray, memoryview, atau mmap.mmap
+        pattern: Pola yang dicari (bytes-like)
+
+    Returns:
+        List offset byte di mana pattern ditemukan
+    """
+    # Panjang dibandingkan dalam byte, bukan jumlah item memoryview non-'B'.
+    # Pattern kecil, cukup disalin sekali agar indeksnya cepat
+    data = _as_byte_buffer(data)
+    pattern = bytes(pattern)
+
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not data:
+        return []
+    if len(pattern) > len(data):
+        return []
+
+    bad_char = compute_bad_character_table(pattern)
+
+    return search_with_table(data, pattern, bad_char)
+
+
+def search_with_table(data, pattern: bytes, bad_char: List[int]) -> List[int]:
+    """
+    Pencarian Boyer-Moore bytes dengan bad character table yang sudah dihitung.
+
+    Args:
+        data: bytes, bytearray, memoryview, atau mmap.mmap
+        pattern: Pola yang dicari (bytes, tidak kosong)
+        bad_char: Bad character table 256 entry
+
+    Returns:
+        List offset byte di mana pattern ditemukan
+    """
+    text = _as_byte_buffer(data)
+    n = len(text)
+    m = len(pattern)
+    results = []
+
+    s = 0  # shift - posisi pattern relatif terhadap data
+
+    while s <= n - m:
+        j = m - 1
+
+        # Cocokkan byte dari kanan ke kiri
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+
+        if j < 0:
+            results.append(s)
+            if s + m < n:
+                s += m - bad_char[text[s + m]]
+            else:
+                s += 1
+        else:
+            bad_char_shift = j - bad_char[text[s + j]]
+            s += max(1, bad_char_shift)
+
+    return results
+
+
+def search_file(path: str, pattern: bytes) -> List[int]:
+    """
+    Mencari pattern dalam file melalui mmap, tanpa membaca file ke memori Python.
+
+    Args:
+        path: Path file
+        pattern: Pola yang dicari (bytes)
+
+    Returns:
+        List offset byte di mana pattern ditemukan
+    """
+    with open(path, 'rb') as f:
+        # mmap tidak dapat memetakan file kosong
+        if f.seek(0, 2) == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return search(mm, pattern)
@@ -1,8 +1,9 @@
 """
 Boyer-Moore Algorithm - Iterative Version
-Menggunakan Bad Character Rule
+Menggunakan Bad Character Rule, serta varian lengkap dengan
+Good Suffix Rule dan Galil Rule (search_galil)
 """
-from typing import List, Dict
+from typing import Dict, Iterator, List
 
 
 def compute_bad_character_table(pattern: str) -> Dict[str, int]:
@@ -45,13 +46,28 @@ def search(text: str, pattern: str) -> List[int]:
     if len(pattern) > len(text):
         return []
     
+    # Hitung bad character table
+    bad_char = compute_bad_character_table(pattern)
+    
+    return search_with_table(text, pattern, bad_char)
+
+
+def search_with_table(text: str, pattern: str, bad_char: Dict[str, int]) -> List[int]:
+    """
+    Pencarian Boyer-Moore iteratif dengan bad character table yang sudah dihitung.
+    
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari (tidak kosong)
+        bad_char: Bad character table dari pattern
+        
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
     n = len(text)
     m = len(pattern)
     results = []
     
-    # Hitung bad character table
-    bad_char = compute_bad_character_table(pattern)
-    
     # Mulai dari posisi 0
     s = 0  # shift - posisi pattern relatif terhadap text
     
@@ -80,3 +96,181 @@ def search(text: str, pattern: str) -> List[int]:
             s += max(1, bad_char_shift)
     
     return results
+
+
+def compute_good_suffix_table(pattern: str) -> List[int]:
+    """
+    Menghitung good suffix table (strong good suffix rule) menggunakan loop.
+    
+    shift[j + 1] adalah pergeseran aman ketika mismatch terjadi di indeks j,
+    sedangkan shift[0] adalah periode pattern (pergeseran setelah match penuh).
+    
+    Args:
+        pattern: Pola untuk dihitung good suffix table-nya
+        
+    Returns:
+        List pergeseran dengan panjang m + 1
+    """
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border = [0] * (m + 1)
+    
+    # Tahap 1: suffix yang muncul lagi di dalam pattern
+    i = m
+    j = m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+    
+    # Tahap 2: hanya sebagian suffix yang cocok dengan prefix pattern
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+    
+    return shift
+
+
+def search_galil(text: str, pattern: str) -> List[int]:
+    """
+    Mencari semua kemunculan pattern menggunakan Boyer-Moore penuh
+    (bad character + good suffix rule) dengan Galil rule.
+    
+    Setelah match penuh pattern digeser sejauh periodenya, dan prefix yang
+    sudah pasti cocok tidak dibandingkan lagi, sehingga worst case tetap
+    linear O(n + m) walaupun kemunculan saling tumpang tindih.
+    
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+        
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not text:
+        return []
+    if len(pattern) > len(text):
+        return []
+    
+    # Hitung tabel bad character dan good suffix
+    bad_char = compute_bad_character_table(pattern)
+    good_suffix = compute_good_suffix_table(pattern)
+    
+    return search_galil_with_tables(text, pattern, bad_char, good_suffix)
+
+
+def search_galil_with_tables(text: str, pattern: str, bad_char: Dict[str, int],
+                             good_suffix: List[int]) -> List[int]:
+    """
+    Pencarian Boyer-Moore Galil dengan tabel yang sudah dihitung.
+    
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari (tidak kosong)
+        bad_char: Bad character table dari pattern
+        good_suffix: Good suffix table dari pattern
+        
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    n = len(text)
+    m = len(pattern)
+    results = []
+    period = good_suffix[0]
+    
+    s = 0  # shift - posisi pattern relatif terhadap text
+    lower = 0  # batas kiri perbandingan (Galil rule)
+    
+    while s <= n - m:
+        j = m - 1
+        
+        # Cocokkan dari kanan ke kiri, lewati prefix yang sudah pasti cocok
+        while j >= lower and pattern[j] == text[s + j]:
+            j -= 1
+        
+        if j < lower:
+            results.append(s)
+            # Geser sejauh periode; m - period karakter pertama sudah cocok
+            s += period
+            lower = m - period
+        else:
+            lower = 0
+            bad_char_shift = j - bad_char.get(text[s + j], -1)
+            s += max(good_suffix[j + 1], bad_char_shift)
+    
+    return results
+
+
+def finditer(text: str, pattern: str) -> Iterator[int]:
+    """
+    Versi generator dari search (bad character rule): menghasilkan indeks
+    match satu per satu tanpa membangun list hasil.
+    
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+        
+    Returns:
+        Iterator indeks awal di mana pattern ditemukan
+    """
+    # Handle edge cases
+    if not pattern:
+        return
+    if not text:
+        return
+    if len(pattern) > len(text):
+        return
+    
+    n = len(text)
+    m = len(pattern)
+    bad_char = compute_bad_character_table(pattern)
+    
+    s = 0  # shift - posisi pattern relatif terhadap text
+    
+    while s <= n - m:
+        j = m - 1
+        
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        
+        if j < 0:
+            yield s
+            if s + m < n:
+                s += m - bad_char.get(text[s + m], -1)
+            else:
+                s += 1
+        else:
+            bad_char_shift = j - bad_char.get(text[s + j], -1)
+            s += max(1, bad_char_shift)
+
+
+def find_first(text: str, pattern: str) -> int:
+    """
+    Mencari kemunculan pertama pattern dan berhenti saat itu juga.
+    
+    Returns:
+        Indeks awal match pertama, atau -1 jika tidak ditemukan
+    """
+    return next(finditer(text, pattern), -1)
+
+
+def count(text: str, pattern: str) -> int:
+    """
+    Menghitung jumlah kemunculan pattern (termasuk yang tumpang tindih)
+    tanpa menyimpan indeksnya.
+    
+    Returns:
+        Jumlah kemunculan pattern dalam text
+    """
+    return sum(1 for _ in finditer(text, pattern))
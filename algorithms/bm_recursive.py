@@ -3,10 +3,8 @@ Boyer-Moore Algorithm - Recursive Version
 Menggunakan Bad Character Rule
 """
 from typing import List, Dict
-import sys
 
-# Increase recursion limit for large inputs
-sys.setrecursionlimit(20000)
+from .trampoline import Bounce, trampoline, recursion_limit
 
 
 def compute_bad_character_recursive(pattern: str, index: int = 0, 
@@ -125,8 +123,128 @@ def search(text: str, pattern: str) -> List[int]:
     n = len(text)
     m = len(pattern)
     
-    # Hitung bad character table secara rekursif
-    bad_char = compute_bad_character_recursive(pattern)
+    # Recursion limit dinaikkan hanya selama pemanggilan ini
+    # (versi *_trampolined di bawah tidak membutuhkannya)
+    with recursion_limit():
+        # Hitung bad character table secara rekursif
+        bad_char = compute_bad_character_recursive(pattern)
+        
+        # Cari pattern secara rekursif
+        return search_recursive(text, pattern, 0, n, m, bad_char, [])
+
+
+def compute_bad_character_trampolined(pattern: str, index: int = 0,
+                                      table: Dict[str, int] = None):
+    """
+    Langkah rekursif bad character table dalam bentuk trampoline.
+    
+    Args:
+        pattern: Pola untuk dihitung bad character table-nya
+        index: Indeks saat ini di pattern
+        table: Dictionary untuk menyimpan hasil
+        
+    Returns:
+        Bad character table, atau Bounce untuk langkah berikutnya
+    """
+    if table is None:
+        table = {}
+    
+    # Base case: sudah selesai memproses semua karakter
+    if index >= len(pattern):
+        return table
+    
+    table[pattern[index]] = index
+    
+    return Bounce(compute_bad_character_trampolined, pattern, index + 1, table)
+
+
+def match_pattern_trampolined(text: str, pattern: str, s: int, j: int):
+    """
+    Langkah rekursif pencocokan kanan-ke-kiri dalam bentuk trampoline.
+    
+    Args:
+        text: Teks utama
+        pattern: Pola yang dicari
+        s: Posisi shift saat ini
+        j: Indeks saat ini di pattern (dari kanan)
+        
+    Returns:
+        Indeks mismatch (-1 jika semua cocok), atau Bounce untuk langkah berikutnya
+    """
+    # Base case: semua karakter cocok
+    if j < 0:
+        return -1
+    
+    if pattern[j] != text[s + j]:
+        return j
+    
+    return Bounce(match_pattern_trampolined, text, pattern, s, j - 1)
+
+
+def search_recursive_trampolined(text: str, pattern: str, s: int, n: int, m: int,
+                                 bad_char: Dict[str, int], results: List[int]):
+    """
+    Langkah rekursif pencarian Boyer-Moore dalam bentuk trampoline.
+    
+    Args:
+        text: Teks utama
+        pattern: Pola yang dicari
+        s: Posisi shift saat ini
+        n: Panjang text
+        m: Panjang pattern
+        bad_char: Bad character table
+        results: List untuk menyimpan hasil
+        
+    Returns:
+        List indeks di mana pattern ditemukan, atau Bounce untuk langkah berikutnya
+    """
+    # Base case: sudah melewati akhir text
+    if s > n - m:
+        return results
+    
+    # Pencocokan juga dijalankan lewat trampoline (kedalaman hingga m)
+    j = trampoline(match_pattern_trampolined, text, pattern, s, m - 1)
+    
+    if j < 0:
+        results.append(s)
+        if s + m < n:
+            next_shift = m - bad_char.get(text[s + m], -1)
+        else:
+            next_shift = 1
+        return Bounce(search_recursive_trampolined, text, pattern, s + next_shift,
+                      n, m, bad_char, results)
+    
+    bad_char_shift = j - bad_char.get(text[s + j], -1)
+    next_shift = max(1, bad_char_shift)
+    
+    return Bounce(search_recursive_trampolined, text, pattern, s + next_shift,
+                  n, m, bad_char, results)
+
+
+def search_trampolined(text: str, pattern: str) -> List[int]:
+    """
+    Boyer-Moore rekursif yang stack-safe: struktur dan kompleksitas sama dengan
+    search, tetapi dijalankan lewat trampoline sehingga tidak bergantung pada
+    recursion limit.
+    
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+        
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not text:
+        return []
+    if len(pattern) > len(text):
+        return []
+    
+    n = len(text)
+    m = len(pattern)
+    
+    bad_char = trampoline(compute_bad_character_trampolined, pattern)
     
-    # Cari pattern secara rekursif
-    return search_recursive(text, pattern, 0, n, m, bad_char, [])
+    return trampoline(search_recursive_trampolined, text, pattern, 0, n, m, bad_char, [])
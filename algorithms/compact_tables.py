@@ -0,0 +1,143 @@
+"""
+Compact Tables
+Versi hemat memori dari tabel preprocessing untuk pattern panjang dan cache
+pattern yang besar: failure function dan good suffix disimpan dalam
+array.array, bad character table dalam array padat yang diindeks
+ord(c) - ord(min(pattern)). Lebar elemen dipilih dari nilai terbesar
+yang perlu disimpan.
+"""
+from array import array
+from typing import Dict, Union
+
+from . import bm_iterative, bm_bytes
+
+
+# Rentang alfabet maksimum (max(ord) - min(ord) + 1) untuk tabel padat;
+# pattern dengan karakter yang lebih tersebar tetap memakai dict
+MAX_DENSE_SPAN = 1 << 16
+
+
+def unsigned_typecode(max_value: int) -> str:
+    """Typecode array tak bertanda terkecil yang dapat menampung 0..max_value"""
+    for typecode in ('B', 'H', 'I', 'Q'):
+        if max_value < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise OverflowError(f"Nilai terlalu besar untuk array: {max_value}")
+
+
+def signed_typecode(min_value: int, max_value: int) -> str:
+    """Typecode array bertanda terkecil yang dapat menampung min_value..max_value"""
+    for typecode in ('b', 'h', 'i', 'q'):
+        limit = 1 << (8 * array(typecode).itemsize - 1)
+        if -limit <= min_value and max_value < limit:
+            return typecode
+    raise OverflowError(f"Nilai terlalu besar untuk array: {max_value}")
+
+
+def _zeros(typecode: str, size: int) -> array:
+    """array berisi size nol tanpa membuat list perantara"""
+    return array(typecode, bytes(size * array(typecode).itemsize))
+
+
+def compute_failure_array(pattern: str) -> array:
+    """
+    compute_failure_function yang menyimpan hasil dalam array.
+
+    Lebar elemen mengikuti nilai failure terbesar (border terpanjang), bukan
+    panjang pattern: dimulai 1 byte per entry dan dilebarkan hanya jika ada
+    border >= 256, sehingga pattern panjang yang tidak periodik tetap 1 byte.
+
+    Returns:
+        array failure function (dapat dipakai di mana pun list failure dipakai)
+    """
+    m = len(pattern)
+    failure = _zeros('B', m)
+    limit = 1 << 8
+    j = 0
+
+    for i in range(1, m):
+        while j > 0 and pattern[i] != pattern[j]:
+            j = failure[j - 1]
+        if pattern[i] == pattern[j]:
+            j += 1
+            if j >= limit:
+                typecode = unsigned_typecode(m - 1)
+                failure = array(typecode, failure)
+                limit = 1 << (8 * failure.itemsize)
+        failure[i] = j
+
+    return failure
+
+
+def compute_good_suffix_array(pattern: str) -> array:
+    """compute_good_suffix_table dalam array (nilai shift <= m)"""
+    return array(unsigned_typecode(len(pattern)),
+                 bm_iterative.compute_good_suffix_table(pattern))
+
+
+class DenseBadCharTable:
+    """
+    Bad character table padat: satu entry per karakter di rentang
+    [min(pattern), max(pattern)], menyimpan posisi terakhir + 1 (0 = tidak ada).
+
+    Mendukung .get(c, default) seperti dict sehingga dapat langsung dipakai
+    oleh search_with_table / search_recursive yang sudah ada.
+    """
+
+    __slots__ = ('lo', 'table')
+
+    def __init__(self, pattern: str):
+        codes = [ord(c) for c in set(pattern)]
+        self.lo = min(codes) if codes else 0
+        span = max(codes) - self.lo + 1 if codes else 0
+        self.table = _zeros(unsigned_typecode(len(pattern)), span)
+
+        lo = self.lo
+        table = self.table
+        for i, c in enumerate(pattern):
+            table[ord(c) - lo] = i + 1
+
+    def get(self, c: str, default: int = -1) -> int:
+        """Posisi terakhir c di pattern, atau default jika tidak ada"""
+        index = ord(c) - self.lo
+        if 0 <= index < len(self.table):
+            value = self.table[index]
+            if value:
+                return value - 1
+        return default
+
+    def __contains__(self, c: str) -> bool:
+        return self.get(c, None) is not None
+
+    def __len__(self) -> int:
+        return sum(1 for value in self.table if value)
+
+    def __repr__(self) -> str:
+        return (f"DenseBadCharTable(lo={self.lo}, span={len(self.table)}, "
+                f"typecode={self.table.typecode!r})")
+
+
+def compute_dense_bad_character_table(pattern: str) -> Union[DenseBadCharTable, Dict[str, int]]:
+    """
+    Bad character table padat, atau dict biasa jika rentang alfabet
+    pattern melebihi MAX_DENSE_SPAN (tabel padat justru lebih boros).
+
+    Returns:
+        Objek dengan .get(c, default) seperti compute_bad_character_table
+    """
+    if pattern:
+        codes = [ord(c) for c in set(pattern)]
+        if max(codes) - min(codes) + 1 > MAX_DENSE_SPAN:
+            return bm_iterative.compute_bad_character_table(pattern)
+    return DenseBadCharTable(pattern)
+
+
+def compute_bad_character_array_bytes(pattern: bytes) -> array:
+    """
+    bm_bytes.compute_bad_character_table dalam array bertanda 256 entry
+    (-1 = byte tidak ada di pattern).
+    """
+    bad_char = array(signed_typecode(-1, len(pattern)), [-1]) * bm_bytes.ALPHABET_SIZE
+    for i, b in enumerate(pattern):
+        bad_char[b] = i
+    return bad_char
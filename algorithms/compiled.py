@@ -0,0 +1,250 @@
+"""
+Compiled Pattern
+Pattern yang sudah dikompilasi beserta tabel preprocessing-nya (mirip re.compile),
+disimpan dalam LRU cache berukuran terbatas
+"""
+from collections import OrderedDict, namedtuple
+from typing import Callable, Dict, List, Tuple
+import threading
+
+from . import kmp_iterative, kmp_recursive, bm_iterative, bm_recursive, bm_bytes
+from . import two_way, rabin_karp, compact_tables
+from .trampoline import recursion_limit
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+def _kmp_tables(pattern: str) -> tuple:
+    return (kmp_iterative.compute_failure_function(pattern),)
+
+
+def _kmp_recursive_tables(pattern: str) -> tuple:
+    with recursion_limit():
+        return (kmp_recursive.compute_failure_function_recursive(pattern),)
+
+
+def _kmp_recursive_search(text: str, pattern: str, failure: List[int]) -> List[int]:
+    with recursion_limit():
+        return kmp_recursive.search_recursive(text, pattern, 0, 0, failure, [])
+
+
+def _bm_tables(pattern: str) -> tuple:
+    return (bm_iterative.compute_bad_character_table(pattern),)
+
+
+def _bm_recursive_tables(pattern: str) -> tuple:
+    with recursion_limit():
+        return (bm_recursive.compute_bad_character_recursive(pattern),)
+
+
+def _bm_recursive_search(text: str, pattern: str, bad_char: Dict[str, int]) -> List[int]:
+    with recursion_limit():
+        return bm_recursive.search_recursive(text, pattern, 0, len(text), len(pattern),
+                                             bad_char, [])
+
+
+def _bm_galil_tables(pattern: str) -> tuple:
+    return (bm_iterative.compute_bad_character_table(pattern),
+            bm_iterative.compute_good_suffix_table(pattern))
+
+
+def _two_way_tables(pattern: str) -> tuple:
+    return two_way.critical_factorization(pattern)
+
+
+def _rabin_karp_tables(pattern: str) -> tuple:
+    return (rabin_karp.fingerprint(pattern),)
+
+
+def _bm_bytes_tables(pattern: bytes) -> tuple:
+    return (bm_bytes.compute_bad_character_table(pattern),)
+
+
+# Registry engine: nama -> (fungsi preprocessing, fungsi pencarian dengan tabel)
+ENGINES: Dict[str, Tuple[Callable, Callable]] = {
+    'kmp': (_kmp_tables, kmp_iterative.search_with_failure),
+    'kmp_recursive': (_kmp_recursive_tables, _kmp_recursive_search),
+    'bm': (_bm_tables, bm_iterative.search_with_table),
+    'bm_recursive': (_bm_recursive_tables, _bm_recursive_search),
+    'bm_galil': (_bm_galil_tables, bm_iterative.search_galil_with_tables),
+    'two_way': (_two_way_tables, two_way.search_with_factorization),
+    'rabin_karp': (_rabin_karp_tables, rabin_karp.search_with_fingerprint),
+    'bm_bytes': (_bm_bytes_tables, bm_bytes.search_with_table),
+}
+
+
+def _compact_kmp_tables(pattern: str) -> tuple:
+    return (compact_tables.compute_failure_array(pattern),)
+
+
+def _compact_bm_tables(pattern: str) -> tuple:
+    return (compact_tables.compute_dense_bad_character_table(pattern),)
+
+
+def _compact_bm_galil_tables(pattern: str) -> tuple:
+    return (compact_tables.compute_dense_bad_character_table(pattern),
+            compact_tables.compute_good_suffix_array(pattern))
+
+
+def _compact_bm_bytes_tables(pattern: bytes) -> tuple:
+    return (compact_tables.compute_bad_character_array_bytes(pattern),)
+
+
+# Preprocessing alternatif untuk compile(..., compact=True); engine yang tidak
+# terdaftar (two_way tidak punya tabel) memakai preprocessing biasa
+COMPACT_TABLES: Dict[str, Callable] = {
+    'kmp': _compact_kmp_tables,
+    'kmp_recursive': _compact_kmp_tables,
+    'bm': _compact_bm_tables,
+    'bm_recursive': _compact_bm_tables,
+    'bm_galil': _compact_bm_galil_tables,
+    'bm_bytes': _compact_bm_bytes_tables,
+}
+
+
+class CompiledPattern:
+    """Pattern beserta tabel preprocessing yang dapat dipakai berulang kali"""
+
+    __slots__ = ('pattern', 'algorithm', 'compact', 'tables', '_search')
+
+    def __init__(self, pattern: str, algorithm: str = 'kmp', compact: bool = False):
+        if algorithm not in ENGINES:
+            raise ValueError(
+                f"Algoritma tidak dikenal: {algorithm!r} "
+                f"(pilihan: {', '.join(sorted(ENGINES))})"
+            )
+        preprocess, search = ENGINES[algorithm]
+        if compact:
+            preprocess = COMPACT_TABLES.get(algorithm, preprocess)
+        self.pattern = pattern
+        self.algorithm = algorithm
+        self.compact = compact
+        self.tables = preprocess(pattern) if pattern else ()
+        self._search = search
+
+    def search(self, text: str) -> List[int]:
+        """
+        Mencari semua kemunculan pattern dalam text tanpa menghitung ulang tabel.
+
+        Args:
+            text: Teks utama untuk pencarian
+
+        Returns:
+            List indeks awal di mana pattern ditemukan
+        """
+        # Handle edge cases
+        if not self.pattern:
+            return []
+        if not text:
+            return []
+        if len(self.pattern) > len(text):
+            return []
+
+        return self._search(text, self.pattern, *self.tables)
+
+    def __repr__(self) -> str:
+        compact = ", compact=True" if self.compact else ""
+        return f"CompiledPattern({self.pattern!r}, algorithm={self.algorithm!r}{compact})"
+
+
+class PatternCache:
+    """LRU cache untuk CompiledPattern dengan key (algorithm, pattern, compact)"""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Tuple[str, str, bool], CompiledPattern]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pattern: str, algorithm: str = 'kmp',
+            compact: bool = False) -> CompiledPattern:
+        """
+        Mengambil pattern terkompilasi dari cache, atau mengompilasinya jika belum ada.
+
+        Args:
+            pattern: Pola yang dicari
+            algorithm: Nama engine (lihat ENGINES)
+            compact: Gunakan tabel compact_tables (array) bila tersedia
+
+        Returns:
+            CompiledPattern untuk (algorithm, pattern, compact)
+        """
+        key = (algorithm, pattern, compact)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return compiled
+            self.misses += 1
+
+        # Kompilasi di luar lock agar preprocessing pattern panjang tidak memblokir
+        compiled = CompiledPattern(pattern, algorithm, compact)
+
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return compiled
+
+    def info(self) -> CacheInfo:
+        """Statistik cache: hits, misses, evictions, maxsize, currsize"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._entries))
+
+    def resize(self, maxsize: int) -> None:
+        """Mengubah kapasitas cache, membuang entry paling lama jika perlu"""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Mengosongkan cache dan mereset semua counter"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+_cache = PatternCache()
+
+
+def compile(pattern: str, algorithm: str = 'kmp', compact: bool = False) -> CompiledPattern:
+    """
+    Mengompilasi pattern menjadi matcher yang dapat dipakai ulang (mirip re.compile).
+
+    Args:
+        pattern: Pola yang dicari
+        algorithm: Nama engine: 'kmp', 'kmp_recursive', 'bm', 'bm_recursive',
+                   'bm_galil', 'two_way', 'rabin_karp', 'bm_bytes' (khusus pattern bytes)
+        compact: Simpan tabel dalam array.array / tabel padat (hemat memori
+                 untuk pattern panjang dan cache besar)
+
+    Returns:
+        CompiledPattern dari LRU cache global
+    """
+    return _cache.get(pattern, algorithm, compact)
+
+
+def cache_info() -> CacheInfo:
+    """Statistik LRU cache global"""
+    return _cache.info()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Mengubah kapasitas LRU cache global"""
+    _cache.resize(maxsize)
+
+
+def purge() -> None:
+    """Mengosongkan LRU cache global (mirip re.purge)"""
+    _cache.clear()
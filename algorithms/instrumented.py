@@ -0,0 +1,312 @@
+"""
+Instrumented Algorithms
+Salinan hot loop keempat algoritma dasar yang menghitung operasi
+(perbandingan karakter, shift, fallback failure function, preprocessing).
+Versi asli tidak disentuh sehingga tanpa instrumentasi tidak ada overhead.
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import kmp_iterative, kmp_recursive, bm_iterative, bm_recursive
+from .trampoline import recursion_limit
+
+
+@dataclass
+class OperationCounts:
+    """Jumlah operasi yang dilakukan satu pemanggilan search"""
+    comparisons: int = 0        # perbandingan karakter text vs pattern
+    shifts: int = 0             # berapa kali posisi pattern bergeser
+    shift_distance: int = 0     # total jarak pergeseran pattern
+    fallbacks: int = 0          # lompatan mundur lewat failure function (KMP)
+    preprocessing_ops: int = 0  # perbandingan/penulisan saat membangun tabel
+
+
+def _kmp_failure_counted(pattern: str, counts: OperationCounts) -> List[int]:
+    """compute_failure_function dengan penghitung preprocessing_ops"""
+    m = len(pattern)
+    failure = [0] * m
+    j = 0
+    ops = 0
+
+    for i in range(1, m):
+        # Perbandingan yang menghentikan loop dengan match tidak dihitung ulang
+        matched = False
+        while j > 0:
+            ops += 1
+            if pattern[i] == pattern[j]:
+                matched = True
+                break
+            j = failure[j - 1]
+
+        if not matched:
+            ops += 1
+            matched = pattern[i] == pattern[j]
+        if matched:
+            j += 1
+
+        failure[i] = j
+
+    counts.preprocessing_ops += ops
+    return failure
+
+
+def kmp_iterative_counted(text: str, pattern: str) -> Tuple[List[int], OperationCounts]:
+    """
+    kmp_iterative.search yang juga menghitung operasi.
+
+    Returns:
+        Tuple (list indeks match, OperationCounts)
+    """
+    counts = OperationCounts()
+    if not pattern or not text or len(pattern) > len(text):
+        return [], counts
+
+    n = len(text)
+    m = len(pattern)
+    results = []
+    failure = _kmp_failure_counted(pattern, counts)
+
+    comparisons = shifts = shift_distance = fallbacks = 0
+    j = 0
+
+    for i in range(n):
+        # Mundur sampai menemukan prefix yang cocok atau j = 0; perbandingan
+        # yang menghentikan loop dengan match tidak dihitung ulang di bawah
+        matched = False
+        while j > 0:
+            comparisons += 1
+            if text[i] == pattern[j]:
+                matched = True
+                break
+            fallbacks += 1
+            shifts += 1
+            shift_distance += j - failure[j - 1]
+            j = failure[j - 1]
+
+        if not matched:
+            comparisons += 1
+            matched = text[i] == pattern[j]
+        if matched:
+            j += 1
+        elif j == 0:
+            # Mismatch di awal pattern: pattern bergeser satu posisi
+            shifts += 1
+            shift_distance += 1
+
+        if j == m:
+            results.append(i - m + 1)
+            shifts += 1
+            shift_distance += m - failure[j - 1]
+            j = failure[j - 1]
+
+    counts.comparisons = comparisons
+    counts.shifts = shifts
+    counts.shift_distance = shift_distance
+    counts.fallbacks = fallbacks
+    return results, counts
+
+
+def _kmp_failure_recursive_counted(pattern: str, i: int, j: int, failure: List[int],
+                                   counts: OperationCounts) -> List[int]:
+    """compute_failure_function_recursive dengan penghitung preprocessing_ops"""
+    if i >= len(pattern):
+        return failure
+
+    counts.preprocessing_ops += 1
+    if pattern[i] == pattern[j]:
+        failure[i] = j + 1
+        return _kmp_failure_recursive_counted(pattern, i + 1, j + 1, failure, counts)
+
+    if j > 0:
+        return _kmp_failure_recursive_counted(pattern, i, failure[j - 1], failure, counts)
+
+    failure[i] = 0
+    return _kmp_failure_recursive_counted(pattern, i + 1, 0, failure, counts)
+
+
+def _kmp_search_recursive_counted(text: str, pattern: str, t_idx: int, p_idx: int,
+                                  failure: List[int], results: List[int],
+                                  counts: OperationCounts) -> List[int]:
+    """kmp_recursive.search_recursive dengan penghitung operasi"""
+    n = len(text)
+    m = len(pattern)
+
+    if t_idx >= n:
+        return results
+
+    counts.comparisons += 1
+    if text[t_idx] == pattern[p_idx]:
+        if p_idx == m - 1:
+            results.append(t_idx - m + 1)
+            new_p_idx = failure[p_idx] if p_idx > 0 else 0
+            counts.shifts += 1
+            counts.shift_distance += m - new_p_idx
+            return _kmp_search_recursive_counted(text, pattern, t_idx + 1, new_p_idx,
+                                                 failure, results, counts)
+        return _kmp_search_recursive_counted(text, pattern, t_idx + 1, p_idx + 1,
+                                             failure, results, counts)
+
+    counts.shifts += 1
+    if p_idx > 0:
+        counts.fallbacks += 1
+        counts.shift_distance += p_idx - failure[p_idx - 1]
+        return _kmp_search_recursive_counted(text, pattern, t_idx, failure[p_idx - 1],
+                                             failure, results, counts)
+
+    counts.shift_distance += 1
+    return _kmp_search_recursive_counted(text, pattern, t_idx + 1, 0,
+                                         failure, results, counts)
+
+
+def kmp_recursive_counted(text: str, pattern: str) -> Tuple[List[int], OperationCounts]:
+    """
+    kmp_recursive.search yang juga menghitung operasi.
+
+    Returns:
+        Tuple (list indeks match, OperationCounts)
+    """
+    counts = OperationCounts()
+    if not pattern or not text or len(pattern) > len(text):
+        return [], counts
+
+    with recursion_limit():
+        failure = _kmp_failure_recursive_counted(pattern, 1, 0, [0] * len(pattern), counts)
+        results = _kmp_search_recursive_counted(text, pattern, 0, 0, failure, [], counts)
+    return results, counts
+
+
+def bm_iterative_counted(text: str, pattern: str) -> Tuple[List[int], OperationCounts]:
+    """
+    bm_iterative.search yang juga menghitung operasi.
+
+    Returns:
+        Tuple (list indeks match, OperationCounts)
+    """
+    counts = OperationCounts()
+    if not pattern or not text or len(pattern) > len(text):
+        return [], counts
+
+    n = len(text)
+    m = len(pattern)
+    results = []
+
+    bad_char = bm_iterative.compute_bad_character_table(pattern)
+    counts.preprocessing_ops = m
+
+    comparisons = shifts = shift_distance = 0
+    s = 0
+
+    while s <= n - m:
+        j = m - 1
+
+        # Cocokkan karakter dari kanan ke kiri
+        while j >= 0:
+            comparisons += 1
+            if pattern[j] != text[s + j]:
+                break
+            j -= 1
+
+        if j < 0:
+            results.append(s)
+            if s + m < n:
+                shift = m - bad_char.get(text[s + m], -1)
+            else:
+                shift = 1
+        else:
+            shift = max(1, j - bad_char.get(text[s + j], -1))
+
+        s += shift
+        shifts += 1
+        shift_distance += shift
+
+    counts.comparisons = comparisons
+    counts.shifts = shifts
+    counts.shift_distance = shift_distance
+    return results, counts
+
+
+def _bm_match_recursive_counted(text: str, pattern: str, s: int, j: int,
+                                counts: OperationCounts) -> int:
+    """bm_recursive.match_pattern_recursive dengan penghitung perbandingan"""
+    if j < 0:
+        return -1
+
+    counts.comparisons += 1
+    if pattern[j] != text[s + j]:
+        return j
+
+    return _bm_match_recursive_counted(text, pattern, s, j - 1, counts)
+
+
+def _bm_search_recursive_counted(text: str, pattern: str, s: int, n: int, m: int,
+                                 bad_char: Dict[str, int], results: List[int],
+                                 counts: OperationCounts) -> List[int]:
+    """bm_recursive.search_recursive dengan penghitung operasi"""
+    if s > n - m:
+        return results
+
+    j = _bm_match_recursive_counted(text, pattern, s, m - 1, counts)
+
+    if j < 0:
+        results.append(s)
+        if s + m < n:
+            next_shift = m - bad_char.get(text[s + m], -1)
+        else:
+            next_shift = 1
+    else:
+        next_shift = max(1, j - bad_char.get(text[s + j], -1))
+
+    counts.shifts += 1
+    counts.shift_distance += next_shift
+    return _bm_search_recursive_counted(text, pattern, s + next_shift, n, m,
+                                        bad_char, results, counts)
+
+
+def bm_recursive_counted(text: str, pattern: str) -> Tuple[List[int], OperationCounts]:
+    """
+    bm_recursive.search yang juga menghitung operasi.
+
+    Returns:
+        Tuple (list indeks match, OperationCounts)
+    """
+    counts = OperationCounts()
+    if not pattern or not text or len(pattern) > len(text):
+        return [], counts
+
+    n = len(text)
+    m = len(pattern)
+    counts.preprocessing_ops = m
+
+    with recursion_limit():
+        bad_char = bm_recursive.compute_bad_character_recursive(pattern)
+        results = _bm_search_recursive_counted(text, pattern, 0, n, m, bad_char, [], counts)
+    return results, counts
+
+
+# Pemetaan fungsi search asli -> versi terinstrumentasi
+INSTRUMENTED: Dict[Callable, Callable] = {
+    kmp_iterative.search: kmp_iterative_counted,
+    kmp_recursive.search: kmp_recursive_counted,
+    bm_iterative.search: bm_iterative_counted,
+    bm_recursive.search: bm_recursive_counted,
+}
+
+
+def count_operations(algorithm: Callable, text: str,
+                     pattern: str) -> Optional[OperationCounts]:
+    """
+    Menjalankan versi terinstrumentasi dari algorithm.
+
+    Args:
+        algorithm: Fungsi search asli (mis. kmp_iterative.search)
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+
+    Returns:
+        OperationCounts, atau None jika algorithm tidak punya versi terinstrumentasi
+    """
+    counted = INSTRUMENTED.get(algorithm)
+    if counted is None:
+        return None
+    _, counts = counted(text, pattern)
+    return counts
@@ -1,7 +1,7 @@
 """
 KMP (Knuth-Morris-Pratt) Algorithm - Iterative Version
 """
-from typing import List
+from typing import Iterator, List
 
 
 def compute_failure_function(pattern: str) -> List[int]:
@@ -51,13 +51,31 @@ def search(text: str, pattern: str) -> List[int]:
     if len(pattern) > len(text):
         return []
     
+    # Hitung failure function
+    failure = compute_failure_function(pattern)
+    
+    return search_with_failure(text, pattern, failure)
+
+
+def search_with_failure(text: str, pattern: str, failure: List[int]) -> List[int]:
+    """
+    Pencarian KMP iteratif dengan failure function yang sudah dihitung.
+    
+    Dipakai ulang oleh pattern yang sudah dikompilasi (lihat compiled.py)
+    agar preprocessing tidak diulang di setiap pemanggilan.
+    
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari (tidak kosong)
+        failure: Failure function dari pattern
+        
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
     n = len(text)
     m = len(pattern)
     results = []
     
-    # Hitung failure function
-    failure = compute_failure_function(pattern)
-    
     j = 0  # indeks di pattern
     
     for i in range(n):
@@ -75,3 +93,62 @@ def search(text: str, pattern: str) -> List[int]:
             j = failure[j - 1]  # Lanjut mencari kemunculan berikutnya
     
     return results
+
+
+def finditer(text: str, pattern: str) -> Iterator[int]:
+    """
+    Versi generator dari search: menghasilkan indeks match satu per satu
+    tanpa membangun list hasil.
+    
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+        
+    Returns:
+        Iterator indeks awal di mana pattern ditemukan
+    """
+    # Handle edge cases
+    if not pattern:
+        return
+    if not text:
+        return
+    if len(pattern) > len(text):
+        return
+    
+    n = len(text)
+    m = len(pattern)
+    failure = compute_failure_function(pattern)
+    
+    j = 0  # indeks di pattern
+    
+    for i in range(n):
+        while j > 0 and text[i] != pattern[j]:
+            j = failure[j - 1]
+        
+        if text[i] == pattern[j]:
+            j += 1
+        
+        if j == m:
+            yield i - m + 1
+            j = failure[j - 1]
+
+
+def find_first(text: str, pattern: str) -> int:
+    """
+    Mencari kemunculan pertama pattern dan berhenti saat itu juga.
+    
+    Returns:
+        Indeks awal match pertama, atau -1 jika tidak ditemukan
+    """
+    return next(finditer(text, pattern), -1)
+
+
+def count(text: str, pattern: str) -> int:
+    """
+    Menghitung jumlah kemunculan pattern (termasuk yang tumpang tindih)
+    tanpa menyimpan indeksnya.
+    
+    Returns:
+        Jumlah kemunculan pattern dalam text
+    """
+    return sum(1 for _ in finditer(text, pattern))
@@ -0,0 +1,150 @@
+"""
+Parallel Search
+Membagi text menjadi shard dengan overlap (m - 1) karakter dan mencarinya
+di process pool; text dibagikan lewat multiprocessing.shared_memory
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+import os
+
+from .compiled import compile
+
+
+# Shard default tidak lebih kecil dari ini agar overhead IPC tetap kecil
+MIN_SHARD_SIZE = 64 * 1024
+
+
+def _encode_text(text: str) -> Tuple[bytes, str, int]:
+    """
+    Encode text dengan lebar tetap per karakter agar offset shard mudah dihitung.
+
+    Surrogate tunggal (mis. hasil decode 'surrogateescape') tetap di-encode
+    apa adanya, seperti yang diterima engine sekuensial.
+
+    Returns:
+        Tuple (data, encoding, lebar byte per karakter)
+    """
+    if text.isascii():
+        return text.encode('ascii'), 'ascii', 1
+    return text.encode('utf-32-le', 'surrogatepass'), 'utf-32-le', 4
+
+
+def _search_shard(shm_name: str, encoding: str, width: int, n: int,
+                  start: int, end: int, pattern: str, algorithm: str) -> List[int]:
+    """
+    Dijalankan di worker: mencari match yang dimulai di [start, end).
+
+    Args:
+        shm_name: Nama shared memory berisi text
+        encoding: Encoding text di shared memory
+        width: Lebar byte per karakter
+        n: Panjang text (karakter)
+        start: Awal shard (karakter)
+        end: Akhir shard eksklusif (karakter)
+        pattern: Pola yang dicari
+        algorithm: Nama engine pada compiled.ENGINES
+
+    Returns:
+        List offset absolut match di shard ini
+    """
+    m = len(pattern)
+    stop = min(n, end + m - 1)  # overlap agar match di batas shard tidak hilang
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        chunk = bytes(shm.buf[start * width:stop * width]).decode(encoding, 'surrogatepass')
+    finally:
+        shm.close()
+
+    matcher = compile(pattern, algorithm)
+    return [start + pos for pos in matcher.search(chunk) if start + pos < end]
+
+
+def make_shards(n: int, m: int, workers: int,
+                shard_size: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Membagi [0, n - m] menjadi shard (start, end) untuk posisi awal match.
+
+    Args:
+        n: Panjang text
+        m: Panjang pattern
+        workers: Jumlah worker
+        shard_size: Ukuran shard; default sekitar 4 shard per worker
+
+    Returns:
+        List (start, end) yang tidak saling tumpang tindih
+    """
+    last_start = n - m + 1  # posisi awal match yang mungkin: [0, last_start)
+    if shard_size is None:
+        shard_size = max(MIN_SHARD_SIZE, -(-last_start // (workers * 4)))
+    shard_size = max(1, shard_size)
+
+    return [(start, min(last_start, start + shard_size))
+            for start in range(0, last_start, shard_size)]
+
+
+def parallel_search(text: str, pattern: str, algorithm: str = 'kmp',
+                    workers: Optional[int] = None,
+                    shard_size: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> List[int]:
+    """
+    Mencari semua kemunculan pattern dengan beberapa proses sekaligus.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+        algorithm: Nama engine: 'kmp', 'kmp_recursive', 'bm', 'bm_recursive', 'bm_galil'
+        workers: Jumlah proses (default: os.cpu_count())
+        shard_size: Jumlah posisi awal per shard (default otomatis)
+        executor: Process pool yang sudah ada (opsional, agar dapat dipakai ulang)
+
+    Returns:
+        List indeks awal di mana pattern ditemukan, terurut dan tanpa duplikat
+    """
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not text:
+        return []
+    if len(pattern) > len(text):
+        return []
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    n = len(text)
+    m = len(pattern)
+    shards = make_shards(n, m, workers, shard_size)
+
+    # Satu shard atau satu worker: tidak ada gunanya membayar overhead proses
+    if workers <= 1 or len(shards) <= 1:
+        return compile(pattern, algorithm).search(text)
+
+    data, encoding, width = _encode_text(text)
+    shm = shared_memory.SharedMemory(create=True, size=len(data))
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        shm.buf[:len(data)] = data
+        del data
+
+        futures = [
+            executor.submit(_search_shard, shm.name, encoding, width, n,
+                            start, end, pattern, algorithm)
+            for start, end in shards
+        ]
+
+        # Gabungkan dan hilangkan duplikat
+        found = set()
+        for future in futures:
+            found.update(future.result())
+    finally:
+        if own_executor:
+            executor.shutdown()
+        shm.close()
+        shm.unlink()
+
+    return sorted(found)
@@ -0,0 +1,170 @@
+"""
+Adaptive Algorithm Planner
+Memilih engine pencarian per query berdasarkan panjang pattern, perkiraan
+ukuran alfabet, panjang text, dan periodisitas pattern
+"""
+from dataclasses import dataclass, asdict, fields
+from typing import Callable, Dict, List, Optional
+import json
+import os
+
+from . import kmp_iterative, kmp_recursive, bm_iterative, bm_recursive, bitparallel
+from . import two_way, rabin_karp
+
+
+DEFAULT_THRESHOLDS_PATH = "output/data/planner_thresholds.json"
+
+# Jumlah karakter awal text yang dipakai untuk memperkirakan ukuran alfabet
+ALPHABET_SAMPLE_SIZE = 4096
+
+
+@dataclass
+class PlannerThresholds:
+    """Ambang batas keputusan planner (dapat dikalibrasi per mesin)"""
+    short_text: int = 64            # di bawah ini overhead preprocessing mendominasi
+    vectorized_min_text: int = 50_000  # mulai dari ini engine NumPy dipakai
+    bndm_max_pattern: int = bitparallel.WORD_SIZE  # pattern terpanjang untuk BNDM
+    small_alphabet: int = 4         # alfabet sekecil ini membuat bad character lemah
+
+    def save(self, path: str = DEFAULT_THRESHOLDS_PATH) -> None:
+        """Menyimpan threshold ke file JSON"""
+        os.makedirs(os.path.dirname(path) if os.path.dirname(path) else '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(asdict(self), f, indent=2)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_THRESHOLDS_PATH) -> 'PlannerThresholds':
+        """Memuat threshold dari file JSON; nilai default jika file belum ada"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def _vectorized_search() -> Optional[Callable]:
+    """Engine NumPy diimpor saat dibutuhkan agar numpy tidak dimuat tanpa perlu"""
+    from . import vectorized
+    return vectorized.search if vectorized.AVAILABLE else None
+
+
+ENGINES: Dict[str, Callable] = {
+    'kmp': kmp_iterative.search,
+    'kmp_recursive': kmp_recursive.search,
+    'bm': bm_iterative.search,
+    'bm_recursive': bm_recursive.search,
+    'bm_galil': bm_iterative.search_galil,
+    'two_way': two_way.search,
+    'rabin_karp': rabin_karp.search,
+    'shift_or': bitparallel.search_shift_or,
+    'bndm': bitparallel.search_bndm,
+}
+
+_thresholds: Optional[PlannerThresholds] = None
+
+
+def get_thresholds() -> PlannerThresholds:
+    """Threshold aktif, dimuat sekali dari DEFAULT_THRESHOLDS_PATH"""
+    global _thresholds
+    if _thresholds is None:
+        _thresholds = PlannerThresholds.load()
+    return _thresholds
+
+
+def set_thresholds(thresholds: PlannerThresholds) -> None:
+    """Mengganti threshold aktif (misalnya setelah kalibrasi)"""
+    global _thresholds
+    _thresholds = thresholds
+
+
+def estimate_alphabet_size(text: str) -> int:
+    """Perkiraan ukuran alfabet dari sampel awal text"""
+    return len(set(text[:ALPHABET_SAMPLE_SIZE]))
+
+
+def pattern_period(pattern: str) -> int:
+    """Periode terkecil pattern, dihitung dari failure function KMP"""
+    failure = kmp_iterative.compute_failure_function(pattern)
+    return len(pattern) - failure[-1] if failure else 0
+
+
+def choose_algorithm(text: str, pattern: str,
+                     thresholds: Optional[PlannerThresholds] = None) -> str:
+    """
+    Memilih nama engine untuk satu query.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+        thresholds: Threshold planner (default: get_thresholds())
+
+    Returns:
+        Nama engine pada ENGINES atau 'vectorized'
+    """
+    if thresholds is None:
+        thresholds = get_thresholds()
+
+    n = len(text)
+    m = len(pattern)
+
+    # Text sangat pendek: engine dengan preprocessing paling ringan
+    if n < thresholds.short_text:
+        return 'kmp'
+
+    # Pattern periodik: bad character saja (dan verifikasi kandidat vectorized)
+    # bisa jatuh ke O(nm); dicek sebelum cabang vectorized
+    if m > 1 and pattern_period(pattern) * 2 <= m:
+        return 'bm_galil'
+
+    # Text besar: loop per karakter di Python kalah dari operasi vektor
+    if n >= thresholds.vectorized_min_text and _vectorized_search() is not None:
+        return 'vectorized'
+
+    if m <= thresholds.bndm_max_pattern:
+        return 'bndm'
+
+    # Pattern panjang dengan alfabet kecil: good suffix rule lebih berperan
+    if estimate_alphabet_size(text) <= thresholds.small_alphabet:
+        return 'bm_galil'
+
+    return 'bm'
+
+
+def search(text: str, pattern: str, algorithm: str = "auto",
+           thresholds: Optional[PlannerThresholds] = None) -> List[int]:
+    """
+    Mencari semua kemunculan pattern dengan engine yang dipilih otomatis.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+        algorithm: "auto" atau nama engine pada ENGINES / 'vectorized'
+        thresholds: Threshold planner untuk mode "auto"
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not text:
+        return []
+    if len(pattern) > len(text):
+        return []
+
+    if algorithm == "auto":
+        algorithm = choose_algorithm(text, pattern, thresholds)
+
+    if algorithm == 'vectorized':
+        engine = _vectorized_search()
+        if engine is None:
+            raise ImportError("Engine vectorized membutuhkan numpy (pip install numpy)")
+        return engine(text, pattern)
+
+    if algorithm not in ENGINES:
+        raise ValueError(
+            f"Algoritma tidak dikenal: {algorithm!r} "
+            f"(pilihan: auto, vectorized, {', '.join(sorted(ENGINES))})"
+        )
+    return ENGINES[algorithm](text, pattern)
@@ -0,0 +1,166 @@
+"""
+Rabin-Karp (Rolling Hash)
+Hash polinomial setiap window text diperbarui dalam O(1) per karakter,
+lalu dicari di himpunan fingerprint pattern. Satu scan melayani sekumpulan
+pattern dengan panjang sama, sehingga biaya per karakter tidak bergantung
+pada jumlah pattern. Setiap kandidat diverifikasi dengan perbandingan
+langsung untuk menyingkirkan collision.
+"""
+from itertools import islice
+from typing import Dict, List, Tuple
+
+
+# Modulus prima Mersenne 2^61 - 1: peluang collision per window sekitar 1 / 2^61
+MOD = (1 << 61) - 1
+BASE = 1_000_003
+
+
+def fingerprint(s: str) -> int:
+    """
+    Hash polinomial sum(ord(s[i]) * BASE^(m-1-i)) mod MOD.
+
+    Args:
+        s: String yang di-hash
+
+    Returns:
+        Nilai hash dalam rentang [0, MOD)
+    """
+    h = 0
+    for c in s:
+        h = (h * BASE + ord(c)) % MOD
+    return h
+
+
+def build_fingerprints(patterns: List[str]) -> Dict[int, List[int]]:
+    """
+    Himpunan fingerprint untuk sekumpulan pattern dengan panjang sama.
+
+    Args:
+        patterns: List pola (semua panjangnya sama, tidak kosong)
+
+    Returns:
+        Dictionary hash -> list pattern_id (pattern kembar berbagi entry)
+
+    Raises:
+        ValueError: Jika panjang pattern berbeda-beda
+    """
+    fingerprints: Dict[int, List[int]] = {}
+    if not patterns:
+        return fingerprints
+
+    m = len(patterns[0])
+    for pattern_id, pattern in enumerate(patterns):
+        if len(pattern) != m:
+            raise ValueError(
+                f"Semua pattern harus sama panjang: {len(pattern)} != {m}"
+            )
+        fingerprints.setdefault(fingerprint(pattern), []).append(pattern_id)
+    return fingerprints
+
+
+def search_with_fingerprints(text: str, m: int, fingerprints: Dict[int, List[int]],
+                             patterns: List[str]) -> List[Tuple[int, int]]:
+    """
+    Scan rolling hash dengan fingerprint pattern yang sudah dihitung.
+
+    Args:
+        text: Teks utama untuk pencarian
+        m: Panjang (sama) seluruh pattern
+        fingerprints: Dictionary hash -> list pattern_id
+        patterns: List pola, diindeks oleh pattern_id
+
+    Returns:
+        List (pattern_id, posisi awal), terurut berdasarkan posisi
+    """
+    n = len(text)
+    if m == 0 or m > n or not fingerprints:
+        return []
+
+    high = pow(BASE, m - 1, MOD)
+    results = []
+    h = fingerprint(text[:m])
+
+    def verify(s: int, ids: List[int]) -> None:
+        window = text[s:s + m]
+        for pattern_id in ids:
+            if patterns[pattern_id] == window:
+                results.append((pattern_id, s))
+
+    ids = fingerprints.get(h)
+    if ids is not None:
+        verify(0, ids)
+
+    # Window berikutnya: buang text[s - 1], tambahkan text[s + m - 1].
+    # Kode karakter dibaca lazily agar tidak ada list O(n) tambahan
+    outgoing = map(ord, text)
+    incoming = map(ord, islice(text, m, None))
+    for s, out_code, in_code in zip(range(1, n - m + 1), outgoing, incoming):
+        h = ((h - out_code * high) * BASE + in_code) % MOD
+        ids = fingerprints.get(h)
+        if ids is not None:
+            verify(s, ids)
+
+    return results
+
+
+def search_set(text: str, patterns: List[str]) -> List[Tuple[int, int]]:
+    """
+    Mencari sekumpulan pattern sama panjang (mis. shingle) dalam satu scan.
+
+    Args:
+        text: Teks utama untuk pencarian
+        patterns: List pola dengan panjang sama
+
+    Returns:
+        List (pattern_id, posisi awal) untuk setiap kemunculan,
+        terurut berdasarkan posisi lalu pattern_id
+
+    Raises:
+        ValueError: Jika panjang pattern berbeda-beda
+    """
+    if not patterns:
+        return []
+
+    # Validasi panjang dulu: pattern kosong bercampur pattern lain tetap ValueError
+    fingerprints = build_fingerprints(patterns)
+    if not text:
+        return []
+    return search_with_fingerprints(text, len(patterns[0]), fingerprints, patterns)
+
+
+def search_with_fingerprint(text: str, pattern: str, h: int) -> List[int]:
+    """
+    Pencarian satu pattern dengan fingerprint yang sudah dihitung.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari (tidak kosong)
+        h: Hasil fingerprint(pattern)
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    matches = search_with_fingerprints(text, len(pattern), {h: [0]}, [pattern])
+    return [position for _, position in matches]
+
+
+def search(text: str, pattern: str) -> List[int]:
+    """
+    Mencari semua kemunculan pattern dalam text menggunakan Rabin-Karp.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not text:
+        return []
+    if len(pattern) > len(text):
+        return []
+
+    return search_with_fingerprint(text, pattern, fingerprint(pattern))
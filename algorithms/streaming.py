@@ -0,0 +1,162 @@
+"""
+Streaming Search
+Pencarian pattern pada file, socket, atau iterator secara per-chunk
+dengan memori O(chunk + m)
+"""
+from typing import Iterable, Iterator, Union
+
+from .kmp_iterative import compute_failure_function
+from .compiled import compile
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+Pattern = Union[str, bytes]
+
+
+def iter_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Pattern]:
+    """
+    Membaca source menjadi chunk berukuran tetap.
+
+    Args:
+        source: File-like (punya read), socket (punya recv), atau iterable chunk
+        chunk_size: Ukuran maksimum setiap chunk
+
+    Returns:
+        Iterator chunk str/bytes
+    """
+    if hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    elif hasattr(source, 'recv'):
+        while True:
+            chunk = source.recv(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+def kmp_stream(chunks: Iterable[Pattern], pattern: Pattern) -> Iterator[int]:
+    """
+    KMP streaming: state j dibawa melewati batas chunk.
+
+    Args:
+        chunks: Iterable chunk text (tipe sama dengan pattern)
+        pattern: Pola yang dicari
+
+    Returns:
+        Iterator offset absolut awal setiap match
+    """
+    m = len(pattern)
+    if m == 0:
+        return
+
+    failure = compute_failure_function(pattern)
+    j = 0  # indeks di pattern, dipertahankan antar chunk
+    offset = 0  # offset absolut awal chunk saat ini
+
+    for chunk in chunks:
+        for i, c in enumerate(chunk):
+            # Mundur sampai menemukan prefix yang cocok atau j = 0
+            while j > 0 and c != pattern[j]:
+                j = failure[j - 1]
+
+            if c == pattern[j]:
+                j += 1
+
+            if j == m:
+                yield offset + i - m + 1
+                j = failure[j - 1]
+
+        offset += len(chunk)
+
+
+def overlap_stream(chunks: Iterable[Pattern], pattern: Pattern,
+                   algorithm: str = 'bm') -> Iterator[int]:
+    """
+    Streaming untuk engine berbasis window (Boyer-Moore dan lainnya).
+
+    Setiap chunk digabung dengan (m - 1) karakter terakhir chunk sebelumnya,
+    sehingga match yang melintasi batas chunk tetap ditemukan tepat satu kali.
+
+    Args:
+        chunks: Iterable chunk text (tipe sama dengan pattern)
+        pattern: Pola yang dicari
+        algorithm: Nama engine pada compiled.ENGINES
+
+    Returns:
+        Iterator offset absolut awal setiap match
+    """
+    m = len(pattern)
+    if m == 0:
+        return
+
+    matcher = compile(pattern, algorithm)
+    tail = pattern[:0]  # str/bytes kosong sesuai tipe pattern
+    offset = 0  # offset absolut karakter setelah tail
+
+    for chunk in chunks:
+        buffer = tail + chunk
+        base = offset - len(tail)
+
+        # Tail hanya m - 1 karakter, jadi setiap match di buffer adalah match baru
+        for pos in matcher.search(buffer):
+            yield base + pos
+
+        offset += len(chunk)
+        tail = buffer[max(0, len(buffer) - (m - 1)):]
+
+
+def search_stream(source, pattern: Pattern, algorithm: str = 'kmp',
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[int]:
+    """
+    Mencari pattern pada source secara streaming.
+
+    Args:
+        source: File-like, socket, atau iterable chunk
+        pattern: Pola yang dicari (str untuk text mode, bytes untuk binary)
+        algorithm: 'kmp' (state dibawa antar chunk) atau engine lain
+                   pada compiled.ENGINES (overlap m - 1 karakter)
+        chunk_size: Ukuran chunk yang dibaca setiap kali
+
+    Returns:
+        Iterator offset absolut awal setiap match
+    """
+    chunks = iter_chunks(source, chunk_size)
+    if algorithm == 'kmp':
+        return kmp_stream(chunks, pattern)
+    return overlap_stream(chunks, pattern, algorithm)
+
+
+def search_file(path: str, pattern: Pattern, algorithm: str = 'kmp',
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                encoding: str = 'utf-8') -> Iterator[int]:
+    """
+    Mencari pattern dalam file tanpa memuat seluruh isinya ke memori.
+
+    Offset dalam karakter untuk pattern str, dan dalam byte untuk pattern bytes.
+
+    Args:
+        path: Path file
+        pattern: Pola yang dicari
+        algorithm: Nama engine (lihat search_stream)
+        chunk_size: Ukuran chunk yang dibaca setiap kali
+        encoding: Encoding file untuk pattern str
+
+    Returns:
+        Iterator offset absolut awal setiap match
+    """
+    if isinstance(pattern, bytes):
+        f = open(path, 'rb')
+    else:
+        f = open(path, 'r', encoding=encoding, newline='')
+
+    with f:
+        yield from search_stream(f, pattern, algorithm, chunk_size)
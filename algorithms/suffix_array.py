@@ -0,0 +1,187 @@
+"""
+Suffix Array Index
+Index untuk banyak query pada corpus yang tetap: suffix array dibangun sekali
+dengan prefix doubling + counting sort, O(n log n), lalu setiap query
+dijawab dengan binary search, O(m log n), tanpa memindai ulang text.
+"""
+from array import array
+from typing import List
+import struct
+
+# Header file index: magic, typecode array, panjang text (byte UTF-8)
+_MAGIC = b'SAIDX1'
+_HEADER = struct.Struct('<6scxQ')
+
+
+def _typecode(n: int) -> str:
+    """Typecode array terkecil yang dapat menampung offset 0..n-1"""
+    return 'i' if n < 2 ** 31 else 'q'
+
+
+def build_suffix_array(text: str) -> array:
+    """
+    Membangun suffix array dengan prefix doubling.
+
+    Setiap putaran mengurutkan suffix berdasarkan 2k karakter pertama memakai
+    rank k karakter sebelumnya: kunci kedua didapat langsung dari urutan
+    putaran lalu, kunci pertama diurutkan stabil dengan counting sort.
+    Maksimal log n putaran, masing-masing O(n).
+
+    Args:
+        text: Teks yang diindeks
+
+    Returns:
+        array offset awal suffix dalam urutan leksikografis
+    """
+    n = len(text)
+    if n == 0:
+        return array('i')
+
+    # Rank awal = urutan karakter (0 dicadangkan untuk "lewat akhir text")
+    alphabet = sorted(set(text))
+    code = {c: i + 1 for i, c in enumerate(alphabet)}
+    rank = [code[c] for c in text]
+    sa = sorted(range(n), key=rank.__getitem__)
+    classes = len(alphabet)
+
+    k = 1
+    while classes < n:
+        # Kunci kedua: suffix yang sisa panjangnya < k (rank 0) lebih dulu,
+        # lalu i = p - k mengikuti urutan p pada putaran sebelumnya
+        second = list(range(n - k, n))
+        second.extend(p - k for p in sa if p >= k)
+
+        # Counting sort stabil berdasarkan kunci pertama (rank[i])
+        start = [0] * (classes + 2)
+        for r in rank:
+            start[r + 1] += 1
+        for c in range(1, classes + 2):
+            start[c] += start[c - 1]
+        sa = [0] * n
+        for i in second:
+            r = rank[i]
+            sa[start[r]] = i
+            start[r] += 1
+
+        # Rank baru: naik setiap kali pasangan (rank[i], rank[i + k]) berubah
+        padded = rank + [0] * k
+        new_rank = [0] * n
+        prev = sa[0]
+        classes = 1
+        new_rank[prev] = 1
+        for i in sa[1:]:
+            if padded[i] != padded[prev] or padded[i + k] != padded[prev + k]:
+                classes += 1
+            new_rank[i] = classes
+            prev = i
+        rank = new_rank
+        k *= 2
+
+    return array(_typecode(n), sa)
+
+
+class SuffixArrayIndex:
+    """
+    Index suffix array atas satu text yang tetap.
+
+    Contoh:
+        index = SuffixArrayIndex("banana")
+        index.search("ana")   # [1, 3]
+        index.save("corpus.saidx")
+        index = SuffixArrayIndex.load("corpus.saidx")
+    """
+
+    __slots__ = ('text', 'sa')
+
+    def __init__(self, text: str, sa: array = None):
+        self.text = text
+        self.sa = sa if sa is not None else build_suffix_array(text)
+
+    def _bounds(self, pattern: str) -> tuple:
+        """Rentang [lo, hi) pada suffix array yang diawali pattern"""
+        text = self.text
+        sa = self.sa
+        m = len(pattern)
+
+        # Batas bawah: suffix pertama dengan prefix >= pattern
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            s = sa[mid]
+            if text[s:s + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+
+        # Batas atas: suffix pertama dengan prefix > pattern
+        hi = len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            s = sa[mid]
+            if text[s:s + m] == pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def search(self, pattern: str) -> List[int]:
+        """
+        Mencari semua kemunculan pattern, O(m log n + occ log occ).
+
+        Returns:
+            List indeks awal (terurut, sama dengan kmp_iterative.search)
+        """
+        if not pattern or not self.text or len(pattern) > len(self.text):
+            return []
+        lo, hi = self._bounds(pattern)
+        return sorted(self.sa[lo:hi])
+
+    def count(self, pattern: str) -> int:
+        """Jumlah kemunculan pattern tanpa membuat list posisi, O(m log n)"""
+        if not pattern or not self.text or len(pattern) > len(self.text):
+            return 0
+        lo, hi = self._bounds(pattern)
+        return hi - lo
+
+    def save(self, path: str) -> int:
+        """
+        Menyimpan text dan suffix array ke satu file biner.
+
+        Returns:
+            Ukuran file dalam byte
+        """
+        data = self.text.encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, self.sa.typecode.encode('ascii'), len(data)))
+            f.write(data)
+            self.sa.tofile(f)
+            return f.tell()
+
+    @classmethod
+    def load(cls, path: str) -> 'SuffixArrayIndex':
+        """Memuat index dari file hasil save() tanpa membangun ulang"""
+        with open(path, 'rb') as f:
+            magic, typecode, size = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"Bukan file suffix array index: {path}")
+            text = f.read(size).decode('utf-8')
+            sa = array(typecode.decode('ascii'))
+            sa.frombytes(f.read())
+        if len(sa) != len(text):
+            raise ValueError(f"File index rusak: {path}")
+        return cls(text, sa)
+
+
+def search(text: str, pattern: str) -> List[int]:
+    """
+    Membangun index lalu mencari pattern (untuk perbandingan dengan engine scan).
+
+    Untuk banyak query pada text yang sama, buat SuffixArrayIndex sekali.
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    if not pattern or not text or len(pattern) > len(text):
+        return []
+    return SuffixArrayIndex(text).search(pattern)
@@ -0,0 +1,63 @@
+"""
+Trampoline Utility
+Menjalankan fungsi rekursif-ekor (tail recursive) dalam loop
+sehingga kedalaman stack C tetap konstan, serta context manager untuk
+menaikkan recursion limit sementara bagi versi rekursif biasa
+"""
+from contextlib import contextmanager
+import sys
+
+
+# Recursion limit yang dibutuhkan versi rekursif (non-trampoline) untuk input besar
+RECURSION_LIMIT = 20000
+
+
+class Bounce:
+    """Representasi pemanggilan rekursif berikutnya yang belum dijalankan"""
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+
+def trampoline(func, *args):
+    """
+    Menjalankan func(*args) sampai hasilnya bukan lagi Bounce.
+
+    Setiap langkah rekursif mengembalikan Bounce(f, ...) alih-alih memanggil
+    f(...) secara langsung, sehingga tidak ada frame yang menumpuk dan
+    recursion limit global tidak perlu diubah.
+
+    Args:
+        func: Fungsi langkah pertama
+        *args: Argumen untuk func
+
+    Returns:
+        Nilai akhir dari rantai rekursi
+    """
+    result = func(*args)
+    while isinstance(result, Bounce):
+        result = result.func(*result.args)
+    return result
+
+
+@contextmanager
+def recursion_limit(limit: int = RECURSION_LIMIT):
+    """
+    Menaikkan sys.getrecursionlimit() selama blok with, lalu mengembalikannya.
+
+    Limit tidak pernah diturunkan: jika limit saat ini sudah lebih besar,
+    nilainya dibiarkan.
+
+    Args:
+        limit: Recursion limit minimum di dalam blok
+    """
+    previous = sys.getrecursionlimit()
+    if limit > previous:
+        sys.setrecursionlimit(limit)
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(previous)
@@ -0,0 +1,173 @@
+"""
+Two-Way String Matching (Crochemore-Perrin)
+Pattern dibagi pada critical factorization x = u·v; v dicocokkan dari kiri
+ke kanan, lalu u dari kanan ke kiri. Waktu O(n + m) dengan ruang tambahan
+O(1): preprocessing hanya menghasilkan tiga bilangan (posisi faktorisasi,
+periode, dan flag periodik), tanpa tabel per karakter seperti KMP/BM.
+"""
+from typing import List, Tuple
+
+
+# Perbandingan prefix dilakukan per potongan agar tetap cepat (slice di C)
+# tanpa membuat salinan pattern sepanjang m
+_COMPARE_CHUNK = 4096
+
+
+def _maximal_suffix(pattern: str, reverse: bool) -> Tuple[int, int]:
+    """
+    Suffix maksimal pattern menurut urutan karakter (atau kebalikannya).
+
+    Args:
+        pattern: Pola yang dicari
+        reverse: True untuk urutan karakter terbalik
+
+    Returns:
+        Tuple (posisi sebelum suffix maksimal, periode suffix tersebut)
+    """
+    m = len(pattern)
+    ms = -1  # suffix maksimal dimulai di ms + 1
+    j = 0
+    k = 1
+    p = 1
+
+    while j + k < m:
+        a = pattern[j + k]
+        b = pattern[ms + k]
+        if (a > b) if reverse else (a < b):
+            # Suffix kandidat lebih kecil: lompati seluruh blok yang sudah dibaca
+            j += k
+            k = 1
+            p = j - ms
+        elif a == b:
+            if k != p:
+                k += 1
+            else:
+                j += p
+                k = 1
+        else:
+            # Suffix kandidat lebih besar: suffix maksimal baru mulai di j + 1
+            ms = j
+            j = ms + 1
+            k = 1
+            p = 1
+
+    return ms, p
+
+
+def _equal_ranges(pattern: str, a: int, b: int, length: int) -> bool:
+    """pattern[a:a+length] == pattern[b:b+length] dengan memori tambahan terbatas"""
+    for offset in range(0, length, _COMPARE_CHUNK):
+        size = min(_COMPARE_CHUNK, length - offset)
+        if pattern[a + offset:a + offset + size] != pattern[b + offset:b + offset + size]:
+            return False
+    return True
+
+
+def critical_factorization(pattern: str) -> Tuple[int, int, bool]:
+    """
+    Menghitung critical factorization dan periode pattern.
+
+    Posisi faktorisasi adalah yang lebih kanan dari dua suffix maksimal
+    (urutan normal dan terbalik); dijamin merupakan posisi kritis.
+
+    Args:
+        pattern: Pola yang dicari (tidak kosong)
+
+    Returns:
+        Tuple (ell, period, periodic) dengan u = pattern[:ell + 1].
+        periodic True jika u muncul lagi di posisi period (period adalah
+        periode pattern); jika False, period adalah pergeseran aman
+        max(|u|, |v|) + 1
+    """
+    m = len(pattern)
+    ms1, p1 = _maximal_suffix(pattern, reverse=False)
+    ms2, p2 = _maximal_suffix(pattern, reverse=True)
+    if ms1 > ms2:
+        ell, period = ms1, p1
+    else:
+        ell, period = ms2, p2
+
+    if ell + 1 + period <= m and _equal_ranges(pattern, 0, period, ell + 1):
+        return ell, period, True
+    return ell, max(ell + 1, m - ell - 1) + 1, False
+
+
+def search_with_factorization(text: str, pattern: str, ell: int, period: int,
+                              periodic: bool) -> List[int]:
+    """
+    Pencarian Two-Way dengan faktorisasi yang sudah dihitung.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari (tidak kosong)
+        ell, period, periodic: Hasil critical_factorization(pattern)
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    n = len(text)
+    m = len(pattern)
+    results = []
+    s = 0
+
+    if periodic:
+        # memory: prefix pattern[:memory + 1] sudah pasti cocok dari shift sebelumnya
+        memory = -1
+        while s <= n - m:
+            # Bagian kanan v, dari kiri ke kanan
+            i = max(ell, memory) + 1
+            while i < m and pattern[i] == text[s + i]:
+                i += 1
+            if i < m:
+                s += i - ell
+                memory = -1
+                continue
+
+            # Bagian kiri u, dari kanan ke kiri
+            i = ell
+            while i > memory and pattern[i] == text[s + i]:
+                i -= 1
+            if i <= memory:
+                results.append(s)
+            s += period
+            memory = m - period - 1
+    else:
+        while s <= n - m:
+            i = ell + 1
+            while i < m and pattern[i] == text[s + i]:
+                i += 1
+            if i < m:
+                s += i - ell
+                continue
+
+            i = ell
+            while i >= 0 and pattern[i] == text[s + i]:
+                i -= 1
+            if i < 0:
+                results.append(s)
+            s += period
+
+    return results
+
+
+def search(text: str, pattern: str) -> List[int]:
+    """
+    Mencari semua kemunculan pattern dalam text menggunakan algoritma Two-Way.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not text:
+        return []
+    if len(pattern) > len(text):
+        return []
+
+    ell, period, periodic = critical_factorization(pattern)
+    return search_with_factorization(text, pattern, ell, period, periodic)
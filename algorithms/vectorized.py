@@ -0,0 +1,112 @@
+"""
+NumPy Vectorized Algorithm
+Filter kandidat window secara massal (karakter pertama, terakhir, dan paling
+jarang), lalu verifikasi kandidat yang tersisa juga secara vektor
+"""
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy opsional, engine ini tidak tersedia tanpanya
+    np = None
+
+
+AVAILABLE = np is not None
+
+# Jumlah karakter awal text yang dipakai untuk memperkirakan frekuensi
+SAMPLE_SIZE = 64 * 1024
+
+
+def text_to_array(text: str) -> 'np.ndarray':
+    """
+    Mengubah text menjadi array integer tanpa loop Python.
+
+    Text ASCII menjadi uint8 (1 byte per karakter), selain itu uint32 (code point).
+
+    Args:
+        text: Teks yang dikonversi
+
+    Returns:
+        Array NumPy 1 dimensi dengan panjang len(text)
+    """
+    if text.isascii():
+        return np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+
+def _pattern_to_array(pattern: str, dtype) -> Optional['np.ndarray']:
+    """Konversi pattern ke dtype text; None jika pattern tidak mungkin muncul"""
+    if dtype == np.uint8:
+        if not pattern.isascii():
+            return None
+        return np.frombuffer(pattern.encode('ascii'), dtype=np.uint8)
+    return np.frombuffer(pattern.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+
+def _rarest_index(t: 'np.ndarray', p: 'np.ndarray') -> int:
+    """Indeks karakter pattern yang paling jarang muncul di sampel text"""
+    sample = t[:SAMPLE_SIZE]
+    best_index = 0
+    best_count = None
+    seen = set()
+
+    for i, c in enumerate(p.tolist()):
+        if c in seen:
+            continue
+        seen.add(c)
+        count = int(np.count_nonzero(sample == c))
+        if best_count is None or count < best_count:
+            best_index = i
+            best_count = count
+
+    return best_index
+
+
+def search(text: str, pattern: str) -> List[int]:
+    """
+    Mencari semua kemunculan pattern dalam text menggunakan operasi vektor NumPy.
+
+    Args:
+        text: Teks utama untuk pencarian
+        pattern: Pola yang dicari
+
+    Returns:
+        List indeks awal di mana pattern ditemukan
+    """
+    if np is None:
+        raise ImportError("Engine vectorized membutuhkan numpy (pip install numpy)")
+
+    # Handle edge cases
+    if not pattern:
+        return []
+    if not text:
+        return []
+    if len(pattern) > len(text):
+        return []
+
+    n = len(text)
+    m = len(pattern)
+
+    t = text_to_array(text)
+    p = _pattern_to_array(pattern, t.dtype)
+    if p is None:
+        return []
+
+    windows = n - m + 1
+    rare = _rarest_index(t, p)
+
+    # Tahap 1: filter kandidat dengan karakter pertama, terakhir, dan paling jarang
+    mask = t[:windows] == p[0]
+    for k in {m - 1, rare} - {0}:
+        mask &= t[k:k + windows] == p[k]
+    candidates = np.flatnonzero(mask)
+
+    # Tahap 2: verifikasi posisi sisanya hanya pada kandidat yang selamat
+    for k in range(1, m - 1):
+        if candidates.size == 0:
+            break
+        if k == rare:
+            continue
+        candidates = candidates[t[candidates + k] == p[k]]
+
+    return candidates.tolist()
@@ -1,2 +1,2 @@
 # Benchmark Module
-from .runner import BenchmarkRunner, BenchmarkResult
+from .runner import BenchmarkRunner, BenchmarkResult, default_algorithms
@@ -0,0 +1,144 @@
+"""
+Planner Calibration
+Menyesuaikan threshold algorithms.planner dengan hasil BenchmarkRunner
+pada mesin yang sedang dipakai
+"""
+import gc
+import statistics
+import string
+from typing import Callable, List, Optional, Tuple
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms import kmp_iterative, bm_iterative, bitparallel, vectorized
+from algorithms.planner import PlannerThresholds, DEFAULT_THRESHOLDS_PATH, set_thresholds
+from benchmark.runner import BenchmarkRunner
+from utils.text_generator import generate_random_text, generate_pattern
+
+
+def _median_times(runner: BenchmarkRunner, challenger: Callable, incumbent: Callable,
+                  text: str, pattern: str) -> Tuple[float, float]:
+    """
+    Median waktu per pemanggilan (μs) dua algoritma dari runner.iterations sampel.
+
+    Sampel kedua algoritma diambil bergantian agar gangguan sesaat pada mesin
+    mengenai keduanya, bukan hanya satu pihak.
+
+    Returns:
+        Tuple (median challenger, median incumbent)
+    """
+    algorithms = (challenger, incumbent)
+    numbers = []
+    for algorithm in algorithms:
+        for _ in range(runner.warmup):
+            algorithm(text, pattern)
+        numbers.append(runner.autorange(algorithm, text, pattern))
+
+    samples = ([], [])
+    gc_was_enabled = gc.isenabled()
+    if runner.disable_gc:
+        gc.disable()
+    try:
+        for _ in range(max(runner.iterations, 1)):
+            for algorithm, number, times in zip(algorithms, numbers, samples):
+                times.append(runner.run_sample(algorithm, text, pattern, number))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return statistics.median(samples[0]), statistics.median(samples[1])
+
+
+def _wins(runner: BenchmarkRunner, challenger: Callable, incumbent: Callable,
+          text: str, pattern: str) -> bool:
+    """True jika median challenger tidak lebih lambat dari median incumbent"""
+    challenger_time, incumbent_time = _median_times(runner, challenger, incumbent,
+                                                    text, pattern)
+    return challenger_time <= incumbent_time
+
+
+def _first_winning_size(runner: BenchmarkRunner, challenger: Callable,
+                        incumbent: Callable, sizes: List[int],
+                        pattern_length: int) -> Optional[int]:
+    """Ukuran text terkecil di mana challenger tidak lebih lambat dari incumbent"""
+    pattern = generate_pattern(pattern_length)
+    for size in sizes:
+        text = generate_random_text(size)
+        if _wins(runner, challenger, incumbent, text, pattern):
+            return size
+    return None
+
+
+def calibrate(runner: Optional[BenchmarkRunner] = None,
+              save_path: Optional[str] = DEFAULT_THRESHOLDS_PATH) -> PlannerThresholds:
+    """
+    Mengukur titik perpindahan antar engine dan menyimpannya sebagai threshold planner.
+
+    Args:
+        runner: BenchmarkRunner yang dipakai untuk pengukuran
+        save_path: File JSON tujuan (None = tidak disimpan)
+
+    Returns:
+        PlannerThresholds hasil kalibrasi (juga langsung dipakai oleh planner)
+    """
+    if runner is None:
+        runner = BenchmarkRunner(iterations=5)
+
+    defaults = PlannerThresholds()
+
+    # 1. Text pendek: kapan BNDM mulai mengalahkan KMP
+    print("Kalibrasi short_text...")
+    short_sizes = [8, 16, 32, 64, 128, 256, 512, 1024]
+    size = _first_winning_size(runner, bitparallel.search_bndm, kmp_iterative.search,
+                               short_sizes, pattern_length=5)
+    short_text = size if size is not None else short_sizes[-1] * 2
+
+    # 2. Text besar: kapan NumPy mulai mengalahkan BNDM
+    vectorized_min_text = defaults.vectorized_min_text
+    if vectorized.AVAILABLE:
+        print("Kalibrasi vectorized_min_text...")
+        large_sizes = [1_000, 3_000, 10_000, 30_000, 100_000, 300_000, 1_000_000]
+        size = _first_winning_size(runner, vectorized.search, bitparallel.search_bndm,
+                                   large_sizes, pattern_length=10)
+        vectorized_min_text = size if size is not None else large_sizes[-1] * 2
+
+    # 3. Panjang pattern: BNDM selama masih lebih cepat dari Boyer-Moore.
+    # Scan berhenti pada kekalahan pertama agar kemenangan kebetulan di m besar
+    # tidak ikut mengarahkan m yang lebih kecil (yang kalah) ke BNDM
+    print("Kalibrasi bndm_max_pattern...")
+    text = generate_random_text(20_000)
+    bndm_max_pattern = 0
+    for m in [2, 4, 8, 16, 32, bitparallel.WORD_SIZE]:
+        pattern = generate_pattern(m)
+        if not _wins(runner, bitparallel.search_bndm, bm_iterative.search, text, pattern):
+            break
+        bndm_max_pattern = m
+
+    # 4. Alfabet kecil: Galil (good suffix) lebih cepat dari bad character saja
+    # (juga berhenti pada kekalahan pertama)
+    print("Kalibrasi small_alphabet...")
+    small_alphabet = 0
+    for k in [2, 4, 8, 16, 26]:
+        alphabet = string.ascii_lowercase[:k]
+        text = generate_random_text(20_000, alphabet)
+        pattern = generate_pattern(2 * bitparallel.WORD_SIZE, alphabet)
+        if not _wins(runner, bm_iterative.search_galil, bm_iterative.search, text, pattern):
+            break
+        small_alphabet = k
+
+    thresholds = PlannerThresholds(
+        short_text=short_text,
+        vectorized_min_text=vectorized_min_text,
+        bndm_max_pattern=bndm_max_pattern,
+        small_alphabet=small_alphabet,
+    )
+    set_thresholds(thresholds)
+
+    if save_path:
+        thresholds.save(save_path)
+        print(f"Thresholds saved to {save_path}")
+
+    return thresholds
@@ -0,0 +1,270 @@
+"""
+Benchmark History Module
+Menyimpan setiap run benchmark di SQLite (output/data/benchmark_history.sqlite)
+dan mendeteksi regresi performa antar run
+
+Pemakaian:
+    python -m benchmark.history list
+    python -m benchmark.history compare [--baseline ID] [--candidate ID] [--threshold 0.10]
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+import argparse
+import math
+import platform
+import socket
+import sqlite3
+import subprocess
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.runner import BenchmarkResult
+
+
+DEFAULT_DB_PATH = "output/data/benchmark_history.sqlite"
+
+# Nilai kritis t satu sisi untuk alpha = 0.05, per derajat kebebasan
+T_CRITICAL_05 = [
+    (1, 6.314), (2, 2.920), (3, 2.353), (4, 2.132), (5, 2.015), (6, 1.943),
+    (7, 1.895), (8, 1.860), (9, 1.833), (10, 1.812), (12, 1.782), (15, 1.753),
+    (20, 1.725), (30, 1.697), (60, 1.671), (120, 1.658),
+]
+Z_CRITICAL_05 = 1.645
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    git_commit TEXT,
+    python_version TEXT,
+    host TEXT,
+    label TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    algorithm TEXT NOT NULL,
+    input_size INTEGER NOT NULL,
+    pattern_length INTEGER NOT NULL,
+    pattern_count INTEGER NOT NULL,
+    mean_us REAL,
+    median_us REAL,
+    stddev_us REAL,
+    min_us REAL,
+    p95_us REAL,
+    samples INTEGER,
+    failed_runs INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+"""
+
+
+@dataclass
+class Regression:
+    """Perbandingan satu sel (algoritma, ukuran) antara dua run"""
+    algorithm: str
+    input_size: int
+    pattern_length: int
+    baseline_us: float
+    candidate_us: float
+    slowdown: float      # (candidate / baseline) - 1
+    t_statistic: float
+    significant: bool
+
+
+def _git_commit() -> str:
+    """Hash commit git saat ini, atau string kosong di luar repository"""
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                             text=True, timeout=5,
+                             cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    except (OSError, subprocess.SubprocessError):
+        return ''
+    return out.stdout.strip() if out.returncode == 0 else ''
+
+
+def connect(db_path: str = DEFAULT_DB_PATH) -> sqlite3.Connection:
+    """Membuka database history (dibuat jika belum ada)"""
+    os.makedirs(os.path.dirname(db_path) if os.path.dirname(db_path) else '.', exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def save_run(results: List[BenchmarkResult], db_path: str = DEFAULT_DB_PATH,
+             label: str = '') -> int:
+    """
+    Menyimpan hasil benchmark sebagai satu run baru.
+
+    Args:
+        results: List BenchmarkResult
+        db_path: Path database SQLite
+        label: Keterangan bebas untuk run ini
+
+    Returns:
+        ID run yang baru disimpan
+    """
+    with connect(db_path) as conn:
+        cursor = conn.execute(
+            "INSERT INTO runs (timestamp, git_commit, python_version, host, label) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (datetime.now(timezone.utc).isoformat(timespec='seconds'), _git_commit(),
+             platform.python_version(), socket.gethostname(), label)
+        )
+        run_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(run_id, r.algorithm_name, r.input_size, r.pattern_length, r.pattern_count,
+              r.execution_time if math.isfinite(r.execution_time) else None,
+              r.median_time if math.isfinite(r.median_time) else None,
+              r.stddev, r.min_time if math.isfinite(r.min_time) else None,
+              r.p95_time if math.isfinite(r.p95_time) else None,
+              r.iterations - r.failed_runs, r.failed_runs)
+             for r in results]
+        )
+    print(f"Run {run_id} saved to {db_path}")
+    return run_id
+
+
+def list_runs(db_path: str = DEFAULT_DB_PATH) -> List[tuple]:
+    """Daftar run: (id, timestamp, git_commit, python_version, host, label)"""
+    with connect(db_path) as conn:
+        return conn.execute(
+            "SELECT id, timestamp, git_commit, python_version, host, label "
+            "FROM runs ORDER BY id"
+        ).fetchall()
+
+
+def _t_critical(df: float) -> float:
+    """Nilai kritis t (alpha = 0.05 satu sisi), dibulatkan ke df tabel di bawahnya"""
+    critical = T_CRITICAL_05[0][1]
+    for table_df, value in T_CRITICAL_05:
+        if df >= table_df:
+            critical = value
+    return critical if df < 1000 else Z_CRITICAL_05
+
+
+def welch_t(mean_a: float, sd_a: float, n_a: int,
+            mean_b: float, sd_b: float, n_b: int) -> tuple:
+    """
+    Uji t Welch untuk selisih rata-rata b - a.
+
+    Returns:
+        Tuple (statistik t, derajat kebebasan)
+    """
+    var_a = sd_a ** 2 / n_a
+    var_b = sd_b ** 2 / n_b
+    se = math.sqrt(var_a + var_b)
+    if se == 0:
+        return (math.inf if mean_b > mean_a else 0.0), math.inf
+
+    t = (mean_b - mean_a) / se
+    denom = 0.0
+    if n_a > 1:
+        denom += var_a ** 2 / (n_a - 1)
+    if n_b > 1:
+        denom += var_b ** 2 / (n_b - 1)
+    df = (var_a + var_b) ** 2 / denom if denom > 0 else math.inf
+    return t, df
+
+
+def compare(baseline_id: int, candidate_id: int,
+            db_path: str = DEFAULT_DB_PATH) -> List[Regression]:
+    """
+    Membandingkan dua run per (algoritma, ukuran input, panjang pattern).
+
+    Args:
+        baseline_id: ID run acuan
+        candidate_id: ID run yang diuji
+        db_path: Path database SQLite
+
+    Returns:
+        List Regression untuk setiap sel yang ada di kedua run
+    """
+    query = ("SELECT algorithm, input_size, pattern_length, pattern_count, "
+             "mean_us, stddev_us, samples FROM results WHERE run_id = ?")
+    with connect(db_path) as conn:
+        baseline = {row[:4]: row[4:] for row in conn.execute(query, (baseline_id,))}
+        candidate = {row[:4]: row[4:] for row in conn.execute(query, (candidate_id,))}
+
+    comparisons = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        mean_a, sd_a, n_a = baseline[key]
+        mean_b, sd_b, n_b = candidate[key]
+        if mean_a is None or mean_b is None or not n_a or not n_b:
+            continue
+
+        t, df = welch_t(mean_a, sd_a or 0.0, n_a, mean_b, sd_b or 0.0, n_b)
+        comparisons.append(Regression(
+            algorithm=key[0],
+            input_size=key[1],
+            pattern_length=key[2],
+            baseline_us=mean_a,
+            candidate_us=mean_b,
+            slowdown=mean_b / mean_a - 1 if mean_a > 0 else 0.0,
+            t_statistic=t,
+            significant=t > _t_critical(df),
+        ))
+
+    return comparisons
+
+
+def find_regressions(comparisons: List[Regression],
+                     threshold: float = 0.10) -> List[Regression]:
+    """Sel yang signifikan lebih lambat dan melewati threshold (0.10 = 10%)"""
+    return [c for c in comparisons if c.significant and c.slowdown > threshold]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point command line; return exit code (1 jika ada regresi)"""
+    parser = argparse.ArgumentParser(description="Riwayat benchmark dan deteksi regresi")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="path database SQLite")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('list', help="tampilkan semua run")
+
+    cmp_parser = sub.add_parser('compare', help="bandingkan dua run")
+    cmp_parser.add_argument('--baseline', type=int, help="ID run acuan (default: run kedua terakhir)")
+    cmp_parser.add_argument('--candidate', type=int, help="ID run yang diuji (default: run terakhir)")
+    cmp_parser.add_argument('--threshold', type=float, default=0.10,
+                            help="batas perlambatan relatif (default 0.10 = 10%%)")
+
+    args = parser.parse_args(argv)
+
+    runs = list_runs(args.db)
+    if args.command == 'list':
+        for run in runs:
+            print(" | ".join(str(v) for v in run))
+        return 0
+
+    run_ids = [run[0] for run in runs]
+    candidate_id = args.candidate if args.candidate is not None else (run_ids[-1] if run_ids else None)
+    baseline_id = args.baseline
+    if baseline_id is None:
+        earlier = [i for i in run_ids if candidate_id is not None and i < candidate_id]
+        baseline_id = earlier[-1] if earlier else None
+    if baseline_id is None or candidate_id is None:
+        print("Butuh minimal dua run untuk dibandingkan.")
+        return 2
+
+    comparisons = compare(baseline_id, candidate_id, args.db)
+    regressions = find_regressions(comparisons, args.threshold)
+
+    print(f"Run {baseline_id} -> {candidate_id}: {len(comparisons)} sel dibandingkan")
+    for c in comparisons:
+        flag = "REGRESI" if c in regressions else ""
+        print(f"  {c.algorithm:<36} n={c.input_size:<8} {c.baseline_us:>12.2f} -> "
+              f"{c.candidate_us:>12.2f} μs ({c.slowdown:+.1%}, t={c.t_statistic:.2f}) {flag}")
+
+    if regressions:
+        print(f"{len(regressions)} regresi melewati threshold {args.threshold:.0%}")
+        return 1
+    print("Tidak ada regresi signifikan.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
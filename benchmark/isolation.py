@@ -0,0 +1,172 @@
+"""
+Isolated Benchmark Module
+Menjalankan setiap sel (algoritma, ukuran input) di subprocess baru dan
+mencatat memori puncak (tracemalloc), selisih RSS, serta kedalaman rekursi maksimum
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Callable, Dict
+import multiprocessing
+import sys
+import tracemalloc
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.runner import BenchmarkRunner, BenchmarkResult
+
+try:
+    import resource
+except ImportError:  # Windows: RSS tidak diukur
+    resource = None
+
+
+def _max_rss_kb() -> int:
+    """RSS maksimum proses ini dalam KB (0 jika tidak tersedia)"""
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss dalam byte di macOS, dalam KB di Linux
+    if sys.platform == 'darwin':
+        return max_rss // 1024
+    return max_rss
+
+
+def measure_rss_delta(algorithm: Callable, text: str, pattern: str) -> int:
+    """
+    Kenaikan RSS maksimum (KB) selama satu pemanggilan algoritma.
+
+    Hanya bermakna di proses baru, karena ru_maxrss tidak pernah turun.
+    """
+    before = _max_rss_kb()
+    try:
+        algorithm(text, pattern)
+    except RecursionError:
+        pass
+    return max(0, _max_rss_kb() - before)
+
+
+def measure_peak_memory(algorithm: Callable, text: str, pattern: str) -> int:
+    """Memori puncak (byte) yang dialokasikan selama satu pemanggilan algoritma"""
+    tracemalloc.start()
+    try:
+        algorithm(text, pattern)
+    except RecursionError:
+        pass
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return peak
+
+
+def measure_retained_memory(build: Callable, *args) -> int:
+    """
+    Memori (byte) yang masih dipegang oleh objek hasil build(*args),
+    yaitu ukuran struktur data tanpa alokasi sementara selama pembuatan.
+    """
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = build(*args)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return max(0, after - before)
+
+
+def measure_recursion_depth(algorithm: Callable, text: str, pattern: str) -> int:
+    """
+    Kedalaman frame Python maksimum selama satu pemanggilan algoritma,
+    relatif terhadap frame pemanggil (1 = tanpa rekursi).
+    """
+    depth = 0
+    max_depth = 0
+
+    def profiler(frame, event, arg):
+        nonlocal depth, max_depth
+        if event == 'call':
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        elif event == 'return':
+            depth -= 1
+
+    sys.setprofile(profiler)
+    try:
+        algorithm(text, pattern)
+    except RecursionError:
+        pass
+    finally:
+        sys.setprofile(None)
+    return max_depth
+
+
+def run_isolated_cell(config: dict, name: str, algorithm: Callable,
+                      input_size: int, pattern_length: int) -> BenchmarkResult:
+    """
+    Dijalankan di subprocess baru: mengukur memori lalu waktu untuk satu sel.
+
+    Args:
+        config: Field BenchmarkRunner (iterations, warmup, seed, ...)
+        name: Nama algoritma
+        algorithm: Fungsi search (harus dapat di-pickle)
+        input_size: Ukuran input
+        pattern_length: Panjang pattern
+
+    Returns:
+        BenchmarkResult lengkap dengan kolom memori
+    """
+    runner = BenchmarkRunner(**config)
+    text = runner.make_text(input_size)
+    pattern = runner.make_pattern(pattern_length)
+
+    # Urutan penting: RSS diukur pertama selagi proses masih "bersih"
+    rss_delta = measure_rss_delta(algorithm, text, pattern)
+    peak_memory = measure_peak_memory(algorithm, text, pattern)
+    depth = measure_recursion_depth(algorithm, text, pattern)
+
+    result = runner.run_benchmark(algorithm, name, text, pattern, input_size)
+    result.peak_memory_bytes = peak_memory
+    result.rss_delta_kb = rss_delta
+    result.max_recursion_depth = depth
+    return result
+
+
+def run_isolated(runner: BenchmarkRunner, algorithms: Dict[str, Callable],
+                 pattern_length: int = 10) -> list:
+    """
+    Menjalankan semua sel (algoritma, ukuran input) masing-masing di proses baru.
+
+    Args:
+        runner: BenchmarkRunner sumber konfigurasi dan input_sizes
+        algorithms: Dictionary {nama: fungsi} algoritma
+        pattern_length: Panjang pattern
+
+    Returns:
+        List BenchmarkResult
+    """
+    config = asdict(runner)
+    # Text harus sama di semua proses, jadi mode isolasi selalu memakai seed
+    if config['seed'] is None:
+        config['seed'] = 0
+
+    # 'spawn' menjamin heap dan stack baru, bukan salinan fork dari parent
+    context = multiprocessing.get_context('spawn')
+    results = []
+
+    for input_size in runner.input_sizes:
+        print(f"Testing input size: {input_size}")
+        for name, algorithm in algorithms.items():
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(
+                    run_isolated_cell, config, name, algorithm,
+                    input_size, pattern_length
+                ).result()
+            results.append(result)
+            print(f"  {name}: {result.execution_time:.2f} μs, "
+                  f"peak {result.peak_memory_bytes / 1024:.1f} KB, "
+                  f"RSS +{result.rss_delta_kb} KB, depth {result.max_recursion_depth}")
+
+    return results
@@ -0,0 +1,202 @@
+"""
+Service Load Benchmark
+Membangkitkan beban ke server HTTP package service (keep-alive, beberapa
+client bersamaan) dan melaporkan latensi p50/p99 serta requests/sec
+
+Pemakaian:
+    python -m benchmark.load --concurrency 1,8,32 --requests 2000
+    python -m benchmark.load --url http://127.0.0.1:8765   # server yang sudah berjalan
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark.runner import _percentile
+from utils.text_generator import generate_random_text, generate_pattern
+
+
+@dataclass
+class LoadResult:
+    """Hasil satu tingkat concurrency"""
+    endpoint: str
+    concurrency: int
+    requests: int
+    errors: int
+    duration: float          # detik
+    mean_latency: float      # milidetik
+    p50_latency: float
+    p99_latency: float
+
+    @property
+    def requests_per_sec(self) -> float:
+        """Throughput dalam request per detik"""
+        return self.requests / self.duration if self.duration > 0 else 0.0
+
+
+async def _client(host: str, port: int, request: bytes, count: int,
+                  latencies: List[float]) -> int:
+    """Satu koneksi keep-alive yang mengirim count request berurutan"""
+    errors = 0
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.strip().lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+
+            latencies.append((time.perf_counter() - start) * 1000)
+            if b' 200 ' not in status_line:
+                errors += 1
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return errors
+
+
+async def run_load(host: str, port: int, endpoint: str, payload: dict,
+                   concurrency: int, requests: int) -> LoadResult:
+    """
+    Mengirim requests request ke endpoint dari concurrency koneksi paralel.
+
+    Returns:
+        LoadResult dengan latensi dalam milidetik
+    """
+    body = json.dumps(payload).encode('utf-8')
+    request = (f"POST {endpoint} HTTP/1.1\r\nHost: {host}\r\n"
+               f"Content-Type: application/json\r\n"
+               f"Content-Length: {len(body)}\r\n\r\n").encode('latin-1') + body
+
+    per_client = [requests // concurrency + (1 if i < requests % concurrency else 0)
+                  for i in range(concurrency)]
+    latencies: List[float] = []
+
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(
+        _client(host, port, request, count, latencies) for count in per_client if count
+    ))
+    duration = time.perf_counter() - start
+
+    latencies.sort()
+    return LoadResult(
+        endpoint=endpoint,
+        concurrency=concurrency,
+        requests=len(latencies),
+        errors=sum(errors),
+        duration=duration,
+        mean_latency=statistics.mean(latencies),
+        p50_latency=_percentile(latencies, 50),
+        p99_latency=_percentile(latencies, 99),
+    )
+
+
+def start_server(workers: int = 1) -> Tuple[subprocess.Popen, str, int]:
+    """Menjalankan service.server di subprocess pada port bebas"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'service', '--port', '0', '--workers', str(workers)],
+        cwd=root, stdout=subprocess.PIPE, text=True
+    )
+    line = process.stdout.readline()
+    if not line.startswith("Listening on "):
+        process.kill()
+        raise RuntimeError(f"Server gagal dijalankan: {line!r}")
+    address = urlsplit(line.split()[-1])
+    return process, address.hostname, address.port
+
+
+def benchmark_service(concurrency_levels: List[int] = None, requests: int = 2000,
+                      text_size: int = 1000, pattern_length: int = 5,
+                      endpoint: str = '/search', url: Optional[str] = None,
+                      workers: int = 1) -> List[LoadResult]:
+    """
+    Load test service.server untuk beberapa tingkat concurrency.
+
+    Args:
+        concurrency_levels: Daftar jumlah koneksi paralel
+        requests: Jumlah request per tingkat concurrency
+        text_size: Panjang text dalam setiap request
+        pattern_length: Panjang pattern
+        endpoint: '/search' atau '/multi-search'
+        url: Server yang sudah berjalan (None = jalankan server sementara)
+        workers: Jumlah worker server sementara
+
+    Returns:
+        List LoadResult
+    """
+    if concurrency_levels is None:
+        concurrency_levels = [1, 8, 32]
+
+    text = generate_random_text(text_size, seed=0)
+    pattern = generate_pattern(pattern_length, seed=1)
+    if endpoint == '/multi-search':
+        payload = {'text': text, 'patterns': [pattern, pattern[::-1], text[:pattern_length]]}
+    else:
+        payload = {'text': text, 'pattern': pattern}
+
+    process = None
+    if url is None:
+        process, host, port = start_server(workers)
+    else:
+        address = urlsplit(url)
+        host, port = address.hostname, address.port
+
+    results = []
+    try:
+        for concurrency in concurrency_levels:
+            result = asyncio.run(run_load(host, port, endpoint, payload,
+                                          concurrency, requests))
+            results.append(result)
+            print(f"  {endpoint} c={concurrency}: {result.requests_per_sec:.0f} req/s, "
+                  f"p50 {result.p50_latency:.2f} ms, p99 {result.p99_latency:.2f} ms, "
+                  f"{result.errors} error")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point command line"""
+    parser = argparse.ArgumentParser(description="Load benchmark untuk service.server")
+    parser.add_argument('--concurrency', default='1,8,32',
+                        help="tingkat concurrency, dipisah koma")
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--text-size', type=int, default=1000)
+    parser.add_argument('--pattern-length', type=int, default=5)
+    parser.add_argument('--endpoint', choices=['/search', '/multi-search'], default='/search')
+    parser.add_argument('--url', help="server yang sudah berjalan (default: jalankan sendiri)")
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    levels = [int(c) for c in args.concurrency.split(',') if c.strip()]
+    results = benchmark_service(levels, args.requests, args.text_size, args.pattern_length,
+                                args.endpoint, args.url, args.workers)
+    return 1 if any(r.errors for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,15 +4,66 @@ Untuk mengukur dan membandingkan performa algoritma
 """
 import time
 import csv
+import gc
+import math
+import random
+import statistics
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Callable, List, Dict
+from typing import Callable, List, Dict, Optional
 import sys
 import os
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from algorithms import kmp_iterative, kmp_recursive, bm_iterative, bm_recursive
+from algorithms import aho_corasick, streaming, parallel, bitparallel, vectorized
+from algorithms import two_way, rabin_karp, approximate
+from algorithms import instrumented
+from algorithms.batch import search_many
+from algorithms.suffix_array import SuffixArrayIndex
+from algorithms.compiled import compile as compile_pattern, CompiledPattern
 from utils.text_generator import generate_random_text, generate_pattern
+from utils.text_generator import generate_text, generate_worst_case
+from utils.corpus_cache import ensure_corpus, load_corpus_text
+
+
+def _percentile(sorted_times: List[float], q: float) -> float:
+    """Persentil ke-q (0-100) dengan interpolasi linear dari data terurut"""
+    if len(sorted_times) == 1:
+        return sorted_times[0]
+    pos = (len(sorted_times) - 1) * q / 100
+    lower = math.floor(pos)
+    upper = min(lower + 1, len(sorted_times) - 1)
+    return sorted_times[lower] + (sorted_times[upper] - sorted_times[lower]) * (pos - lower)
+
+
+def default_algorithms() -> Dict[str, Callable]:
+    """
+    Daftar algoritma standar yang dibandingkan oleh benchmark.
+    
+    Returns:
+        Dictionary {nama: fungsi} algoritma
+    """
+    algorithms = {
+        'KMP Iterative': kmp_iterative.search,
+        'KMP Recursive': kmp_recursive.search,
+        'Boyer-Moore Iterative': bm_iterative.search,
+        'Boyer-Moore Recursive': bm_recursive.search,
+        'Boyer-Moore Galil': bm_iterative.search_galil,
+        'Two-Way': two_way.search,
+        'Rabin-Karp': rabin_karp.search,
+        'KMP Recursive (Trampoline)': kmp_recursive.search_trampolined,
+        'Boyer-Moore Recursive (Trampoline)': bm_recursive.search_trampolined,
+        'Shift-Or': bitparallel.search_shift_or,
+        'BNDM': bitparallel.search_bndm,
+    }
+    # Engine NumPy hanya diikutkan jika numpy terpasang
+    if vectorized.AVAILABLE:
+        algorithms['NumPy Vectorized'] = vectorized.search
+    return algorithms
 
 
 @dataclass
@@ -23,6 +74,50 @@ class BenchmarkResult:
     execution_time: float  # dalam microseconds
     iterations: int
     pattern_length: int = 10
+    pattern_count: int = 1
+    alphabet: str = ''       # nama alfabet workload (mode grid)
+    distribution: str = ''   # nama distribusi workload (mode grid)
+    # Statistik sampel (microseconds per pemanggilan), hanya dari run yang berhasil
+    min_time: float = 0.0
+    median_time: float = 0.0
+    p95_time: float = 0.0
+    p99_time: float = 0.0
+    stddev: float = 0.0
+    inner_loops: int = 1     # jumlah pemanggilan per sampel (auto-range)
+    failed_runs: int = 0     # sampel yang gagal (mis. RecursionError)
+    # Jumlah operasi (hanya jika BenchmarkRunner.count_operations aktif)
+    comparisons: int = 0
+    shifts: int = 0
+    shift_distance: int = 0
+    fallbacks: int = 0
+    preprocessing_ops: int = 0
+    # Profil memori (hanya pada mode isolasi, lihat benchmark/isolation.py)
+    peak_memory_bytes: int = 0
+    rss_delta_kb: int = 0
+    max_recursion_depth: int = 0
+    # Ukuran file index di disk (hanya run_index)
+    index_bytes: int = 0
+    # Memori tabel preprocessing per pattern (hanya run_table_memory)
+    table_bytes: int = 0
+    # Jumlah kesalahan maksimum k (hanya run_approximate)
+    max_errors: int = 0
+    # Rasio waktu baseline sekuensial / waktu hasil ini (hanya run_parallel)
+    speedup: float = 0.0
+    
+    @property
+    def comparisons_per_char(self) -> float:
+        """Perbandingan karakter per karakter text (bandingkan dengan batas teoretis)"""
+        if self.input_size <= 0:
+            return 0.0
+        return self.comparisons / self.input_size
+    
+    @property
+    def throughput_mb_s(self) -> float:
+        """Throughput dalam MB/s (teks ASCII: 1 karakter = 1 byte)"""
+        if self.execution_time <= 0:
+            return 0.0
+        # karakter per microsecond = MB per second
+        return self.input_size / self.execution_time
 
 
 @dataclass
@@ -32,6 +127,28 @@ class BenchmarkRunner:
     input_sizes: List[int] = field(default_factory=lambda: [
         1, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000
     ])
+    warmup: int = 2                 # pemanggilan pemanasan sebelum pengukuran
+    min_sample_time: float = 0.001  # durasi minimum satu sampel (detik)
+    disable_gc: bool = True         # matikan GC selama pengukuran
+    count_operations: bool = False  # jalankan versi terinstrumentasi satu kali
+    seed: Optional[int] = None      # jika diisi: text dari corpus cache, pattern deterministik
+    
+    def make_text(self, size: int) -> str:
+        """
+        Text random untuk benchmark.
+        
+        Dengan seed, text dimuat dari corpus cache di output/data/corpus
+        (dibuat sekali, dipakai ulang di run berikutnya) sehingga reprodusibel.
+        """
+        if self.seed is None:
+            return generate_random_text(size)
+        return load_corpus_text(size, self.seed)
+    
+    def make_pattern(self, length: int, index: int = 0) -> str:
+        """Pattern random untuk benchmark; deterministik jika seed diisi"""
+        if self.seed is None:
+            return generate_pattern(length)
+        return generate_pattern(length, seed=self.seed * 1_000_003 + length * 1_009 + index)
     
     def run_single(self, algorithm: Callable, text: str, pattern: str) -> float:
         """
@@ -50,10 +167,45 @@ class BenchmarkRunner:
         end = time.perf_counter()
         return (end - start) * 1_000_000  # Convert to microseconds
     
+    def autorange(self, algorithm: Callable, text: str, pattern: str) -> int:
+        """
+        Menentukan jumlah pemanggilan per sampel (seperti timeit.autorange).
+        
+        Jumlah dinaikkan 1, 2, 5, 10, 20, 50, ... sampai satu sampel
+        berlangsung minimal min_sample_time detik.
+        
+        Returns:
+            Jumlah pemanggilan per sampel
+        """
+        i = 1
+        while True:
+            for multiplier in (1, 2, 5):
+                number = i * multiplier
+                start = time.perf_counter()
+                for _ in range(number):
+                    algorithm(text, pattern)
+                if time.perf_counter() - start >= self.min_sample_time:
+                    return number
+            i *= 10
+    
+    def run_sample(self, algorithm: Callable, text: str, pattern: str,
+                   number: int) -> float:
+        """
+        Menjalankan satu sampel berisi number pemanggilan.
+        
+        Returns:
+            Waktu rata-rata per pemanggilan dalam microseconds
+        """
+        start = time.perf_counter()
+        for _ in range(number):
+            algorithm(text, pattern)
+        end = time.perf_counter()
+        return (end - start) * 1_000_000 / number
+    
     def run_benchmark(self, algorithm: Callable, algorithm_name: str,
                       text: str, pattern: str, input_size: int) -> BenchmarkResult:
         """
-        Menjalankan benchmark dengan multiple iterations.
+        Menjalankan benchmark dengan warm-up, auto-range, dan multiple iterations.
         
         Args:
             algorithm: Fungsi search algorithm
@@ -63,47 +215,106 @@ class BenchmarkRunner:
             input_size: Ukuran input
             
         Returns:
-            BenchmarkResult dengan rata-rata waktu eksekusi
+            BenchmarkResult dengan statistik waktu eksekusi; run yang gagal
+            dihitung di failed_runs dan tidak ikut dirata-rata
         """
         times = []
-        for _ in range(self.iterations):
+        failed = 0
+        number = 1
+        
+        gc_was_enabled = gc.isenabled()
+        if self.disable_gc:
+            gc.disable()
+        
+        try:
             try:
-                exec_time = self.run_single(algorithm, text, pattern)
-                times.append(exec_time)
-            except RecursionError:
-                times.append(float('inf'))
+                for _ in range(self.warmup):
+                    algorithm(text, pattern)
+                number = self.autorange(algorithm, text, pattern)
             except Exception as e:
-                print(f"Error in {algorithm_name}: {e}")
-                times.append(float('inf'))
+                # Gagal sejak warm-up: semua sampel dianggap gagal
+                if not isinstance(e, RecursionError):
+                    print(f"Error in {algorithm_name}: {e}")
+                failed = self.iterations
+            
+            for _ in range(self.iterations - failed):
+                try:
+                    times.append(self.run_sample(algorithm, text, pattern, number))
+                except RecursionError:
+                    failed += 1
+                except Exception as e:
+                    print(f"Error in {algorithm_name}: {e}")
+                    failed += 1
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        
+        if failed:
+            print(f"  {algorithm_name}: {failed}/{self.iterations} run gagal")
         
-        avg_time = sum(times) / len(times) if times else 0
+        if times:
+            times.sort()
+            avg_time = statistics.fmean(times)
+            stats = dict(
+                min_time=times[0],
+                median_time=statistics.median(times),
+                p95_time=_percentile(times, 95),
+                p99_time=_percentile(times, 99),
+                stddev=statistics.stdev(times) if len(times) > 1 else 0.0,
+            )
+        else:
+            avg_time = float('inf')
+            stats = dict(min_time=avg_time, median_time=avg_time, p95_time=avg_time,
+                         p99_time=avg_time, stddev=0.0)
         
-        return BenchmarkResult(
+        result = BenchmarkResult(
             algorithm_name=algorithm_name,
             input_size=input_size,
             execution_time=avg_time,
             iterations=self.iterations,
-            pattern_length=len(pattern)
+            pattern_length=len(pattern),
+            inner_loops=number,
+            failed_runs=failed,
+            **stats
         )
+        
+        # Dihitung terpisah dari pengukuran waktu agar timing tidak terpengaruh
+        if self.count_operations and algorithm in instrumented.INSTRUMENTED:
+            try:
+                counts = instrumented.count_operations(algorithm, text, pattern)
+            except RecursionError:
+                counts = None
+            if counts is not None:
+                result.comparisons = counts.comparisons
+                result.shifts = counts.shifts
+                result.shift_distance = counts.shift_distance
+                result.fallbacks = counts.fallbacks
+                result.preprocessing_ops = counts.preprocessing_ops
+        
+        return result
     
-    def run_all(self, algorithms: Dict[str, Callable], 
+    def run_all(self, algorithms: Optional[Dict[str, Callable]] = None, 
                 pattern_length: int = 10) -> List[BenchmarkResult]:
         """
         Menjalankan benchmark untuk semua algoritma dan ukuran input.
         
         Args:
             algorithms: Dictionary {nama: fungsi} algoritma
+                        (default: default_algorithms())
             pattern_length: Panjang pattern untuk testing
             
         Returns:
             List BenchmarkResult untuk semua kombinasi
         """
+        if algorithms is None:
+            algorithms = default_algorithms()
+        
         results = []
-        pattern = generate_pattern(pattern_length)
+        pattern = self.make_pattern(pattern_length)
         
         for input_size in self.input_sizes:
             print(f"Testing input size: {input_size}")
-            text = generate_random_text(input_size)
+            text = self.make_text(input_size)
             
             for name, algorithm in algorithms.items():
                 result = self.run_benchmark(
@@ -114,6 +325,668 @@ class BenchmarkRunner:
         
         return results
     
+    def run_isolated(self, algorithms: Optional[Dict[str, Callable]] = None,
+                     pattern_length: int = 10) -> List[BenchmarkResult]:
+        """
+        Seperti run_all, tetapi setiap (algoritma, ukuran) dijalankan di subprocess
+        baru dan dilengkapi memori puncak, selisih RSS, dan kedalaman rekursi.
+        
+        Args:
+            algorithms: Dictionary {nama: fungsi} algoritma
+                        (default: default_algorithms())
+            pattern_length: Panjang pattern untuk testing
+            
+        Returns:
+            List BenchmarkResult untuk semua kombinasi
+        """
+        from benchmark.isolation import run_isolated
+        
+        if algorithms is None:
+            algorithms = default_algorithms()
+        return run_isolated(self, algorithms, pattern_length)
+    
+    def run_multi_pattern(self, pattern_counts: List[int] = None,
+                          text_size: int = 10000,
+                          pattern_length: int = 10) -> List[BenchmarkResult]:
+        """
+        Membandingkan Aho-Corasick dengan k kali scan KMP/BM terpisah.
+        
+        Args:
+            pattern_counts: Daftar jumlah pattern k yang diuji
+            text_size: Panjang teks
+            pattern_length: Panjang setiap pattern
+            
+        Returns:
+            List BenchmarkResult dengan pattern_count = k
+        """
+        if pattern_counts is None:
+            pattern_counts = [1, 2, 5, 10, 20, 50, 100]
+        
+        def kmp_each(text: str, patterns: List[str]) -> None:
+            for p in patterns:
+                kmp_iterative.search(text, p)
+        
+        def bm_each(text: str, patterns: List[str]) -> None:
+            for p in patterns:
+                bm_iterative.search(text, p)
+        
+        algorithms = {
+            'Aho-Corasick': aho_corasick.search,
+            'KMP x k': kmp_each,
+            'Boyer-Moore x k': bm_each,
+        }
+        
+        results = []
+        text = self.make_text(text_size)
+        
+        for k in pattern_counts:
+            print(f"Testing pattern count: {k}")
+            patterns = [self.make_pattern(pattern_length, i) for i in range(k)]
+            
+            for name, algorithm in algorithms.items():
+                result = self.run_benchmark(
+                    algorithm, name, text, patterns, text_size
+                )
+                result.pattern_length = pattern_length
+                result.pattern_count = k
+                results.append(result)
+                print(f"  {name}: {result.execution_time:.2f} μs")
+        
+        return results
+    
+    def run_rolling_hash(self, pattern_counts: List[int] = None,
+                         pattern_lengths: List[int] = None,
+                         text_size: int = 100_000) -> List[BenchmarkResult]:
+        """
+        Membandingkan satu scan Rabin-Karp untuk sekumpulan pattern sama
+        panjang (mis. shingle near-duplicate) dengan k kali bm_iterative.search.
+        
+        Sebagian pattern diambil dari text itu sendiri agar ada kemunculan
+        yang harus diverifikasi, sisanya pattern random.
+        
+        Args:
+            pattern_counts: Daftar jumlah pattern k
+            pattern_lengths: Daftar panjang pattern
+            text_size: Panjang teks
+            
+        Returns:
+            List BenchmarkResult dengan pattern_count = k
+        """
+        if pattern_counts is None:
+            pattern_counts = [1, 10, 100, 1000]
+        if pattern_lengths is None:
+            pattern_lengths = [8, 32, 128]
+        
+        def bm_each(text: str, patterns: List[str]) -> None:
+            for p in patterns:
+                bm_iterative.search(text, p)
+        
+        algorithms = {
+            'Rabin-Karp (set)': rabin_karp.search_set,
+            'Boyer-Moore x k': bm_each,
+        }
+        
+        results = []
+        text = self.make_text(text_size)
+        rng = random.Random(self.seed)
+        
+        for length in pattern_lengths:
+            for k in pattern_counts:
+                print(f"Testing pattern length: {length}, pattern count: {k}")
+                patterns = []
+                for i in range(k):
+                    if i % 2 == 0:
+                        start = rng.randrange(text_size - length + 1)
+                        patterns.append(text[start:start + length])
+                    else:
+                        patterns.append(self.make_pattern(length, i))
+                
+                for name, algorithm in algorithms.items():
+                    result = self.run_benchmark(
+                        algorithm, name, text, patterns, text_size
+                    )
+                    result.pattern_length = length
+                    result.pattern_count = k
+                    results.append(result)
+                    print(f"  {name}: {result.execution_time:.2f} μs")
+        
+        return results
+    
+    def run_stream_throughput(self, text_size: int = 10_000_000,
+                              chunk_sizes: List[int] = None,
+                              algorithms: List[str] = None,
+                              pattern_length: int = 10) -> List[BenchmarkResult]:
+        """
+        Mengukur throughput (MB/s) pencarian streaming atas file di disk.
+        
+        Args:
+            text_size: Ukuran file dalam byte
+            chunk_sizes: Daftar ukuran chunk yang diuji
+            algorithms: Daftar engine streaming ('kmp', 'bm', 'bm_galil')
+            pattern_length: Panjang pattern
+            
+        Returns:
+            List BenchmarkResult; lihat BenchmarkResult.throughput_mb_s
+        """
+        if chunk_sizes is None:
+            chunk_sizes = [4 * 1024, 64 * 1024, 1024 * 1024]
+        if algorithms is None:
+            algorithms = ['kmp', 'bm', 'bm_galil']
+        
+        def stream_search(algorithm: str, chunk_size: int) -> Callable:
+            def run(path: str, pattern: str) -> None:
+                for _ in streaming.search_file(path, pattern, algorithm, chunk_size):
+                    pass
+            return run
+        
+        results = []
+        pattern = self.make_pattern(pattern_length)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            if self.seed is not None:
+                # Corpus cache sudah berupa file di disk: tidak perlu ditulis ulang
+                path = ensure_corpus(text_size, self.seed)
+            else:
+                path = os.path.join(tmp_dir, 'stream_input.txt')
+                with open(path, 'w', encoding='ascii', newline='') as f:
+                    f.write(generate_random_text(text_size))
+            
+            for chunk_size in chunk_sizes:
+                print(f"Testing chunk size: {chunk_size}")
+                
+                for algorithm in algorithms:
+                    name = f"Stream {algorithm} (chunk={chunk_size})"
+                    result = self.run_benchmark(
+                        stream_search(algorithm, chunk_size), name,
+                        path, pattern, text_size
+                    )
+                    result.pattern_length = pattern_length
+                    results.append(result)
+                    print(f"  {name}: {result.throughput_mb_s:.2f} MB/s")
+        
+        return results
+    
+    def run_parallel(self, text_size: int = 10_000_000,
+                     worker_counts: List[int] = None,
+                     shard_sizes: List[Optional[int]] = None,
+                     algorithm: str = 'bm',
+                     pattern_length: int = 10) -> List[BenchmarkResult]:
+        """
+        Mengukur speedup parallel_search terhadap jumlah worker dan ukuran shard.
+        
+        Args:
+            text_size: Panjang teks
+            worker_counts: Daftar jumlah worker yang diuji
+            shard_sizes: Daftar ukuran shard (None = otomatis)
+            algorithm: Nama engine pada compiled.ENGINES
+            pattern_length: Panjang pattern
+            
+        Returns:
+            List BenchmarkResult dengan kolom speedup; hasil pertama adalah
+            baseline sekuensial (speedup 1.0)
+        """
+        if worker_counts is None:
+            worker_counts = [1, 2, 4, 8]
+        if shard_sizes is None:
+            shard_sizes = [None, 256 * 1024, 4 * 1024 * 1024]
+        
+        def parallel_run(executor: ProcessPoolExecutor, workers: int,
+                         shard_size: Optional[int]) -> Callable:
+            def run(text: str, pattern: str) -> None:
+                parallel.parallel_search(text, pattern, algorithm, workers,
+                                         shard_size, executor)
+            return run
+        
+        results = []
+        pattern = self.make_pattern(pattern_length)
+        text = self.make_text(text_size)
+        
+        def sequential(text: str, pattern: str) -> None:
+            compile_pattern(pattern, algorithm).search(text)
+        
+        baseline = self.run_benchmark(
+            sequential, f"Sequential {algorithm}", text, pattern, text_size
+        )
+        baseline.speedup = 1.0
+        results.append(baseline)
+        print(f"  Sequential {algorithm}: {baseline.execution_time:.2f} μs")
+        
+        for workers in worker_counts:
+            print(f"Testing workers: {workers}")
+            # Pool dibuat di luar pengukuran agar biaya spawn tidak ikut terhitung
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for shard_size in shard_sizes:
+                    shard_label = shard_size if shard_size is not None else 'auto'
+                    name = f"Parallel {algorithm} (workers={workers}, shard={shard_label})"
+                    result = self.run_benchmark(
+                        parallel_run(executor, workers, shard_size), name,
+                        text, pattern, text_size
+                    )
+                    result.speedup = (baseline.execution_time / result.execution_time
+                                      if result.execution_time > 0 else 0.0)
+                    results.append(result)
+                    print(f"  {name}: {result.execution_time:.2f} μs "
+                          f"(speedup {result.speedup:.2f}x)")
+        
+        return results
+    
+    def run_index(self, text_sizes: List[int] = None,
+                  pattern_length: int = 10,
+                  scan_algorithms: Dict[str, Callable] = None) -> List[BenchmarkResult]:
+        """
+        Mengukur biaya suffix array index (build, load, query, ukuran di disk)
+        dan jumlah query minimum agar index lebih murah dari scan.
+        
+        Break-even = waktu build / (waktu scan - waktu query) per query.
+        
+        Args:
+            text_sizes: Daftar panjang teks
+            pattern_length: Panjang pattern
+            scan_algorithms: Dictionary {nama: fungsi} engine scan pembanding
+            
+        Returns:
+            List BenchmarkResult (Build membawa index_bytes)
+        """
+        if text_sizes is None:
+            text_sizes = [10_000, 100_000, 300_000]
+        if scan_algorithms is None:
+            scan_algorithms = {
+                'KMP Iterative': kmp_iterative.search,
+                'Boyer-Moore Iterative': bm_iterative.search,
+                'BNDM': bitparallel.search_bndm,
+            }
+        
+        results = []
+        pattern = self.make_pattern(pattern_length)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'index.saidx')
+            
+            for text_size in text_sizes:
+                print(f"Testing input size: {text_size}")
+                text = self.make_text(text_size)
+                
+                build = self.run_benchmark(
+                    lambda t, p: SuffixArrayIndex(t), "Suffix Array Build",
+                    text, pattern, text_size
+                )
+                index = SuffixArrayIndex(text)
+                build.index_bytes = index.save(path)
+                
+                load = self.run_benchmark(
+                    lambda t, p: SuffixArrayIndex.load(path), "Suffix Array Load",
+                    text, pattern, text_size
+                )
+                query = self.run_benchmark(
+                    lambda t, p: index.search(p), "Suffix Array Query",
+                    text, pattern, text_size
+                )
+                results.extend([build, load, query])
+                print(f"  Build: {build.execution_time:.2f} μs, "
+                      f"{build.index_bytes / 1024:.1f} KB di disk")
+                print(f"  Load: {load.execution_time:.2f} μs, "
+                      f"Query: {query.execution_time:.2f} μs")
+                
+                for name, algorithm in scan_algorithms.items():
+                    result = self.run_benchmark(algorithm, name, text, pattern, text_size)
+                    results.append(result)
+                    saved = result.execution_time - query.execution_time
+                    if saved > 0:
+                        break_even = f"{math.ceil(build.execution_time / saved)} query"
+                    else:
+                        break_even = "tidak pernah"
+                    print(f"  {name}: {result.execution_time:.2f} μs "
+                          f"(break-even: {break_even})")
+        
+        return results
+    
+    def run_batch(self, record_count: int = 100_000, record_length: int = 100,
+                  batch_sizes: List[int] = None, algorithm: str = 'kmp',
+                  pattern_length: int = 5) -> List[BenchmarkResult]:
+        """
+        Mengukur throughput search_many terhadap ukuran batch (dengan dan tanpa
+        prefilter), dibandingkan dengan memanggil compile(pattern).search per record.
+        
+        Args:
+            record_count: Jumlah record
+            record_length: Panjang setiap record
+            batch_sizes: Daftar ukuran batch yang diuji
+            algorithm: Nama engine pada compiled.ENGINES
+            pattern_length: Panjang pattern
+            
+        Returns:
+            List BenchmarkResult (input_size = total karakter semua record);
+            hasil pertama adalah baseline per record
+        """
+        if batch_sizes is None:
+            batch_sizes = [1, 16, 256, 4096]
+        
+        pattern = self.make_pattern(pattern_length)
+        corpus = self.make_text(record_count * record_length)
+        records = [corpus[i:i + record_length]
+                   for i in range(0, record_count * record_length, record_length)]
+        # Sisipkan pattern di setiap record ke-10 agar ada match untuk dikumpulkan
+        for i in range(0, record_count, 10):
+            records[i] = pattern + records[i][len(pattern):]
+        total_chars = record_count * record_length
+        
+        def per_record(text: str, pattern: str) -> None:
+            matcher = compile_pattern(pattern, algorithm)
+            [(i, found) for i, found in enumerate(map(matcher.search, records)) if found]
+        
+        def batched(batch_size: int, prefilter: bool) -> Callable:
+            def run(text: str, pattern: str) -> None:
+                search_many(records, pattern, algorithm, batch_size, prefilter=prefilter)
+            return run
+        
+        results = []
+        print(f"Testing {record_count} records x {record_length} karakter")
+        baseline = self.run_benchmark(per_record, f"Per-record {algorithm}",
+                                      '', pattern, total_chars)
+        results.append(baseline)
+        print(f"  Per-record {algorithm}: {baseline.execution_time:.2f} μs "
+              f"({baseline.throughput_mb_s:.2f} MB/s)")
+        
+        for prefilter in (False, True):
+            for batch_size in batch_sizes:
+                mode = "prefilter, " if prefilter else ""
+                name = f"search_many {algorithm} ({mode}batch={batch_size})"
+                result = self.run_benchmark(batched(batch_size, prefilter), name,
+                                            '', pattern, total_chars)
+                results.append(result)
+                print(f"  {name}: {result.execution_time:.2f} μs "
+                      f"({result.throughput_mb_s:.2f} MB/s)")
+        
+        return results
+    
+    def run_preprocessing(self, pattern_lengths: List[int] = None) -> List[BenchmarkResult]:
+        """
+        Mengukur waktu preprocessing dan memori puncak tabel pattern
+        (KMP, Boyer-Moore, Galil, Two-Way) seiring bertambahnya panjang pattern.
+        
+        Args:
+            pattern_lengths: Daftar panjang pattern
+            
+        Returns:
+            List BenchmarkResult dengan input_size = panjang pattern dan
+            peak_memory_bytes = memori puncak selama preprocessing
+        """
+        from benchmark.isolation import measure_peak_memory
+        
+        if pattern_lengths is None:
+            pattern_lengths = [10, 100, 1_000, 10_000, 100_000]
+        
+        preprocessors = {
+            'KMP Iterative': kmp_iterative.compute_failure_function,
+            'Boyer-Moore Iterative': bm_iterative.compute_bad_character_table,
+            'Boyer-Moore Galil': lambda p: (bm_iterative.compute_bad_character_table(p),
+                                            bm_iterative.compute_good_suffix_table(p)),
+            'Two-Way': two_way.critical_factorization,
+        }
+        
+        def preprocess_only(preprocess: Callable) -> Callable:
+            def run(text: str, pattern: str):
+                return preprocess(pattern)
+            return run
+        
+        results = []
+        for length in pattern_lengths:
+            print(f"Testing pattern length: {length}")
+            pattern = self.make_pattern(length)
+            for name, preprocess in preprocessors.items():
+                run = preprocess_only(preprocess)
+                result = self.run_benchmark(run, name, '', pattern, length)
+                result.pattern_length = length
+                result.peak_memory_bytes = measure_peak_memory(run, '', pattern)
+                results.append(result)
+                print(f"  {name}: {result.execution_time:.2f} μs, "
+                      f"peak {result.peak_memory_bytes / 1024:.1f} KB")
+        
+        return results
+    
+    def run_table_memory(self, pattern_lengths: List[int] = None,
+                         algorithms: List[str] = None) -> List[BenchmarkResult]:
+        """
+        Membandingkan memori tabel per pattern antara tabel biasa (list/dict)
+        dan compact_tables (array), beserta waktu preprocessing-nya.
+        
+        Args:
+            pattern_lengths: Daftar panjang pattern
+            algorithms: Daftar engine pada compiled.COMPACT_TABLES
+            
+        Returns:
+            List BenchmarkResult dengan input_size = panjang pattern dan
+            table_bytes = memori yang dipegang CompiledPattern
+        """
+        from benchmark.isolation import measure_retained_memory
+        
+        if pattern_lengths is None:
+            pattern_lengths = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+        if algorithms is None:
+            algorithms = ['kmp', 'bm', 'bm_galil']
+        
+        def build(algorithm: str, compact: bool) -> Callable:
+            def run(text: str, pattern: str) -> CompiledPattern:
+                return CompiledPattern(pattern, algorithm, compact)
+            return run
+        
+        results = []
+        for length in pattern_lengths:
+            print(f"Testing pattern length: {length}")
+            pattern = self.make_pattern(length)
+            for algorithm in algorithms:
+                sizes = {}
+                for compact in (False, True):
+                    name = f"{algorithm} ({'compact' if compact else 'list/dict'})"
+                    run = build(algorithm, compact)
+                    result = self.run_benchmark(run, name, '', pattern, length)
+                    result.pattern_length = length
+                    result.table_bytes = measure_retained_memory(run, '', pattern)
+                    results.append(result)
+                    sizes[compact] = result.table_bytes
+                saving = sizes[False] / sizes[True] if sizes[True] else 0.0
+                print(f"  {algorithm}: {sizes[False] / 1024:.1f} KB -> "
+                      f"{sizes[True] / 1024:.1f} KB ({saving:.1f}x lebih kecil)")
+        
+        return results
+    
+    def run_approximate(self, text_sizes: List[int] = None, ks: List[int] = None,
+                        pattern_length: int = 32,
+                        brute_force_limit: int = 100_000) -> List[BenchmarkResult]:
+        """
+        Approximate matching (filter pigeonhole + verifikasi bit-parallel)
+        dibandingkan dengan verifikasi brute force di setiap posisi, untuk
+        berbagai k dan panjang text.
+        
+        Args:
+            text_sizes: Daftar panjang text
+            ks: Daftar jumlah kesalahan maksimum
+            pattern_length: Panjang pattern
+            brute_force_limit: Baseline brute force hanya dijalankan sampai
+                panjang text ini (DP Levenshtein O(nm) di Python sangat lambat)
+            
+        Returns:
+            List BenchmarkResult dengan kolom max_errors = k
+        """
+        if text_sizes is None:
+            text_sizes = [10_000, 100_000, 1_000_000]
+        if ks is None:
+            ks = [0, 1, 2, 4, 8]
+        
+        def with_k(function: Callable, k: int) -> Callable:
+            def run(text: str, pattern: str) -> None:
+                function(text, pattern, k)
+            return run
+        
+        results = []
+        for input_size in text_sizes:
+            print(f"Testing input size: {input_size}")
+            text = self.make_text(input_size)
+            pattern = self.make_pattern(pattern_length)
+            for k in ks:
+                algorithms = {
+                    'Hamming pigeonhole': approximate.search_hamming,
+                    'Levenshtein pigeonhole': approximate.search_levenshtein,
+                    'Levenshtein Myers (tanpa filter)': approximate.myers_scan,
+                }
+                if input_size <= brute_force_limit:
+                    algorithms['Hamming brute force'] = approximate.naive_hamming
+                    algorithms['Levenshtein brute force'] = approximate.naive_levenshtein
+                
+                for name, function in algorithms.items():
+                    result = self.run_benchmark(
+                        with_k(function, k), f"{name} (k={k})", text, pattern, input_size
+                    )
+                    result.max_errors = k
+                    results.append(result)
+                    print(f"  {name} k={k}: {result.execution_time:.2f} μs")
+        
+        return results
+    
+    def run_search_modes(self, dense: bool = False,
+                         pattern_length: int = 10) -> List[BenchmarkResult]:
+        """
+        Membandingkan mode search (list), finditer, find_first, dan count
+        untuk KMP dan Boyer-Moore.
+        
+        Args:
+            dense: Jika True, text = 'a' * n dan pattern = 'aa' (match di setiap posisi)
+            pattern_length: Panjang pattern untuk text random
+            
+        Returns:
+            List BenchmarkResult untuk setiap kombinasi engine, mode, dan ukuran
+        """
+        def consume(finditer: Callable) -> Callable:
+            def run(text: str, pattern: str) -> None:
+                for _ in finditer(text, pattern):
+                    pass
+            return run
+        
+        algorithms = {}
+        for label, module in (('KMP', kmp_iterative), ('Boyer-Moore', bm_iterative)):
+            algorithms[f'{label} search'] = module.search
+            algorithms[f'{label} finditer'] = consume(module.finditer)
+            algorithms[f'{label} find_first'] = module.find_first
+            algorithms[f'{label} count'] = module.count
+        
+        results = []
+        pattern = 'aa' if dense else self.make_pattern(pattern_length)
+        
+        for input_size in self.input_sizes:
+            print(f"Testing input size: {input_size}")
+            text = 'a' * input_size if dense else self.make_text(input_size)
+            
+            for name, algorithm in algorithms.items():
+                result = self.run_benchmark(
+                    algorithm, name, text, pattern, input_size
+                )
+                results.append(result)
+                print(f"  {name}: {result.execution_time:.2f} μs")
+        
+        return results
+    
+    def run_grid(self, algorithms: Optional[Dict[str, Callable]] = None,
+                 text_sizes: List[int] = None,
+                 pattern_lengths: List[int] = None,
+                 alphabets: List[str] = None,
+                 distributions: List[str] = None) -> List[BenchmarkResult]:
+        """
+        Sweep ukuran text x panjang pattern x alfabet x distribusi.
+        
+        Pattern diambil dari text itu sendiri (posisi acak) agar mengikuti
+        distribusi yang sama; untuk 'worst_case' dipakai pasangan a^n / a^(m-1)b.
+        Distribusi 'english' hanya memakai huruf kecil, sehingga kombinasi
+        dengan alfabet lain dilewati. Text dan posisi pattern diambil dari
+        random.Random(self.seed), sehingga grid dengan seed sama dapat diulang.
+        
+        Args:
+            algorithms: Dictionary {nama: fungsi} algoritma (default: default_algorithms())
+            text_sizes: Daftar panjang text
+            pattern_lengths: Daftar panjang pattern
+            alphabets: Daftar nama alfabet (lihat ALPHABETS)
+            distributions: Daftar nama distribusi (lihat DISTRIBUTIONS)
+            
+        Returns:
+            List BenchmarkResult dengan kolom alphabet dan distribution
+        """
+        if algorithms is None:
+            algorithms = default_algorithms()
+        if text_sizes is None:
+            text_sizes = [1000, 10000]
+        if pattern_lengths is None:
+            pattern_lengths = [4, 16, 64]
+        if alphabets is None:
+            alphabets = ['binary', 'dna', 'lowercase']
+        if distributions is None:
+            distributions = ['uniform', 'zipf', 'english', 'markov', 'periodic', 'worst_case']
+        
+        results = []
+        rng = random.Random(self.seed)
+        
+        for distribution in distributions:
+            for alphabet in alphabets:
+                if distribution in ('english', 'worst_case') and alphabet != alphabets[0]:
+                    continue
+                label = 'lowercase' if distribution == 'english' else alphabet
+                if distribution == 'worst_case':
+                    label = 'a/b'
+                
+                for text_size in text_sizes:
+                    text = generate_text(text_size, alphabet, distribution, rng=rng)
+                    
+                    for m in pattern_lengths:
+                        if m > text_size:
+                            continue
+                        if distribution == 'worst_case':
+                            text, pattern = generate_worst_case(text_size, m)
+                        else:
+                            start = rng.randrange(text_size - m + 1)
+                            pattern = text[start:start + m]
+                        
+                        print(f"Testing {distribution}/{label}: n={text_size}, m={m}")
+                        for name, algorithm in algorithms.items():
+                            result = self.run_benchmark(
+                                algorithm, name, text, pattern, text_size
+                            )
+                            result.alphabet = label
+                            result.distribution = distribution
+                            results.append(result)
+                            print(f"  {name}: {result.execution_time:.2f} μs")
+        
+        return results
+    
+    def write_csv(self, results: List[BenchmarkResult], f) -> None:
+        """
+        Menulis hasil dalam format CSV ke file object yang sudah terbuka.
+        
+        Args:
+            results: List BenchmarkResult
+            f: File object teks (mis. sys.stdout)
+        """
+        writer = csv.writer(f)
+        writer.writerow([
+            'algorithm', 'input_size', 'pattern_length', 
+            'execution_time_us', 'iterations', 'pattern_count',
+            'min_time_us', 'median_time_us', 'p95_time_us', 'p99_time_us',
+            'stddev_us', 'inner_loops', 'failed_runs',
+            'comparisons', 'shifts', 'shift_distance', 'fallbacks',
+            'preprocessing_ops', 'alphabet', 'distribution',
+            'peak_memory_bytes', 'rss_delta_kb', 'max_recursion_depth',
+            'index_bytes', 'table_bytes', 'max_errors', 'speedup'
+        ])
+        
+        for r in results:
+            writer.writerow([
+                r.algorithm_name, r.input_size, r.pattern_length,
+                f"{r.execution_time:.2f}", r.iterations, r.pattern_count,
+                f"{r.min_time:.2f}", f"{r.median_time:.2f}", f"{r.p95_time:.2f}",
+                f"{r.p99_time:.2f}", f"{r.stddev:.2f}", r.inner_loops, r.failed_runs,
+                r.comparisons, r.shifts, r.shift_distance, r.fallbacks,
+                r.preprocessing_ops, r.alphabet, r.distribution,
+                r.peak_memory_bytes, r.rss_delta_kb, r.max_recursion_depth,
+                r.index_bytes, r.table_bytes, r.max_errors, f"{r.speedup:.3f}"
+            ])
+    
     def export_csv(self, results: List[BenchmarkResult], filename: str) -> None:
         """
         Export hasil ke file CSV.
@@ -126,16 +999,56 @@ class BenchmarkRunner:
         os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else '.', exist_ok=True)
         
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'algorithm', 'input_size', 'pattern_length', 
-                'execution_time_us', 'iterations'
-            ])
-            
-            for r in results:
-                writer.writerow([
-                    r.algorithm_name, r.input_size, r.pattern_length,
-                    f"{r.execution_time:.2f}", r.iterations
-                ])
+            self.write_csv(results, f)
         
         print(f"Results exported to {filename}")
+
+    @staticmethod
+    def load_csv(filename: str) -> List[BenchmarkResult]:
+        """
+        Membaca kembali file hasil export_csv.
+
+        Kolom yang tidak ada (CSV versi lama) memakai nilai default BenchmarkResult.
+
+        Args:
+            filename: Path file CSV
+
+        Returns:
+            List BenchmarkResult
+        """
+        int_columns = ['pattern_count', 'inner_loops', 'failed_runs',
+                       'comparisons', 'shifts', 'shift_distance', 'fallbacks',
+                       'preprocessing_ops', 'peak_memory_bytes', 'rss_delta_kb',
+                       'max_recursion_depth', 'index_bytes', 'table_bytes',
+                       'max_errors']
+        time_columns = {'min_time_us': 'min_time', 'median_time_us': 'median_time',
+                        'p95_time_us': 'p95_time', 'p99_time_us': 'p99_time',
+                        'stddev_us': 'stddev'}
+        float_columns = ['speedup']
+
+        results = []
+        with open(filename, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                kwargs = {
+                    'algorithm_name': row['algorithm'],
+                    'input_size': int(row['input_size']),
+                    'execution_time': float(row['execution_time_us']),
+                    'iterations': int(row['iterations']),
+                }
+                if row.get('pattern_length'):
+                    kwargs['pattern_length'] = int(row['pattern_length'])
+                for column in int_columns:
+                    if row.get(column):
+                        kwargs[column] = int(row[column])
+                for column, attribute in time_columns.items():
+                    if row.get(column):
+                        kwargs[attribute] = float(row[column])
+                for column in float_columns:
+                    if row.get(column):
+                        kwargs[column] = float(row[column])
+                for column in ('alphabet', 'distribution'):
+                    if row.get(column):
+                        kwargs[column] = row[column]
+                results.append(BenchmarkResult(**kwargs))
+
+        return results
@@ -1,15 +1,41 @@
 """
 Main Application
 Perbandingan Algoritma KMP dan Boyer-Moore (Iteratif vs Rekursif)
+
+Tanpa argumen: menu interaktif. Dengan argumen: subcommand non-interaktif
+(search, bench, verify, plot) dengan output JSON atau CSV, mis.
+
+    python main.py search --file data.txt --pattern abc --format json
+    python main.py bench --sizes 1000,10000 --algorithm kmp --algorithm bm
 """
+import argparse
+import contextlib
+import csv
+import json
 import sys
 import time
 
 # Import algorithms
-from algorithms import kmp_iterative, kmp_recursive, bm_iterative, bm_recursive
-from benchmark.runner import BenchmarkRunner
-from visualization.plotter import Plotter
-from utils.text_generator import generate_random_text, generate_pattern
+# (numpy, matplotlib, text generator, dan modul benchmark di-import saat dibutuhkan
+# agar startup cepat)
+from algorithms import kmp_iterative, kmp_recursive, bm_recursive, planner
+
+
+# Nama algoritma di command line -> nama tampilan (sama dengan default_algorithms)
+CLI_ALGORITHMS = {
+    'kmp': 'KMP Iterative',
+    'kmp_recursive': 'KMP Recursive',
+    'bm': 'Boyer-Moore Iterative',
+    'bm_recursive': 'Boyer-Moore Recursive',
+    'bm_galil': 'Boyer-Moore Galil',
+    'two_way': 'Two-Way',
+    'rabin_karp': 'Rabin-Karp',
+    'kmp_trampoline': 'KMP Recursive (Trampoline)',
+    'bm_trampoline': 'Boyer-Moore Recursive (Trampoline)',
+    'shift_or': 'Shift-Or',
+    'bndm': 'BNDM',
+    'vectorized': 'NumPy Vectorized',
+}
 
 
 def print_header():
@@ -26,19 +52,21 @@ def print_results_table(results: dict, pattern: str):
     print("\n" + "=" * 70)
     print(f"Pattern: '{pattern}' (panjang: {len(pattern)})")
     print("-" * 70)
-    print(f"{'Algoritma':<25} {'Matches':<10} {'Waktu (μs)':<15}")
+    print(f"{'Algoritma':<36} {'Matches':<10} {'Waktu (μs)':<15}")
     print("-" * 70)
     
     for name, data in results.items():
         matches = len(data['indices'])
         time_us = data['time']
-        print(f"{name:<25} {matches:<10} {time_us:<15.2f}")
+        print(f"{name:<36} {matches:<10} {time_us:<15.2f}")
     
     print("=" * 70)
 
 
 def run_search_demo():
     """Demo pencarian dengan input user"""
+    from utils.text_generator import generate_random_text, generate_pattern
+    
     print("\n--- MODE DEMO PENCARIAN ---\n")
     
     # Input dari user
@@ -53,13 +81,10 @@ def run_search_demo():
         pattern = generate_pattern(5)
         print(f"Pattern random: {pattern}")
     
-    # Jalankan semua algoritma
-    algorithms = {
-        'KMP Iterative': kmp_iterative.search,
-        'KMP Recursive': kmp_recursive.search,
-        'Boyer-Moore Iterative': bm_iterative.search,
-        'Boyer-Moore Recursive': bm_recursive.search,
-    }
+    # Jalankan semua algoritma (daftar yang sama dengan benchmark)
+    from benchmark.runner import default_algorithms
+    algorithms = default_algorithms()
+    algorithms[f"Auto ({planner.choose_algorithm(text, pattern)})"] = planner.search
     
     results = {}
     for name, algo in algorithms.items():
@@ -84,22 +109,21 @@ def run_benchmark():
     
     pattern_length = int(input("Panjang pattern (default 10): ") or "10")
     
-    algorithms = {
-        'KMP Iterative': kmp_iterative.search,
-        'KMP Recursive': kmp_recursive.search,
-        'Boyer-Moore Iterative': bm_iterative.search,
-        'Boyer-Moore Recursive': bm_recursive.search,
-    }
-    
     print("\nMemulai benchmark...")
     print("Input sizes: 1, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000\n")
     
+    from benchmark.runner import BenchmarkRunner, default_algorithms
+    from visualization.plotter import Plotter
     runner = BenchmarkRunner(iterations=10)
-    results = runner.run_all(algorithms, pattern_length)
+    results = runner.run_all(default_algorithms(), pattern_length)
     
     # Export ke CSV
     runner.export_csv(results, "output/data/benchmark_results.csv")
     
+    # Simpan ke riwayat untuk deteksi regresi
+    from benchmark.history import save_run, DEFAULT_DB_PATH
+    save_run(results)
+    
     # Generate grafik
     print("\nMembuat grafik...")
     plotter = Plotter()
@@ -108,10 +132,20 @@ def run_benchmark():
     print("\n" + "=" * 70)
     print("Benchmark selesai!")
     print("- Data CSV: output/data/benchmark_results.csv")
+    print(f"- Riwayat: {DEFAULT_DB_PATH}")
     print("- Grafik: output/graphs/")
     print("=" * 70)
 
 
+def short_name(name: str) -> str:
+    """Nama algoritma yang dipendekkan untuk kolom tabel quick test"""
+    for long, short in (('Boyer-Moore', 'BM'), ('Iterative', 'Iter'),
+                        ('Recursive', 'Rec'), (' (Trampoline)', ' Tramp'),
+                        (' Vectorized', '')):
+        name = name.replace(long, short)
+    return name
+
+
 def run_quick_test():
     """Quick test untuk verifikasi algoritma"""
     print("\n--- QUICK TEST ---\n")
@@ -123,16 +157,13 @@ def run_quick_test():
         ("ABCABCABC", "ABC"),
     ]
     
-    algorithms = {
-        'KMP Iter': kmp_iterative.search,
-        'KMP Rec': kmp_recursive.search,
-        'BM Iter': bm_iterative.search,
-        'BM Rec': bm_recursive.search,
-    }
+    from benchmark.runner import default_algorithms
+    algorithms = {short_name(name): algo for name, algo in default_algorithms().items()}
+    width = max(12, max(len(name) for name in algorithms) + 1)
     
     print(f"{'Text':<25} {'Pattern':<15} ", end="")
     for name in algorithms.keys():
-        print(f"{name:<12}", end="")
+        print(f"{name:<{width}}", end="")
     print()
     print("-" * 80)
     
@@ -145,7 +176,7 @@ def run_quick_test():
         for name, algo in algorithms.items():
             result = algo(text, pattern)
             results.append(result)
-            print(f"{str(result):<12}", end="")
+            print(f"{str(result):<{width}}", end="")
         
         # Verifikasi semua hasil sama
         if not all(r == results[0] for r in results):
@@ -161,8 +192,269 @@ def run_quick_test():
         print("✗ Ada perbedaan hasil antar algoritma!")
 
 
+def run_calibration():
+    """Kalibrasi threshold planner algoritma otomatis"""
+    from benchmark.calibration import calibrate
+    
+    print("\n--- KALIBRASI PLANNER ---\n")
+    thresholds = calibrate()
+    
+    print("\nThreshold planner:")
+    print(f"  short_text          : {thresholds.short_text}")
+    print(f"  vectorized_min_text : {thresholds.vectorized_min_text}")
+    print(f"  bndm_max_pattern    : {thresholds.bndm_max_pattern}")
+    print(f"  small_alphabet      : {thresholds.small_alphabet}")
+
+
+def resolve_algorithm(name: str):
+    """
+    Fungsi search untuk nama algoritma di command line.
+
+    Args:
+        name: 'auto' atau salah satu kunci CLI_ALGORITHMS
+
+    Returns:
+        Fungsi search(text, pattern)
+    """
+    if name == 'auto':
+        return planner.search
+    if name in planner.ENGINES:
+        return planner.ENGINES[name]
+    if name == 'kmp_trampoline':
+        return kmp_recursive.search_trampolined
+    if name == 'bm_trampoline':
+        return bm_recursive.search_trampolined
+    if name == 'vectorized':
+        from algorithms import vectorized
+        if not vectorized.AVAILABLE:
+            raise ValueError("Engine vectorized membutuhkan numpy")
+        return vectorized.search
+    raise ValueError(f"Algoritma tidak dikenal: {name!r}")
+
+
+def write_rows(rows: list, fmt: str, output: str = None) -> None:
+    """Menulis list dict sebagai JSON atau CSV ke file atau stdout"""
+    f = open(output, 'w', newline='', encoding='utf-8') if output else sys.stdout
+    try:
+        if fmt == 'json':
+            json.dump(rows, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        elif rows:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+    finally:
+        if output:
+            f.close()
+
+
+def cmd_search(args) -> int:
+    """Subcommand search: cari pattern di --text atau --file"""
+    if args.file == '-':
+        text = sys.stdin.read()
+    elif args.file:
+        with open(args.file, encoding='utf-8') as f:
+            text = f.read()
+    else:
+        text = args.text
+
+    rows = []
+    for name in args.algorithm or ['auto']:
+        algorithm = resolve_algorithm(name)
+        start = time.perf_counter()
+        indices = algorithm(text, args.pattern)
+        exec_time = (time.perf_counter() - start) * 1_000_000
+
+        row = {
+            'algorithm': name,
+            'engine': planner.choose_algorithm(text, args.pattern) if name == 'auto' else name,
+            'pattern': args.pattern,
+            'text_length': len(text),
+            'matches': len(indices),
+            'time_us': round(exec_time, 2),
+        }
+        if not args.count_only:
+            row['positions'] = indices if args.format == 'json' else " ".join(map(str, indices))
+        rows.append(row)
+
+    write_rows(rows, args.format, args.output)
+    return 0
+
+
+def cmd_bench(args) -> int:
+    """Subcommand bench: benchmark algoritma terpilih pada ukuran --sizes"""
+    from dataclasses import asdict
+    import math
+    from benchmark.runner import BenchmarkRunner, default_algorithms
+
+    if args.algorithm:
+        algorithms = {CLI_ALGORITHMS[name]: resolve_algorithm(name) for name in args.algorithm}
+    else:
+        algorithms = default_algorithms()
+
+    runner = BenchmarkRunner(
+        iterations=args.iterations,
+        input_sizes=args.sizes,
+        warmup=args.warmup,
+        count_operations=args.count_operations,
+        seed=args.seed,
+    )
+
+    # Progress runner ke stderr agar stdout hanya berisi data
+    with contextlib.redirect_stdout(sys.stderr):
+        results = runner.run_all(algorithms, args.pattern_length)
+        if args.save_history:
+            from benchmark.history import save_run
+            save_run(results)
+
+    if args.format == 'csv':
+        # Format sama dengan export_csv sehingga dapat dibaca oleh subcommand plot
+        if args.output:
+            with contextlib.redirect_stdout(sys.stderr):
+                runner.export_csv(results, args.output)
+        else:
+            runner.write_csv(results, sys.stdout)
+    else:
+        rows = []
+        for r in results:
+            row = asdict(r)
+            # JSON standar tidak mengenal Infinity (sel yang semua run-nya gagal)
+            rows.append({k: (None if isinstance(v, float) and not math.isfinite(v) else v)
+                         for k, v in row.items()})
+        write_rows(rows, 'json', args.output)
+    return 0
+
+
+def cmd_verify(args) -> int:
+    """Subcommand verify: semua algoritma harus sama dengan KMP iteratif"""
+    from utils.text_generator import generate_random_text, generate_pattern
+
+    test_cases = [
+        ("ABABDABACDABABCABAB", "ABABCABAB"),
+        ("AAAAAA", "AAA"),
+        ("ABCDEF", "XYZ"),
+        ("ABCABCABC", "ABC"),
+        ("algoritma KMP dan Boyer Moore adalah algoritma", "algoritma"),
+    ]
+    for i in range(args.random):
+        seed = args.seed + i
+        text = generate_random_text(200 + seed % 800, "ab", seed=seed)
+        test_cases.append((text, generate_pattern(1 + seed % 8, "ab", seed=seed)))
+
+    names = args.algorithm or [name for name in CLI_ALGORITHMS if name != 'vectorized']
+    if not args.algorithm:
+        from algorithms import vectorized
+        if vectorized.AVAILABLE:
+            names.append('vectorized')
+        names.append('auto')
+    algorithms = {name: resolve_algorithm(name) for name in names}
+
+    rows = []
+    for case, (text, pattern) in enumerate(test_cases):
+        expected = kmp_iterative.search(text, pattern)
+        mismatches = [name for name, algo in algorithms.items() if algo(text, pattern) != expected]
+        rows.append({
+            'case': case,
+            'pattern': pattern,
+            'text_length': len(text),
+            'matches': len(expected),
+            'passed': not mismatches,
+            'mismatches': mismatches if args.format == 'json' else " ".join(mismatches),
+        })
+
+    write_rows(rows, args.format, args.output)
+    return 0 if all(row['passed'] for row in rows) else 1
+
+
+def cmd_plot(args) -> int:
+    """Subcommand plot: buat grafik dari CSV hasil benchmark"""
+    from benchmark.runner import BenchmarkRunner
+    from visualization.plotter import Plotter
+
+    results = BenchmarkRunner.load_csv(args.input)
+    Plotter(args.output_dir).plot_all(results)
+    return 0
+
+
+def _int_list(value: str) -> list:
+    """Argumen '100,1000,10000' -> [100, 1000, 10000]"""
+    try:
+        return [int(v) for v in value.split(',') if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Daftar bilangan tidak valid: {value!r}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parser argumen untuk mode non-interaktif"""
+    parser = argparse.ArgumentParser(
+        description="Perbandingan algoritma KMP dan Boyer-Moore (tanpa argumen: menu interaktif)"
+    )
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def add_output_options(p, formats=('json', 'csv')):
+        p.add_argument('--format', choices=formats, default='json', help="format output")
+        p.add_argument('--output', '-o', help="file output (default: stdout)")
+
+    search_names = ['auto'] + list(CLI_ALGORITHMS)
+
+    p = sub.add_parser('search', help="cari pattern di teks atau file")
+    source = p.add_mutually_exclusive_group(required=True)
+    source.add_argument('--text', help="teks yang dicari")
+    source.add_argument('--file', help="file teks (UTF-8); '-' untuk stdin")
+    p.add_argument('--pattern', '-p', required=True, help="pattern yang dicari")
+    p.add_argument('--algorithm', '-a', action='append', choices=search_names,
+                   help="algoritma (boleh berulang, default: auto)")
+    p.add_argument('--count-only', action='store_true', help="tanpa daftar posisi")
+    add_output_options(p)
+    p.set_defaults(func=cmd_search)
+
+    p = sub.add_parser('bench', help="benchmark algoritma")
+    p.add_argument('--sizes', type=_int_list, default=[100, 1000, 10000],
+                   help="ukuran input, dipisah koma (default: 100,1000,10000)")
+    p.add_argument('--algorithm', '-a', action='append', choices=list(CLI_ALGORITHMS),
+                   help="algoritma (boleh berulang, default: semua)")
+    p.add_argument('--iterations', type=int, default=10)
+    p.add_argument('--warmup', type=int, default=2)
+    p.add_argument('--pattern-length', type=int, default=10)
+    p.add_argument('--seed', type=int, help="gunakan corpus cache deterministik")
+    p.add_argument('--count-operations', action='store_true',
+                   help="ikut hitung perbandingan/shift (engine terinstrumentasi)")
+    p.add_argument('--save-history', action='store_true',
+                   help="simpan run ke output/data/benchmark_history.sqlite")
+    add_output_options(p)
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser('verify', help="verifikasi konsistensi algoritma")
+    p.add_argument('--algorithm', '-a', action='append', choices=search_names,
+                   help="algoritma (boleh berulang, default: semua)")
+    p.add_argument('--random', type=int, default=20, help="jumlah kasus random tambahan")
+    p.add_argument('--seed', type=int, default=0)
+    add_output_options(p)
+    p.set_defaults(func=cmd_verify)
+
+    p = sub.add_parser('plot', help="buat grafik dari CSV benchmark")
+    p.add_argument('--input', '-i', default="output/data/benchmark_results.csv")
+    p.add_argument('--output-dir', default="output/graphs")
+    p.set_defaults(func=cmd_plot)
+
+    return parser
+
+
+def run_cli(argv: list) -> int:
+    """Menjalankan subcommand non-interaktif; return exit code"""
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+
 def main():
     """Main function"""
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+
     print_header()
     
     while True:
@@ -170,9 +462,10 @@ def main():
         print("1. Demo Pencarian (input manual)")
         print("2. Benchmark (ukuran 1-10000)")
         print("3. Quick Test (verifikasi algoritma)")
-        print("4. Keluar")
+        print("4. Kalibrasi Planner (algorithm=\"auto\")")
+        print("5. Keluar")
         
-        choice = input("\nPilihan (1-4): ").strip()
+        choice = input("\nPilihan (1-5): ").strip()
         
         if choice == '1':
             run_search_demo()
@@ -181,10 +474,12 @@ def main():
         elif choice == '3':
             run_quick_test()
         elif choice == '4':
+            run_calibration()
+        elif choice == '5':
             print("\nTerima kasih!")
             break
         else:
-            print("Pilihan tidak valid. Silakan pilih 1-4.")
+            print("Pilihan tidak valid. Silakan pilih 1-5.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,2 @@
+# Local HTTP/JSON Search Service
+from .server import SearchService, serve
@@ -0,0 +1,6 @@
+"""Entry point: python -m service --port 8765 --workers 4"""
+import sys
+
+from .server import main
+
+sys.exit(main())
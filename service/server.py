@@ -0,0 +1,366 @@
+"""
+Search Service
+Server HTTP/JSON lokal berbasis asyncio (tanpa dependency tambahan) di atas
+package algorithms.
+
+Endpoint:
+    GET  /health         status + statistik cache pattern
+    POST /search         {"text", "pattern", "algorithm"?}
+    POST /multi-search   {"text" | "texts", "patterns", "algorithm"?}
+    POST /benchmark      {"sizes"?, "algorithms"?, "iterations"?, "pattern_length"?}
+
+Pemakaian:
+    python -m service --port 8765 --workers 4
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import math
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms import planner
+from algorithms.batch import search_many, search_matrix
+from algorithms.compiled import ENGINES, PatternCache
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Engine compiled yang bekerja pada str (bm_bytes khusus bytes)
+SEARCH_ALGORITHMS = sorted(name for name in ENGINES if name != 'bm_bytes')
+
+MAX_BODY_SIZE = 64 * 1024 * 1024
+MAX_BENCHMARK_SIZE = 1_000_000
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+            405: 'Method Not Allowed', 413: 'Payload Too Large',
+            500: 'Internal Server Error'}
+
+
+class HTTPError(Exception):
+    """Error yang dikirim ke client sebagai response JSON {"error": ...}"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _run_benchmark(sizes: List[int], algorithms: List[str], iterations: int,
+                   pattern_length: int) -> List[dict]:
+    """Dijalankan di worker: BenchmarkRunner untuk engine planner terpilih"""
+    from dataclasses import asdict
+    from benchmark.runner import BenchmarkRunner
+
+    runner = BenchmarkRunner(iterations=iterations, input_sizes=sizes)
+    engines = {name: planner.ENGINES[name] for name in algorithms}
+    # Progress runner tidak relevan untuk client HTTP
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = runner.run_all(engines, pattern_length)
+
+    rows = []
+    for r in results:
+        # JSON standar tidak mengenal Infinity (sel yang semua run-nya gagal)
+        rows.append({k: (None if isinstance(v, float) and not math.isfinite(v) else v)
+                     for k, v in asdict(r).items()})
+    return rows
+
+
+class SearchService:
+    """
+    Logika endpoint: cache pattern, penggabungan request, dan offload ke worker.
+
+    Request /search dengan (pattern, algorithm) yang sama yang datang dalam
+    jendela batch_window digabung menjadi satu pemanggilan search_many.
+    Batch dengan total text >= offload_threshold dijalankan di executor agar
+    event loop tetap responsif; batch kecil dijalankan langsung dengan
+    CompiledPattern dari cache.
+    """
+
+    def __init__(self, cache_size: int = 256, executor: Optional[Executor] = None,
+                 offload_threshold: int = 256 * 1024, batch_window: float = 0.001):
+        self.cache = PatternCache(cache_size)
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+        self.batch_window = batch_window
+        self.batches_flushed = 0
+        self.requests_batched = 0
+        self._pending: Dict[Tuple[str, str], Tuple[List[str], List[asyncio.Future]]] = {}
+
+    @staticmethod
+    def _algorithm(body: dict) -> str:
+        """Nama engine dari body (default 'kmp'), divalidasi terhadap SEARCH_ALGORITHMS"""
+        algorithm = body.get('algorithm', 'kmp')
+        if algorithm not in SEARCH_ALGORITHMS:
+            raise HTTPError(400, f"Algoritma tidak dikenal: {algorithm!r} "
+                                 f"(pilihan: {', '.join(SEARCH_ALGORITHMS)})")
+        return algorithm
+
+    @staticmethod
+    def _string(body: dict, key: str) -> str:
+        """Field string wajib dari body"""
+        value = body.get(key)
+        if not isinstance(value, str):
+            raise HTTPError(400, f"Field {key!r} harus berupa string")
+        return value
+
+    async def search(self, text: str, pattern: str, algorithm: str = 'kmp') -> List[int]:
+        """Mencari pattern di text; digabung dengan request lain untuk pattern yang sama"""
+        loop = asyncio.get_running_loop()
+        key = (pattern, algorithm)
+        future = loop.create_future()
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = ([], [])
+            loop.create_task(self._flush_later(key))
+        batch[0].append(text)
+        batch[1].append(future)
+        return await future
+
+    async def _flush_later(self, key: Tuple[str, str]) -> None:
+        """Menunggu jendela batch lalu menjalankan semua request yang terkumpul"""
+        await asyncio.sleep(self.batch_window)
+        texts, futures = self._pending.pop(key)
+        pattern, algorithm = key
+        self.batches_flushed += 1
+        self.requests_batched += len(texts)
+
+        try:
+            if sum(map(len, texts)) >= self.offload_threshold:
+                loop = asyncio.get_running_loop()
+                found = await loop.run_in_executor(
+                    self.executor, search_many, texts, pattern, algorithm
+                )
+                positions = [[] for _ in texts]
+                for record_id, offsets in found:
+                    positions[record_id] = offsets
+            else:
+                matcher = self.cache.get(pattern, algorithm)
+                positions = [matcher.search(text) for text in texts]
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(futures, positions):
+            if not future.done():
+                future.set_result(result)
+
+    async def handle_search(self, body: dict) -> dict:
+        """POST /search: satu pattern pada satu text"""
+        text = self._string(body, 'text')
+        pattern = self._string(body, 'pattern')
+        algorithm = self._algorithm(body)
+        positions = await self.search(text, pattern, algorithm)
+        return {'pattern': pattern, 'algorithm': algorithm,
+                'matches': len(positions), 'positions': positions}
+
+    async def handle_multi_search(self, body: dict) -> dict:
+        """POST /multi-search: beberapa pattern pada satu atau banyak text"""
+        if 'texts' in body:
+            texts = body['texts']
+        else:
+            texts = [self._string(body, 'text')]
+        patterns = body.get('patterns')
+        if (not isinstance(texts, list) or not all(isinstance(t, str) for t in texts)
+                or not isinstance(patterns, list)
+                or not all(isinstance(p, str) for p in patterns)):
+            raise HTTPError(400, "Field 'texts'/'text' dan 'patterns' harus berisi string")
+        algorithm = self._algorithm(body)
+
+        if sum(map(len, texts)) * max(1, len(patterns)) >= self.offload_threshold:
+            loop = asyncio.get_running_loop()
+            found = await loop.run_in_executor(
+                self.executor, search_matrix, texts, patterns, algorithm
+            )
+        else:
+            found = search_matrix(texts, patterns, algorithm)
+
+        return {'algorithm': algorithm,
+                'results': [{'record_id': record_id, 'pattern_id': pattern_id,
+                             'positions': offsets}
+                            for record_id, pattern_id, offsets in found]}
+
+    async def handle_benchmark(self, body: dict) -> dict:
+        """POST /benchmark: BenchmarkRunner untuk engine planner, dijalankan di worker"""
+        sizes = body.get('sizes', [100, 1000, 10000])
+        algorithms = body.get('algorithms', sorted(planner.ENGINES))
+        iterations = body.get('iterations', 5)
+        pattern_length = body.get('pattern_length', 10)
+
+        if (not isinstance(sizes, list)
+                or not all(isinstance(s, int) and 0 < s <= MAX_BENCHMARK_SIZE for s in sizes)):
+            raise HTTPError(400, f"'sizes' harus list bilangan 1..{MAX_BENCHMARK_SIZE}")
+        unknown = [a for a in algorithms if a not in planner.ENGINES]
+        if unknown:
+            raise HTTPError(400, f"Algoritma tidak dikenal: {unknown} "
+                                 f"(pilihan: {', '.join(sorted(planner.ENGINES))})")
+        if not isinstance(iterations, int) or not 1 <= iterations <= 100:
+            raise HTTPError(400, "'iterations' harus bilangan 1..100")
+        if not isinstance(pattern_length, int) or pattern_length < 1:
+            raise HTTPError(400, "'pattern_length' harus bilangan positif")
+
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(
+            self.executor, _run_benchmark, sizes, algorithms, iterations, pattern_length
+        )
+        return {'results': rows}
+
+    async def handle_health(self, body: dict) -> dict:
+        """GET /health: status dan statistik cache/batching"""
+        return {'status': 'ok', 'cache': self.cache.info()._asdict(),
+                'batches_flushed': self.batches_flushed,
+                'requests_batched': self.requests_batched}
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> dict:
+        """Memanggil handler sesuai method dan path"""
+        routes = {
+            ('GET', '/health'): self.handle_health,
+            ('POST', '/search'): self.handle_search,
+            ('POST', '/multi-search'): self.handle_multi_search,
+            ('POST', '/benchmark'): self.handle_benchmark,
+        }
+        handler = routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in routes):
+                raise HTTPError(405, f"Method {method} tidak didukung untuk {path}")
+            raise HTTPError(404, f"Endpoint tidak ditemukan: {path}")
+
+        payload = {}
+        if body:
+            try:
+                payload = json.loads(body)
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                raise HTTPError(400, f"JSON tidak valid: {e}")
+            if not isinstance(payload, dict):
+                raise HTTPError(400, "Body harus berupa objek JSON")
+        return await handler(payload)
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Melayani satu koneksi HTTP/1.1 (keep-alive) sampai client menutupnya"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "Request line tidak valid"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = (connection != 'close' if version == 'HTTP/1.1'
+                              else connection == 'keep-alive')
+
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    await self._respond(writer, 400, {'error': "Content-Length tidak valid"}, False)
+                    break
+                if length < 0 or length > MAX_BODY_SIZE:
+                    await self._respond(writer, 413, {'error': "Body terlalu besar"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                path = target.split('?', 1)[0]
+                try:
+                    status, payload = 200, await self.dispatch(method, path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:  # jangan jatuhkan server karena satu request
+                    status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: dict,
+                       keep_alive: bool) -> None:
+        """Menulis response JSON lengkap dengan header HTTP"""
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + data)
+        await writer.drain()
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                workers: Optional[int] = None, cache_size: int = 256,
+                offload_threshold: int = 256 * 1024,
+                batch_window: float = 0.001) -> None:
+    """
+    Menjalankan server sampai dihentikan.
+
+    Args:
+        host: Alamat bind
+        port: Port (0 = dipilih otomatis)
+        workers: Jumlah proses worker (default: os.cpu_count(); 0 = thread pool default)
+        cache_size: Kapasitas cache CompiledPattern
+        offload_threshold: Total karakter minimum agar scan dikirim ke worker
+        batch_window: Lama (detik) menunggu request lain untuk pattern yang sama
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    service = SearchService(cache_size, executor, offload_threshold, batch_window)
+
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    bound = server.sockets[0].getsockname()
+    print(f"Listening on http://{bound[0]}:{bound[1]}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point command line"""
+    parser = argparse.ArgumentParser(description="Server HTTP/JSON untuk algoritma pencarian")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, help="jumlah proses worker (0 = tanpa proses)")
+    parser.add_argument('--cache-size', type=int, default=256)
+    parser.add_argument('--offload-threshold', type=int, default=256 * 1024)
+    parser.add_argument('--batch-window', type=float, default=0.001)
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.cache_size,
+                          args.offload_threshold, args.batch_window))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
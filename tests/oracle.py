@@ -0,0 +1,27 @@
+"""
+Oracle naive dan strategi hypothesis bersama untuk test engine pencarian
+"""
+from typing import List
+
+from hypothesis import strategies as st
+
+
+def naive_search(text: str, pattern: str) -> List[int]:
+    """Semua indeks awal kemunculan pattern, dengan membandingkan setiap window"""
+    if not pattern:
+        return []
+    m = len(pattern)
+    return [s for s in range(len(text) - m + 1) if text[s:s + m] == pattern]
+
+
+# Alfabet kecil agar kemunculan (dan pattern periodik) sering terjadi
+small_alphabet = st.sampled_from(['ab', 'abc', 'acgt', 'aé€'])
+
+
+@st.composite
+def text_and_pattern(draw, max_text: int = 60, max_pattern: int = 8):
+    """Pasangan (text, pattern) dari alfabet yang sama"""
+    alphabet = draw(small_alphabet)
+    text = draw(st.text(alphabet, max_size=max_text))
+    pattern = draw(st.text(alphabet, min_size=1, max_size=max_pattern))
+    return text, pattern
@@ -0,0 +1,79 @@
+"""Test approximate matching (Hamming dan Levenshtein) terhadap baseline naive"""
+import pytest
+from hypothesis import given, strategies as st
+
+from algorithms import approximate
+
+
+# Karakter non-BMP dan surrogate menguji encoding lebar di verifier Hamming
+alphabets = st.sampled_from(['ab', 'acgt', 'aé€😀', 'a\ud800'])
+engines = st.sampled_from(['bm', 'kmp', 'two_way'])
+
+
+@st.composite
+def approximate_case(draw, max_text: int = 60, max_pattern: int = 10):
+    alphabet = draw(alphabets)
+    text = draw(st.text(alphabet, max_size=max_text))
+    pattern = draw(st.text(alphabet, min_size=1, max_size=max_pattern))
+    k = draw(st.integers(0, 4))
+    return text, pattern, k
+
+
+def edit_distance(a: str, b: str) -> int:
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        prev, row[0] = row[0], i
+        for j, cb in enumerate(b, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (ca != cb))
+    return row[-1]
+
+
+@given(approximate_case(), engines)
+def test_hamming_matches_naive(case, algorithm):
+    text, pattern, k = case
+    assert (approximate.search_hamming(text, pattern, k, algorithm)
+            == approximate.naive_hamming(text, pattern, k))
+
+
+@given(approximate_case(), engines)
+def test_levenshtein_matches_naive(case, algorithm):
+    text, pattern, k = case
+    assert (approximate.search_levenshtein(text, pattern, k, algorithm)
+            == approximate.naive_levenshtein(text, pattern, k))
+
+
+@given(approximate_case(max_text=15, max_pattern=5))
+def test_naive_levenshtein_matches_definition(case):
+    # Distance di posisi akhir j = minimum edit distance atas semua substring text[i:j]
+    text, pattern, k = case
+    expected = []
+    for j in range(1, len(text) + 1):
+        d = min(edit_distance(pattern, text[i:j]) for i in range(j + 1))
+        if d <= k:
+            expected.append((j, d))
+    assert approximate.naive_levenshtein(text, pattern, k) == expected
+
+
+@given(st.text('ab', min_size=1, max_size=12), st.integers(1, 12))
+def test_split_pattern_covers_pattern(pattern, pieces):
+    parts = approximate.split_pattern(pattern, pieces)
+    assert ''.join(piece for _, piece in parts) == pattern
+    assert all(pattern[offset:offset + len(piece)] == piece for offset, piece in parts)
+
+
+def test_mode_dispatch():
+    text, pattern = 'abcabdabc', 'abc'
+    assert approximate.search(text, pattern, 1) == approximate.naive_hamming(text, pattern, 1)
+    assert (approximate.search(text, pattern, 1, mode='levenshtein')
+            == approximate.naive_levenshtein(text, pattern, 1))
+    with pytest.raises(ValueError):
+        approximate.search(text, pattern, 1, mode='jaro')
+
+
+def test_edge_cases():
+    for search in (approximate.search_hamming, approximate.search_levenshtein):
+        assert search('', 'a', 1) == []
+        assert search('abc', '', 1) == []
+        assert search('abc', 'a', -1) == []
+    assert approximate.search_hamming('ab', 'abc', 3) == []
+    assert approximate.search_levenshtein('ab', 'abc', 1) == [(2, 1)]
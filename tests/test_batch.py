@@ -0,0 +1,62 @@
+"""Test search_many / search_matrix: mode separator (join) dan prefilter"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from algorithms.batch import _separator, search_many, search_matrix
+from tests.oracle import naive_search
+
+
+# Record boleh memuat '\x00' (kandidat separator pertama) agar batas record teruji
+records = st.lists(st.text('ab\x00', max_size=12), max_size=20)
+patterns = st.text('ab', min_size=1, max_size=4)
+modes = st.sampled_from([True, False])
+batch_sizes = st.sampled_from([1, 2, 7, 1024])
+
+
+def expected_many(texts, pattern):
+    return [(i, naive_search(t, pattern)) for i, t in enumerate(texts)
+            if naive_search(t, pattern)]
+
+
+@given(records, patterns, modes, batch_sizes)
+def test_search_many_matches_naive(texts, pattern, prefilter, batch_size):
+    result = search_many(texts, pattern, batch_size=batch_size, prefilter=prefilter)
+    assert result == expected_many(texts, pattern)
+
+
+@given(records, st.lists(st.text('ab\x00', max_size=3), min_size=1, max_size=4),
+       modes, batch_sizes)
+def test_search_matrix_matches_naive(texts, pattern_list, prefilter, batch_size):
+    expected = [(i, j, naive_search(t, p))
+                for i, t in enumerate(texts)
+                for j, p in enumerate(pattern_list)
+                if naive_search(t, p)]
+    result = search_matrix(texts, pattern_list, batch_size=batch_size, prefilter=prefilter)
+    assert result == expected
+
+
+@settings(max_examples=20, deadline=None)
+@given(records, patterns, modes)
+def test_executor_preserves_order(texts, pattern, prefilter):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = search_many(iter(texts), pattern, batch_size=3,
+                             executor=executor, prefilter=prefilter)
+    assert result == expected_many(texts, pattern)
+
+
+def test_separator_is_absent_from_patterns():
+    assert _separator(['ab']) == '\x00'
+    assert _separator(['\x00', 'a\x01']) == '\x02'
+
+
+@pytest.mark.parametrize('prefilter', [True, False])
+def test_match_never_spans_records(prefilter):
+    # 'ab' hanya muncul jika dua record digabung tanpa separator
+    assert search_many(['xa', 'by', 'ab'], 'ab', prefilter=prefilter) == [(2, [0])]
+
+
+def test_unknown_algorithm_raises():
+    with pytest.raises(ValueError):
+        search_many(['abc'], 'b', algorithm='tidak_ada')
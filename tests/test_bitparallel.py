@@ -0,0 +1,35 @@
+"""Test engine bit-parallel Shift-Or dan BNDM"""
+import pytest
+from hypothesis import given, strategies as st
+
+from algorithms import bitparallel
+from tests.oracle import naive_search, text_and_pattern
+
+
+ENGINES = [bitparallel.search_shift_or, bitparallel.search_bndm]
+
+
+@pytest.mark.parametrize('search', ENGINES)
+@given(case=text_and_pattern())
+def test_matches_naive(search, case):
+    text, pattern = case
+    assert search(text, pattern) == naive_search(text, pattern)
+
+
+@pytest.mark.parametrize('search', ENGINES)
+@given(data=st.data())
+def test_patterns_around_word_size(search, data):
+    # Pattern di sekitar WORD_SIZE: batas mask satu word dan fallback Boyer-Moore
+    m = data.draw(st.integers(bitparallel.WORD_SIZE - 2, bitparallel.WORD_SIZE + 2))
+    text = data.draw(st.text('ab', min_size=m, max_size=3 * m))
+    start = data.draw(st.integers(0, len(text) - m))
+    pattern = text[start:start + m]
+    assert search(text, pattern) == naive_search(text, pattern)
+
+
+@pytest.mark.parametrize('search', ENGINES)
+def test_edge_cases(search):
+    assert search('', 'a') == []
+    assert search('abc', '') == []
+    assert search('ab', 'abc') == []
+    assert search('aaaa', 'aa') == [0, 1, 2]
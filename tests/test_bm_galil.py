@@ -0,0 +1,51 @@
+"""Test Boyer-Moore dengan good suffix rule dan Galil rule"""
+from hypothesis import given, strategies as st
+
+from algorithms import bm_iterative
+from tests.oracle import naive_search, text_and_pattern
+
+
+def naive_good_suffix_table(pattern: str):
+    """
+    Strong good suffix rule secara langsung: shift[j + 1] adalah pergeseran
+    s >= 1 terkecil di mana suffix pattern[j + 1:] tetap cocok dan karakter
+    sebelumnya berbeda; shift[0] adalah periode pattern.
+    """
+    m = len(pattern)
+
+    def is_safe(j: int, s: int) -> bool:
+        for i in range(j + 1, m):
+            if i - s >= 0 and pattern[i - s] != pattern[i]:
+                return False
+        return j < 0 or j - s < 0 or pattern[j - s] != pattern[j]
+
+    table = []
+    for j in range(-1, m):
+        s = 1
+        while not is_safe(j, s):
+            s += 1
+        table.append(s)
+    return table
+
+
+@given(st.text('ab', min_size=1, max_size=12))
+def test_good_suffix_table_matches_definition(pattern):
+    assert bm_iterative.compute_good_suffix_table(pattern) == naive_good_suffix_table(pattern)
+
+
+@given(text_and_pattern())
+def test_search_galil_matches_naive(case):
+    text, pattern = case
+    assert bm_iterative.search_galil(text, pattern) == naive_search(text, pattern)
+
+
+def test_search_galil_periodic_worst_case():
+    text = 'a' * 500
+    assert bm_iterative.search_galil(text, 'a' * 7) == list(range(494))
+    assert bm_iterative.search_galil(text, 'b' + 'a' * 6) == []
+
+
+def test_search_galil_edge_cases():
+    assert bm_iterative.search_galil('', 'a') == []
+    assert bm_iterative.search_galil('abc', '') == []
+    assert bm_iterative.search_galil('ab', 'abc') == []
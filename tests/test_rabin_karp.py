@@ -0,0 +1,65 @@
+"""Test Rabin-Karp: pencarian satu pattern dan multi-pattern (search_set)"""
+import pytest
+from hypothesis import given, strategies as st
+
+from algorithms import rabin_karp
+from tests.oracle import naive_search, small_alphabet, text_and_pattern
+
+
+@st.composite
+def text_and_pattern_set(draw, max_text: int = 60):
+    """Text dan list pattern sama panjang (boleh kembar) dari alfabet yang sama"""
+    alphabet = draw(small_alphabet)
+    text = draw(st.text(alphabet, max_size=max_text))
+    m = draw(st.integers(1, 5))
+    pattern = st.text(alphabet, min_size=m, max_size=m)
+    patterns = draw(st.lists(pattern, min_size=1, max_size=6))
+    return text, patterns
+
+
+def expected_set(text, patterns):
+    return sorted((pos, pattern_id)
+                  for pattern_id, pattern in enumerate(patterns)
+                  for pos in naive_search(text, pattern))
+
+
+def as_position_order(results):
+    return [(pos, pattern_id) for pattern_id, pos in results]
+
+
+@given(text_and_pattern())
+def test_search_matches_naive(case):
+    text, pattern = case
+    assert rabin_karp.search(text, pattern) == naive_search(text, pattern)
+
+
+@given(text_and_pattern_set())
+def test_search_set_matches_naive(case):
+    text, patterns = case
+    assert as_position_order(rabin_karp.search_set(text, patterns)) == expected_set(text, patterns)
+
+
+@given(text_and_pattern_set(max_text=30))
+def test_search_set_verifies_hash_collisions(case):
+    # MOD kecil memaksa banyak tabrakan hash; hasil tetap harus diverifikasi
+    text, patterns = case
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(rabin_karp, 'MOD', 7)
+        result = rabin_karp.search_set(text, patterns)
+    assert as_position_order(result) == expected_set(text, patterns)
+
+
+def test_search_set_rejects_mixed_lengths():
+    with pytest.raises(ValueError):
+        rabin_karp.search_set('abcabc', ['ab', 'abc'])
+    # Pattern kosong bercampur pattern lain juga ditolak, walau text kosong
+    with pytest.raises(ValueError):
+        rabin_karp.search_set('', ['', 'a'])
+
+
+def test_search_set_edge_cases():
+    assert rabin_karp.search_set('abc', []) == []
+    assert rabin_karp.search_set('', ['ab']) == []
+    assert rabin_karp.search_set('abc', ['']) == []
+    assert rabin_karp.search_set('ab', ['abc']) == []
+    assert rabin_karp.search_set('abab', ['ab', 'ab']) == [(0, 0), (1, 0), (0, 2), (1, 2)]
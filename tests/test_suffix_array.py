@@ -0,0 +1,52 @@
+"""Test index suffix array, termasuk save/load"""
+import pytest
+from hypothesis import given, strategies as st
+
+from algorithms import suffix_array
+from algorithms.suffix_array import SuffixArrayIndex
+from tests.oracle import naive_search, small_alphabet, text_and_pattern
+
+
+@given(small_alphabet.flatmap(lambda alphabet: st.text(alphabet, max_size=80)))
+def test_build_matches_sorted_suffixes(text):
+    expected = sorted(range(len(text)), key=lambda i: text[i:])
+    assert list(suffix_array.build_suffix_array(text)) == expected
+
+
+@given(text_and_pattern())
+def test_search_and_count_match_naive(case):
+    text, pattern = case
+    index = SuffixArrayIndex(text)
+    expected = naive_search(text, pattern)
+    assert index.search(pattern) == expected
+    assert index.count(pattern) == len(expected)
+    assert suffix_array.search(text, pattern) == expected
+
+
+def test_save_load_roundtrip(tmp_path):
+    text = 'mississippi banana ∑é ' * 20
+    index = SuffixArrayIndex(text)
+    path = tmp_path / 'index.sa'
+    size = index.save(str(path))
+    assert size == path.stat().st_size
+
+    loaded = SuffixArrayIndex.load(str(path))
+    assert loaded.text == text
+    assert list(loaded.sa) == list(index.sa)
+    for pattern in ['issi', 'ana', '∑é', 'x', text]:
+        assert loaded.search(pattern) == naive_search(text, pattern)
+
+
+def test_load_rejects_foreign_file(tmp_path):
+    path = tmp_path / 'bukan_index.bin'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        SuffixArrayIndex.load(str(path))
+
+
+def test_load_rejects_truncated_file(tmp_path):
+    path = tmp_path / 'index.sa'
+    SuffixArrayIndex('abracadabra').save(str(path))
+    path.write_bytes(path.read_bytes()[:-4])
+    with pytest.raises(ValueError):
+        SuffixArrayIndex.load(str(path))
@@ -0,0 +1,59 @@
+"""Test Two-Way String Matching (Crochemore-Perrin)"""
+from hypothesis import given, strategies as st
+
+from algorithms import compiled, two_way
+from tests.oracle import naive_search, text_and_pattern
+
+
+def naive_period(pattern: str) -> int:
+    """Periode terkecil p: pattern[i] == pattern[i + p] untuk semua i"""
+    m = len(pattern)
+    return next(p for p in range(1, m + 1) if pattern[p:] == pattern[:m - p])
+
+
+@given(text_and_pattern())
+def test_search_matches_naive(case):
+    text, pattern = case
+    assert two_way.search(text, pattern) == naive_search(text, pattern)
+
+
+@given(text_and_pattern())
+def test_compiled_engine_matches_naive(case):
+    text, pattern = case
+    assert compiled.compile(pattern, 'two_way').search(text) == naive_search(text, pattern)
+
+
+@given(st.text('ab', min_size=1, max_size=16))
+def test_factorization_period(pattern):
+    ell, period, periodic = two_way.critical_factorization(pattern)
+    m = len(pattern)
+    assert -1 <= ell < m
+    if periodic:
+        assert period == naive_period(pattern)
+    else:
+        # Pergeseran aman untuk pattern non-periodik tidak melebihi m
+        assert period == max(ell + 1, m - ell - 1) + 1
+        assert period <= m + 1
+
+
+@given(st.text('ab', min_size=1, max_size=5), st.integers(1, 6),
+       st.text('ab', max_size=20))
+def test_periodic_patterns(base, repeat, noise):
+    # Pattern periodik memakai memory prefix; teks juga dibuat periodik
+    pattern = base * repeat
+    text = noise + base * (repeat + 3) + noise
+    assert two_way.search(text, pattern) == naive_search(text, pattern)
+
+
+def test_long_periodic_pattern_crosses_compare_chunks():
+    # Pattern lebih panjang dari _COMPARE_CHUNK menguji perbandingan per potongan
+    pattern = 'ab' * (two_way._COMPARE_CHUNK + 10)
+    text = 'b' + pattern + 'ab' * 3 + 'a'
+    assert two_way.search(text, pattern) == naive_search(text, pattern)
+
+
+def test_edge_cases():
+    assert two_way.search('', 'a') == []
+    assert two_way.search('abc', '') == []
+    assert two_way.search('ab', 'abc') == []
+    assert two_way.search('aaaa', 'aa') == [0, 1, 2]
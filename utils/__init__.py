@@ -1,2 +1,5 @@
 # Utility Module
 from .text_generator import generate_random_text, generate_pattern
+from .text_generator import generate_text, generate_worst_case, ALPHABETS, DISTRIBUTIONS
+from .text_generator import generate_bulk_bytes, generate_bulk_text
+from .corpus_cache import ensure_corpus, open_corpus, load_corpus_text
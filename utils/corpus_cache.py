@@ -0,0 +1,98 @@
+"""
+Corpus Cache Utility
+Menyimpan corpus benchmark hasil generate_bulk_bytes di disk (output/data/corpus)
+agar run berikutnya dapat langsung memakainya lewat mmap
+"""
+from contextlib import contextmanager
+from typing import Iterator
+import hashlib
+import mmap
+import os
+import string
+
+from .text_generator import generate_bulk_bytes
+
+
+DEFAULT_CORPUS_DIR = "output/data/corpus"
+
+
+def corpus_path(size: int, seed: int = 0, alphabet: str = string.ascii_lowercase,
+                cache_dir: str = DEFAULT_CORPUS_DIR) -> str:
+    """
+    Path file corpus untuk kombinasi (size, seed, alphabet).
+
+    Returns:
+        Path file di cache_dir
+    """
+    digest = hashlib.sha1(alphabet.encode('utf-8')).hexdigest()[:8]
+    return os.path.join(cache_dir, f"corpus_{size}_{seed}_{digest}.txt")
+
+
+def ensure_corpus(size: int, seed: int = 0, alphabet: str = string.ascii_lowercase,
+                  cache_dir: str = DEFAULT_CORPUS_DIR) -> str:
+    """
+    Memastikan file corpus ada di cache, membuatnya jika belum ada.
+
+    File ditulis ke file sementara lalu di-rename, sehingga run yang terputus
+    tidak meninggalkan corpus setengah jadi.
+
+    Args:
+        size: Panjang corpus (byte, 1 karakter ASCII = 1 byte)
+        seed: Seed generator
+        alphabet: Karakter ASCII yang digunakan
+        cache_dir: Direktori cache
+
+    Returns:
+        Path file corpus
+    """
+    path = corpus_path(size, seed, alphabet, cache_dir)
+    if os.path.exists(path) and os.path.getsize(path) == size:
+        return path
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            for chunk in generate_bulk_bytes(size, alphabet, seed):
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return path
+
+
+@contextmanager
+def open_corpus(size: int, seed: int = 0, alphabet: str = string.ascii_lowercase,
+                cache_dir: str = DEFAULT_CORPUS_DIR) -> Iterator[mmap.mmap]:
+    """
+    Membuka corpus dari cache sebagai mmap read-only (tanpa membaca ke memori).
+
+    Contoh:
+        with open_corpus(10**9, seed=42) as data:
+            bm_bytes.search(data, b'pattern')
+
+    Returns:
+        Context manager yang menghasilkan mmap.mmap
+    """
+    if size <= 0:
+        raise ValueError("Corpus kosong tidak dapat di-mmap")
+    path = ensure_corpus(size, seed, alphabet, cache_dir)
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def load_corpus_text(size: int, seed: int = 0, alphabet: str = string.ascii_lowercase,
+                     cache_dir: str = DEFAULT_CORPUS_DIR) -> str:
+    """
+    Memuat corpus dari cache sebagai str (untuk engine yang membutuhkan str).
+
+    Returns:
+        String corpus dengan panjang size
+    """
+    if size <= 0:
+        return ""
+    with open_corpus(size, seed, alphabet, cache_dir) as mm:
+        return mm[:].decode('ascii')
@@ -4,38 +4,110 @@ Untuk menghasilkan teks dan pattern random untuk benchmarking
 """
 import random
 import string
+from typing import Iterator, Optional
 
 
-def generate_random_text(size: int, alphabet: str = string.ascii_lowercase) -> str:
+# Ukuran blok generate_bulk_bytes (karakter)
+BULK_BLOCK_SIZE = 1024 * 1024
+
+
+def generate_random_text(size: int, alphabet: str = string.ascii_lowercase,
+                         seed: Optional[int] = None,
+                         rng: Optional[random.Random] = None) -> str:
     """
     Generate random text dengan ukuran tertentu.
     
     Args:
         size: Panjang teks yang diinginkan
         alphabet: Karakter yang digunakan (default: huruf kecil a-z)
+        seed: Seed untuk hasil deterministik (default: random global)
+        rng: Generator yang dipakai (diutamakan di atas seed)
         
     Returns:
         String random dengan panjang size
     """
     if size <= 0:
         return ""
-    return ''.join(random.choice(alphabet) for _ in range(size))
+    if rng is None:
+        rng = random.Random(seed) if seed is not None else random
+    return ''.join(rng.choices(alphabet, k=size))
 
 
-def generate_pattern(length: int, alphabet: str = string.ascii_lowercase) -> str:
+def generate_pattern(length: int, alphabet: str = string.ascii_lowercase,
+                     seed: Optional[int] = None) -> str:
     """
     Generate random pattern.
     
     Args:
         length: Panjang pattern yang diinginkan
         alphabet: Karakter yang digunakan (default: huruf kecil a-z)
+        seed: Seed untuk hasil deterministik (default: random global)
         
     Returns:
         String random dengan panjang length
     """
     if length <= 0:
         return ""
-    return ''.join(random.choice(alphabet) for _ in range(length))
+    rng = random.Random(seed) if seed is not None else random
+    return ''.join(rng.choices(alphabet, k=length))
+
+
+def generate_bulk_bytes(size: int, alphabet: str = string.ascii_lowercase,
+                        seed: int = 0) -> Iterator[bytes]:
+    """
+    Generate text ASCII uniform dalam blok bytes, cepat dan deterministik per seed.
+    
+    Byte acak dari random.Random(seed).randbytes dipetakan ke alphabet dengan
+    bytes.translate; byte di atas kelipatan len(alphabet) terbesar dibuang
+    sehingga distribusinya tetap uniform. Tidak ada loop Python per karakter.
+    
+    Args:
+        size: Total panjang teks
+        alphabet: Karakter ASCII yang digunakan
+        seed: Seed generator
+        
+    Returns:
+        Iterator blok bytes dengan total panjang size
+    """
+    if not alphabet.isascii():
+        raise ValueError("generate_bulk_bytes hanya mendukung alphabet ASCII")
+    if not 0 < len(alphabet) <= 256:
+        # Di atas 256 karakter semua byte ditolak dan loop tidak pernah selesai
+        raise ValueError(
+            f"generate_bulk_bytes membutuhkan 1-256 karakter alphabet: {len(alphabet)}"
+        )
+    
+    k = len(alphabet)
+    limit = 256 - 256 % k
+    table = bytes(ord(alphabet[b % k]) for b in range(256))
+    rejected = bytes(range(limit, 256))
+    rng = random.Random(seed)
+    
+    remaining = size
+    while remaining > 0:
+        block = min(remaining, BULK_BLOCK_SIZE)
+        # Sedikit lebih banyak byte untuk menutup byte yang dibuang
+        chunk = rng.randbytes(block + block // 8 + 16).translate(table, rejected)[:block]
+        yield chunk
+        remaining -= len(chunk)
+
+
+def generate_bulk_text(size: int, alphabet: str = string.ascii_lowercase,
+                       seed: int = 0) -> str:
+    """
+    Versi str dari generate_bulk_bytes (deterministik per seed).
+    
+    Args:
+        size: Panjang teks yang diinginkan
+        alphabet: Karakter ASCII yang digunakan
+        seed: Seed generator
+        
+    Returns:
+        String random dengan panjang size
+    """
+    if size <= 0:
+        return ""
+    return b''.join(generate_bulk_bytes(size, alphabet, seed)).decode('ascii')
 
 
 def generate_text_with_pattern(text_size: int, pattern: str, 
@@ -88,3 +160,198 @@ def generate_text_with_pattern(text_size: int, pattern: str,
     
     text = ''.join(result)
     return text[:text_size]  # Pastikan panjang tepat
+
+
+# Alfabet bernama untuk workload benchmark
+ALPHABETS = {
+    'binary': '01',
+    'dna': 'ACGT',
+    'lowercase': string.ascii_lowercase,
+    'alphanumeric': string.ascii_letters + string.digits,
+}
+
+# Frekuensi huruf bahasa Inggris (persen)
+ENGLISH_LETTER_FREQUENCIES = {
+    'a': 8.2, 'b': 1.5, 'c': 2.8, 'd': 4.3, 'e': 12.7, 'f': 2.2, 'g': 2.0,
+    'h': 6.1, 'i': 7.0, 'j': 0.15, 'k': 0.77, 'l': 4.0, 'm': 2.4, 'n': 6.7,
+    'o': 7.5, 'p': 1.9, 'q': 0.095, 'r': 6.0, 's': 6.3, 't': 9.1, 'u': 2.8,
+    'v': 0.98, 'w': 2.4, 'x': 0.15, 'y': 2.0, 'z': 0.074,
+}
+
+DISTRIBUTIONS = ['uniform', 'zipf', 'english', 'markov', 'periodic', 'worst_case']
+
+
+def generate_zipf_text(size: int, alphabet: str = string.ascii_lowercase,
+                       exponent: float = 1.0,
+                       rng: Optional[random.Random] = None) -> str:
+    """
+    Generate text dengan frekuensi karakter mengikuti distribusi Zipf.
+    
+    Karakter ke-r pada alphabet muncul dengan peluang sebanding 1 / r^exponent.
+    
+    Args:
+        size: Panjang teks yang diinginkan
+        alphabet: Karakter yang digunakan, terurut dari paling sering
+        exponent: Eksponen Zipf (semakin besar semakin timpang)
+        rng: Generator yang dipakai (default: random global)
+        
+    Returns:
+        String random dengan panjang size
+    """
+    if size <= 0:
+        return ""
+    rng = rng or random
+    weights = [1 / (rank ** exponent) for rank in range(1, len(alphabet) + 1)]
+    return ''.join(rng.choices(alphabet, weights=weights, k=size))
+
+
+def generate_english_like_text(size: int, rng: Optional[random.Random] = None) -> str:
+    """
+    Generate text huruf kecil dengan frekuensi huruf bahasa Inggris.
+    
+    Args:
+        size: Panjang teks yang diinginkan
+        rng: Generator yang dipakai (default: random global)
+        
+    Returns:
+        String random dengan panjang size
+    """
+    if size <= 0:
+        return ""
+    rng = rng or random
+    letters = list(ENGLISH_LETTER_FREQUENCIES.keys())
+    weights = list(ENGLISH_LETTER_FREQUENCIES.values())
+    return ''.join(rng.choices(letters, weights=weights, k=size))
+
+
+def generate_markov_text(size: int, alphabet: str = string.ascii_lowercase,
+                         training_text: str = None,
+                         rng: Optional[random.Random] = None) -> str:
+    """
+    Generate text dari rantai Markov orde 1.
+    
+    Peluang transisi diambil dari training_text jika diberikan; jika tidak,
+    dibuat acak dan timpang sehingga tiap karakter punya beberapa "penerus" favorit.
+    
+    Args:
+        size: Panjang teks yang diinginkan
+        alphabet: Karakter yang digunakan (diabaikan jika training_text diberikan)
+        training_text: Teks contoh untuk menghitung peluang transisi
+        rng: Generator yang dipakai (default: random global)
+        
+    Returns:
+        String random dengan panjang size
+    """
+    if size <= 0:
+        return ""
+    rng = rng or random
+    
+    if training_text:
+        symbols = sorted(set(training_text))
+        index = {c: i for i, c in enumerate(symbols)}
+        transitions = [[0.0] * len(symbols) for _ in symbols]
+        for prev, curr in zip(training_text, training_text[1:]):
+            transitions[index[prev]][index[curr]] += 1
+        # Karakter tanpa penerus di training_text: transisi seragam
+        for row in transitions:
+            if not any(row):
+                row[:] = [1.0] * len(symbols)
+    else:
+        symbols = list(alphabet)
+        transitions = [[rng.random() ** 4 for _ in symbols] for _ in symbols]
+    
+    state = rng.randrange(len(symbols))
+    result = []
+    for _ in range(size):
+        state = rng.choices(range(len(symbols)), weights=transitions[state])[0]
+        result.append(symbols[state])
+    
+    return ''.join(result)
+
+
+def generate_periodic_text(size: int, period: int = 8,
+                           alphabet: str = string.ascii_lowercase,
+                           rng: Optional[random.Random] = None) -> str:
+    """
+    Generate text periodik: satu blok random sepanjang period yang diulang.
+    
+    Args:
+        size: Panjang teks yang diinginkan
+        period: Panjang blok yang diulang
+        alphabet: Karakter yang digunakan
+        rng: Generator yang dipakai (default: random global)
+        
+    Returns:
+        String periodik dengan panjang size
+    """
+    if size <= 0:
+        return ""
+    block = generate_random_text(max(1, period), alphabet, rng=rng)
+    return (block * (size // len(block) + 1))[:size]
+
+
+def generate_worst_case(size: int, pattern_length: int,
+                        kind: str = 'kmp') -> tuple:
+    """
+    Generate pasangan (text, pattern) worst case yang dikenal.
+    
+    - 'kmp'/'naive': text a^n dengan pattern a^(m-1)b
+      (setiap window cocok m-1 karakter sebelum gagal)
+    - 'bm': text a^n dengan pattern ba^(m-1)
+      (bad character rule hanya menggeser 1 posisi setiap window)
+    - 'periodic': text a^n dengan pattern a^m (match di setiap posisi)
+    
+    Args:
+        size: Panjang teks
+        pattern_length: Panjang pattern
+        kind: Jenis worst case
+        
+    Returns:
+        Tuple (text, pattern)
+    """
+    text = 'a' * max(0, size)
+    m = max(1, pattern_length)
+    
+    if kind in ('kmp', 'naive'):
+        pattern = 'a' * (m - 1) + 'b'
+    elif kind == 'bm':
+        pattern = 'b' + 'a' * (m - 1)
+    elif kind == 'periodic':
+        pattern = 'a' * m
+    else:
+        raise ValueError(f"Jenis worst case tidak dikenal: {kind!r}")
+    
+    return text, pattern
+
+
+def generate_text(size: int, alphabet: str = 'lowercase',
+                  distribution: str = 'uniform',
+                  rng: Optional[random.Random] = None) -> str:
+    """
+    Generate text berdasarkan nama alfabet dan distribusi.
+    
+    Args:
+        size: Panjang teks yang diinginkan
+        alphabet: Nama pada ALPHABETS atau string karakter langsung
+        distribution: Salah satu dari DISTRIBUTIONS
+        rng: Generator yang dipakai, mis. random.Random(seed) agar
+             hasil dapat direproduksi (default: random global)
+        
+    Returns:
+        String dengan panjang size
+    """
+    chars = ALPHABETS.get(alphabet, alphabet)
+    
+    if distribution == 'uniform':
+        return generate_random_text(size, chars, rng=rng)
+    if distribution == 'zipf':
+        return generate_zipf_text(size, chars, rng=rng)
+    if distribution == 'english':
+        return generate_english_like_text(size, rng=rng)
+    if distribution == 'markov':
+        return generate_markov_text(size, chars, rng=rng)
+    if distribution == 'periodic':
+        return generate_periodic_text(size, alphabet=chars, rng=rng)
+    if distribution == 'worst_case':
+        return generate_worst_case(size, 1)[0]
+    raise ValueError(f"Distribusi tidak dikenal: {distribution!r}")
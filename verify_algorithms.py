@@ -1,5 +1,6 @@
 """Verifikasi konsistensi algoritma Python"""
-from algorithms import kmp_iterative, kmp_recursive, bm_iterative, bm_recursive
+from algorithms import kmp_iterative, kmp_recursive, bm_iterative, bm_recursive, two_way
+from algorithms import rabin_karp
 
 tests = [
     ('ABABDABACDABABCABAB', 'ABABCABAB'),
@@ -16,8 +17,13 @@ for text, pattern in tests:
     kmp_r = kmp_recursive.search(text, pattern)
     bm_i = bm_iterative.search(text, pattern)
     bm_r = bm_recursive.search(text, pattern)
+    bm_g = bm_iterative.search_galil(text, pattern)
+    tw = two_way.search(text, pattern)
+    rk = rabin_karp.search(text, pattern)
+    kmp_t = kmp_recursive.search_trampolined(text, pattern)
+    bm_t = bm_recursive.search_trampolined(text, pattern)
     
-    all_same = kmp_i == kmp_r == bm_i == bm_r
+    all_same = kmp_i == kmp_r == bm_i == bm_r == bm_g == tw == rk == kmp_t == bm_t
     status = 'OK' if all_same else 'MISMATCH!'
     
     print(f'Pattern: "{pattern}"')
@@ -25,6 +31,11 @@ for text, pattern in tests:
     print(f'  KMP Rec:  {kmp_r}')
     print(f'  BM Iter:  {bm_i}')
     print(f'  BM Rec:   {bm_r}')
+    print(f'  BM Galil: {bm_g}')
+    print(f'  Two-Way:  {tw}')
+    print(f'  Rabin-Karp: {rk}')
+    print(f'  KMP Tramp: {kmp_t}')
+    print(f'  BM Tramp:  {bm_t}')
     print(f'  Status:   {status}')
     print()
 
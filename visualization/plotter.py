@@ -4,6 +4,7 @@ Untuk membuat grafik perbandingan performa algoritma
 """
 import matplotlib.pyplot as plt
 from typing import List, Dict
+import math
 import os
 import sys
 
@@ -25,6 +26,14 @@ class Plotter:
             'KMP Recursive': '#27ae60',       # Dark Green
             'Boyer-Moore Iterative': '#3498db',  # Blue
             'Boyer-Moore Recursive': '#2980b9',  # Dark Blue
+            'Boyer-Moore Galil': '#9b59b6',      # Purple
+            'Two-Way': '#8e44ad',                # Dark Purple
+            'Rabin-Karp': '#f39c12',             # Amber
+            'KMP Recursive (Trampoline)': '#16a085',          # Teal
+            'Boyer-Moore Recursive (Trampoline)': '#1f618d',  # Navy
+            'Shift-Or': '#e67e22',               # Orange
+            'BNDM': '#d35400',                   # Dark Orange
+            'NumPy Vectorized': '#e74c3c',       # Red
         }
         
         self.markers = {
@@ -32,15 +41,26 @@ class Plotter:
             'KMP Recursive': 's',
             'Boyer-Moore Iterative': '^',
             'Boyer-Moore Recursive': 'D',
+            'Boyer-Moore Galil': 'v',
+            'Two-Way': '<',
+            'Rabin-Karp': '>',
+            'KMP Recursive (Trampoline)': 'P',
+            'Boyer-Moore Recursive (Trampoline)': 'X',
+            'Shift-Or': 'h',
+            'BNDM': '*',
+            'NumPy Vectorized': 'p',
         }
     
-    def _group_results(self, results: List[BenchmarkResult]) -> Dict[str, Dict[int, float]]:
-        """Group results by algorithm name"""
+    def _group_results(self, results: List[BenchmarkResult],
+                       attribute: str = 'execution_time') -> Dict[str, Dict[int, float]]:
+        """Group results by algorithm name (run yang seluruhnya gagal dilewati)"""
         grouped = {}
         for r in results:
+            if not math.isfinite(r.execution_time):
+                continue
             if r.algorithm_name not in grouped:
                 grouped[r.algorithm_name] = {}
-            grouped[r.algorithm_name][r.input_size] = r.execution_time
+            grouped[r.algorithm_name][r.input_size] = getattr(r, attribute)
         return grouped
     
     def plot_comparison(self, results: List[BenchmarkResult], 
@@ -55,18 +75,20 @@ class Plotter:
             filename: Nama file output
         """
         grouped = self._group_results(results)
+        stddevs = self._group_results(results, 'stddev')
         
         plt.figure(figsize=(12, 8))
         
         for algo_name, data in grouped.items():
             sizes = sorted(data.keys())
             times = [data[s] for s in sizes]
+            errors = [stddevs[algo_name][s] for s in sizes]
             
             color = self.colors.get(algo_name, '#333333')
             marker = self.markers.get(algo_name, 'o')
             
-            plt.plot(sizes, times, marker=marker, label=algo_name, 
-                    color=color, linewidth=2, markersize=8)
+            plt.errorbar(sizes, times, yerr=errors, marker=marker, label=algo_name,
+                         color=color, linewidth=2, markersize=8, capsize=3)
         
         plt.xlabel('Ukuran Input (karakter)', fontsize=12)
         plt.ylabel('Waktu Eksekusi (μs)', fontsize=12)
@@ -104,6 +126,19 @@ class Plotter:
             filename
         )
     
+    def plot_vectorized_comparison(self, results: List[BenchmarkResult],
+                                   filename: str = "vectorized_comparison.png") -> None:
+        """
+        Generate grafik engine NumPy vs engine Python murni (iteratif).
+        """
+        names = {'NumPy Vectorized', 'KMP Iterative', 'Boyer-Moore Iterative', 'BNDM'}
+        vec_results = [r for r in results if r.algorithm_name in names]
+        self.plot_comparison(
+            vec_results,
+            "Perbandingan NumPy Vectorized vs Python Murni",
+            filename
+        )
+    
     def plot_iterative_vs_recursive(self, results: List[BenchmarkResult],
                                      filename: str = "iterative_vs_recursive.png") -> None:
         """
@@ -123,20 +158,22 @@ class Plotter:
                     if size not in iterative_data:
                         iterative_data[size] = []
                     iterative_data[size].append(time)
-            else:
+            elif 'Recursive' in algo_name:
                 for size, time in data.items():
                     if size not in recursive_data:
                         recursive_data[size] = []
                     recursive_data[size].append(time)
         
         # Calculate averages
+        # (ukuran di mana versi rekursif gagal tidak punya data rekursif)
         sizes = sorted(iterative_data.keys())
+        rec_sizes = sorted(recursive_data.keys())
         iter_avg = [sum(iterative_data[s])/len(iterative_data[s]) for s in sizes]
-        rec_avg = [sum(recursive_data[s])/len(recursive_data[s]) for s in sizes]
+        rec_avg = [sum(recursive_data[s])/len(recursive_data[s]) for s in rec_sizes]
         
         plt.plot(sizes, iter_avg, 'o-', label='Rata-rata Iteratif', 
                 color='#2ecc71', linewidth=2, markersize=8)
-        plt.plot(sizes, rec_avg, 's-', label='Rata-rata Rekursif',
+        plt.plot(rec_sizes, rec_avg, 's-', label='Rata-rata Rekursif',
                 color='#e74c3c', linewidth=2, markersize=8)
         
         plt.xlabel('Ukuran Input (karakter)', fontsize=12)
@@ -151,10 +188,137 @@ class Plotter:
         plt.close()
         print(f"Graph saved to {filepath}")
     
+    def plot_comparisons_per_char(self, results: List[BenchmarkResult],
+                                  filename: str = "comparisons_per_char.png") -> None:
+        """
+        Generate grafik perbandingan karakter per karakter text (comparisons / n).
+        
+        KMP dibatasi 2n perbandingan, sedangkan Boyer-Moore idealnya mendekati n/m.
+        """
+        counted = [r for r in results if r.comparisons > 0]
+        grouped = {}
+        for r in counted:
+            grouped.setdefault(r.algorithm_name, {})[r.input_size] = r.comparisons_per_char
+        
+        plt.figure(figsize=(12, 8))
+        
+        for algo_name, data in grouped.items():
+            sizes = sorted(data.keys())
+            color = self.colors.get(algo_name, '#333333')
+            marker = self.markers.get(algo_name, 'o')
+            plt.plot(sizes, [data[s] for s in sizes], marker=marker, label=algo_name,
+                     color=color, linewidth=2, markersize=8)
+        
+        plt.axhline(2.0, color='#7f8c8d', linestyle='--', label='Batas KMP (2n)')
+        plt.xlabel('Ukuran Input (karakter)', fontsize=12)
+        plt.ylabel('Perbandingan / n', fontsize=12)
+        plt.title('Perbandingan Karakter per Karakter Text', fontsize=14, fontweight='bold')
+        plt.legend(loc='upper right', fontsize=10)
+        plt.grid(True, alpha=0.3)
+        plt.tight_layout()
+        
+        filepath = os.path.join(self.output_dir, filename)
+        plt.savefig(filepath, dpi=150, bbox_inches='tight')
+        plt.close()
+        print(f"Graph saved to {filepath}")
+    
+    def plot_memory(self, results: List[BenchmarkResult],
+                    filename: str = "memory_usage.png") -> None:
+        """
+        Generate grafik memori puncak (tracemalloc) dan kedalaman rekursi
+        dari benchmark mode isolasi.
+        
+        Args:
+            results: List BenchmarkResult dari run_isolated
+            filename: Nama file output
+        """
+        profiled = [r for r in results if r.max_recursion_depth > 0]
+        peaks = {}
+        depths = {}
+        for r in profiled:
+            peaks.setdefault(r.algorithm_name, {})[r.input_size] = r.peak_memory_bytes / 1024
+            depths.setdefault(r.algorithm_name, {})[r.input_size] = r.max_recursion_depth
+        
+        fig, (ax_mem, ax_depth) = plt.subplots(1, 2, figsize=(16, 7))
+        
+        for algo_name in peaks:
+            sizes = sorted(peaks[algo_name].keys())
+            color = self.colors.get(algo_name, '#333333')
+            marker = self.markers.get(algo_name, 'o')
+            ax_mem.plot(sizes, [peaks[algo_name][s] for s in sizes], marker=marker,
+                        label=algo_name, color=color, linewidth=2, markersize=8)
+            ax_depth.plot(sizes, [depths[algo_name][s] for s in sizes], marker=marker,
+                          label=algo_name, color=color, linewidth=2, markersize=8)
+        
+        ax_mem.set_xlabel('Ukuran Input (karakter)', fontsize=12)
+        ax_mem.set_ylabel('Memori Puncak (KB)', fontsize=12)
+        ax_mem.set_title('Memori Puncak (tracemalloc)', fontsize=14, fontweight='bold')
+        ax_mem.legend(loc='upper left', fontsize=10)
+        ax_mem.grid(True, alpha=0.3)
+        
+        ax_depth.set_xlabel('Ukuran Input (karakter)', fontsize=12)
+        ax_depth.set_ylabel('Kedalaman Frame Maksimum', fontsize=12)
+        ax_depth.set_title('Kedalaman Rekursi Maksimum', fontsize=14, fontweight='bold')
+        ax_depth.legend(loc='upper left', fontsize=10)
+        ax_depth.grid(True, alpha=0.3)
+        
+        fig.tight_layout()
+        
+        filepath = os.path.join(self.output_dir, filename)
+        fig.savefig(filepath, dpi=150, bbox_inches='tight')
+        plt.close(fig)
+        print(f"Graph saved to {filepath}")
+    
+    def plot_percentiles(self, results: List[BenchmarkResult],
+                         filename: str = "percentiles.png") -> None:
+        """
+        Generate grafik median per algoritma dengan pita min-p95.
+        
+        Args:
+            results: List BenchmarkResult
+            filename: Nama file output
+        """
+        medians = self._group_results(results, 'median_time')
+        minimums = self._group_results(results, 'min_time')
+        p95s = self._group_results(results, 'p95_time')
+        
+        plt.figure(figsize=(12, 8))
+        
+        for algo_name, data in medians.items():
+            sizes = sorted(data.keys())
+            color = self.colors.get(algo_name, '#333333')
+            marker = self.markers.get(algo_name, 'o')
+            
+            plt.plot(sizes, [data[s] for s in sizes], marker=marker,
+                     label=algo_name, color=color, linewidth=2, markersize=8)
+            plt.fill_between(sizes,
+                             [minimums[algo_name][s] for s in sizes],
+                             [p95s[algo_name][s] for s in sizes],
+                             color=color, alpha=0.15)
+        
+        plt.xlabel('Ukuran Input (karakter)', fontsize=12)
+        plt.ylabel('Waktu Eksekusi Median (μs)', fontsize=12)
+        plt.title('Median Waktu Eksekusi (pita: min - p95)', fontsize=14, fontweight='bold')
+        plt.legend(loc='upper left', fontsize=10)
+        plt.grid(True, alpha=0.3)
+        plt.tight_layout()
+        
+        filepath = os.path.join(self.output_dir, filename)
+        plt.savefig(filepath, dpi=150, bbox_inches='tight')
+        plt.close()
+        print(f"Graph saved to {filepath}")
+    
     def plot_all(self, results: List[BenchmarkResult]) -> None:
         """Generate semua grafik sekaligus."""
         self.plot_comparison(results)
         self.plot_kmp_comparison(results)
         self.plot_bm_comparison(results)
         self.plot_iterative_vs_recursive(results)
+        self.plot_percentiles(results)
+        if any(r.comparisons > 0 for r in results):
+            self.plot_comparisons_per_char(results)
+        if any(r.max_recursion_depth > 0 for r in results):
+            self.plot_memory(results)
+        if any(r.algorithm_name == 'NumPy Vectorized' for r in results):
+            self.plot_vectorized_comparison(results)
         print("All graphs generated successfully!")